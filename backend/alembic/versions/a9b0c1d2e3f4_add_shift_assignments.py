@@ -0,0 +1,64 @@
+"""add shift assignments fact table
+
+Revision ID: a9b0c1d2e3f4
+Revises: z8a9b0c1d2e3
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9b0c1d2e3f4"
+down_revision: Union[str, Sequence[str], None] = "z8a9b0c1d2e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing finalized schedules are loaded with backfill_shift_assignments.py.
+    op.create_table(
+        "shift_assignments",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("nurse_id", sa.UUID(), nullable=True),
+        sa.Column("nurse_name", sa.String(), nullable=False),
+        sa.Column("date", sa.String(length=10), nullable=False),
+        sa.Column("shift_code", sa.String(length=20), nullable=True),
+        sa.Column("shift_code_id", sa.String(), nullable=True),
+        sa.Column("shift_type", sa.String(length=20), nullable=True),
+        sa.Column("start_time", sa.String(length=10), nullable=True),
+        sa.Column("end_time", sa.String(length=10), nullable=True),
+        sa.Column("paid_hours", sa.Float(), nullable=False),
+        sa.Column("schedule_id", sa.UUID(), nullable=False),
+        sa.Column("family_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["nurse_id"], ["nurses.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["shift_code_id"], ["shift_codes.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["schedule_id"], ["optimized_schedules.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_shift_assignments_org_nurse_date",
+        "shift_assignments",
+        ["organization_id", "nurse_id", "date"],
+    )
+    op.create_index(
+        "ix_shift_assignments_org_date",
+        "shift_assignments",
+        ["organization_id", "date"],
+    )
+    op.create_index("ix_shift_assignments_schedule_id", "shift_assignments", ["schedule_id"])
+    op.create_index("ix_shift_assignments_family_id", "shift_assignments", ["family_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shift_assignments_family_id", table_name="shift_assignments")
+    op.drop_index("ix_shift_assignments_schedule_id", table_name="shift_assignments")
+    op.drop_index("ix_shift_assignments_org_date", table_name="shift_assignments")
+    op.drop_index("ix_shift_assignments_org_nurse_date", table_name="shift_assignments")
+    op.drop_table("shift_assignments")
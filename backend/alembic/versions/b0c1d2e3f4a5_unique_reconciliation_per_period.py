@@ -0,0 +1,48 @@
+"""unique reconciliation row per nurse and period
+
+Revision ID: b0c1d2e3f4a5
+Revises: a9b0c1d2e3f4
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b0c1d2e3f4a5"
+down_revision: Union[str, Sequence[str], None] = "a9b0c1d2e3f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the most recently updated row of any duplicated nurse/period pair.
+    op.execute(
+        """
+        DELETE FROM nurse_hours_reconciliation r
+        USING (
+            SELECT id, row_number() OVER (
+                PARTITION BY nurse_id, period_start_date
+                ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST
+            ) AS rn
+            FROM nurse_hours_reconciliation
+        ) ranked
+        WHERE r.id = ranked.id AND ranked.rn > 1
+        """
+    )
+    op.create_unique_constraint(
+        "uq_nurse_hours_reconciliation_nurse_period",
+        "nurse_hours_reconciliation",
+        ["nurse_id", "period_start_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_nurse_hours_reconciliation_nurse_period",
+        "nurse_hours_reconciliation",
+        type_="unique",
+    )
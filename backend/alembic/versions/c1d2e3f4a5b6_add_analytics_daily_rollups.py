@@ -0,0 +1,109 @@
+"""add analytics daily rollups
+
+Revision ID: c1d2e3f4a5b6
+Revises: b0c1d2e3f4a5
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1d2e3f4a5b6"
+down_revision: Union[str, Sequence[str], None] = "b0c1d2e3f4a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduling_metrics_daily",
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("schedules_count", sa.Integer(), nullable=False),
+        sa.Column("time_saved_seconds_sum", sa.Float(), nullable=False),
+        sa.Column("time_saved_percentage_sum", sa.Float(), nullable=False),
+        sa.Column("coverage_percentage_sum", sa.Float(), nullable=False),
+        sa.Column("conflicts_resolved_sum", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("organization_id", "day"),
+    )
+    op.create_table(
+        "handover_metrics_daily",
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("start_day", sa.Date(), nullable=False),
+        sa.Column("end_day", sa.Date(), nullable=False),
+        sa.Column("periods_count", sa.Integer(), nullable=False),
+        sa.Column("handovers_created_sum", sa.Integer(), nullable=False),
+        sa.Column("handovers_completed_sum", sa.Integer(), nullable=False),
+        sa.Column("completion_rate_sum", sa.Float(), nullable=False),
+        sa.Column("completion_time_seconds_sum", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("organization_id", "start_day", "end_day"),
+    )
+
+    # The raw metrics tables predate migrations in some environments.
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("scheduling_metrics"):
+        op.create_index(
+            "ix_scheduling_metrics_org_created",
+            "scheduling_metrics",
+            ["organization_id", "created_at"],
+        )
+        op.execute(
+            """
+            INSERT INTO scheduling_metrics_daily (
+                organization_id, day, schedules_count, time_saved_seconds_sum,
+                time_saved_percentage_sum, coverage_percentage_sum,
+                conflicts_resolved_sum, updated_at
+            )
+            SELECT organization_id, created_at::date, count(*),
+                   coalesce(sum(coalesce(time_saved_seconds, 0)), 0),
+                   coalesce(sum(coalesce(time_saved_percentage, 0)), 0),
+                   coalesce(sum(coalesce(coverage_percentage, 0)), 0),
+                   coalesce(sum(coalesce(conflicts_resolved, 0)), 0),
+                   now()
+            FROM scheduling_metrics
+            WHERE created_at IS NOT NULL
+            GROUP BY organization_id, created_at::date
+            """
+        )
+    if inspector.has_table("handover_metrics"):
+        op.create_index(
+            "ix_handover_metrics_org_period",
+            "handover_metrics",
+            ["organization_id", "period_start", "period_end"],
+        )
+        op.execute(
+            """
+            INSERT INTO handover_metrics_daily (
+                organization_id, start_day, end_day, periods_count,
+                handovers_created_sum, handovers_completed_sum,
+                completion_rate_sum, completion_time_seconds_sum, updated_at
+            )
+            SELECT organization_id, period_start::date, period_end::date, count(*),
+                   coalesce(sum(coalesce(handovers_created, 0)), 0),
+                   coalesce(sum(coalesce(handovers_completed, 0)), 0),
+                   coalesce(sum(coalesce(completion_rate, 0)), 0),
+                   coalesce(sum(coalesce(avg_completion_time_seconds, 0)), 0),
+                   now()
+            FROM handover_metrics
+            GROUP BY organization_id, period_start::date, period_end::date
+            """
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("handover_metrics"):
+        op.drop_index("ix_handover_metrics_org_period", table_name="handover_metrics")
+    if inspector.has_table("scheduling_metrics"):
+        op.drop_index("ix_scheduling_metrics_org_created", table_name="scheduling_metrics")
+    op.drop_table("handover_metrics_daily")
+    op.drop_table("scheduling_metrics_daily")
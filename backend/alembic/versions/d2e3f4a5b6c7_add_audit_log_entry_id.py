@@ -0,0 +1,29 @@
+"""add audit_log entry_id for write-ahead log dedup
+
+Revision ID: d2e3f4a5b6c7
+Revises: c1d2e3f4a5b6
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e3f4a5b6c7"
+down_revision: Union[str, Sequence[str], None] = "c1d2e3f4a5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("audit_log", sa.Column("entry_id", sa.String(36), nullable=True))
+    op.create_unique_constraint("audit_log_entry_id_key", "audit_log", ["entry_id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("audit_log_entry_id_key", "audit_log", type_="unique")
+    op.drop_column("audit_log", "entry_id")
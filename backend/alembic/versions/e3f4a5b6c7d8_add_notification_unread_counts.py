@@ -0,0 +1,40 @@
+"""add notification_unread_counts
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f4a5b6c7d8"
+down_revision: Union[str, Sequence[str], None] = "d2e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_unread_counts",
+        sa.Column("user_id", sa.String(), primary_key=True),
+        sa.Column("unread", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        INSERT INTO notification_unread_counts (user_id, unread)
+        SELECT user_id, count(*)
+        FROM notifications
+        WHERE NOT is_read
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_unread_counts")
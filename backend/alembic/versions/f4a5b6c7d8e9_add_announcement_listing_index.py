@@ -0,0 +1,47 @@
+"""add announcement listing index and backfill author names
+
+Revision ID: f4a5b6c7d8e9
+Revises: e3f4a5b6c7d8
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a5b6c7d8e9"
+down_revision: Union[str, Sequence[str], None] = "e3f4a5b6c7d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_announcements_org_pinned_created",
+        "announcements",
+        ["organization_id", "is_pinned", "created_at"],
+    )
+    # Older rows stored no author name (or the raw user id); resolve them
+    # once here so listings rarely need the member fallback.
+    op.execute(
+        """
+        UPDATE announcements a
+        SET created_by_name = m.name
+        FROM (
+            SELECT organization_id, user_id,
+                   coalesce(nullif(user_name, ''), nullif(user_email, '')) AS name
+            FROM organization_members
+        ) m
+        WHERE m.organization_id = a.organization_id
+          AND m.user_id = a.created_by
+          AND m.name IS NOT NULL
+          AND (a.created_by_name IS NULL OR a.created_by_name = a.created_by)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_announcements_org_pinned_created", table_name="announcements")
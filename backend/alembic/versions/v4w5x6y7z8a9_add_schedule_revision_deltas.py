@@ -0,0 +1,71 @@
+"""add delta storage columns to optimized schedules
+
+Revision ID: v4w5x6y7z8a9
+Revises: u3v4w5x6y7z8
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "v4w5x6y7z8a9"
+down_revision: Union[str, Sequence[str], None] = "u3v4w5x6y7z8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "optimized_schedules",
+        sa.Column("delta_base_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "optimized_schedules",
+        sa.Column("delta", sa.JSON(), nullable=True),
+    )
+    op.add_column(
+        "optimized_schedules",
+        sa.Column("delta_depth", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_foreign_key(
+        "fk_optimized_schedules_delta_base_id",
+        "optimized_schedules",
+        "optimized_schedules",
+        ["delta_base_id"],
+        ["id"],
+    )
+    op.create_index(
+        "ix_optimized_schedules_delta_base_id",
+        "optimized_schedules",
+        ["delta_base_id"],
+    )
+
+
+def downgrade() -> None:
+    # Materialization happens in application code, so refuse to drop deltas
+    # that would leave rows without a payload.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM optimized_schedules WHERE result IS NULL AND delta IS NOT NULL) THEN
+                RAISE EXCEPTION 'Materialize delta-stored schedules before downgrading';
+            END IF;
+        END $$;
+        """
+    )
+    op.drop_index("ix_optimized_schedules_delta_base_id", table_name="optimized_schedules")
+    op.drop_constraint(
+        "fk_optimized_schedules_delta_base_id",
+        "optimized_schedules",
+        type_="foreignkey",
+    )
+    op.drop_column("optimized_schedules", "delta_depth")
+    op.drop_column("optimized_schedules", "delta")
+    op.drop_column("optimized_schedules", "delta_base_id")
@@ -0,0 +1,30 @@
+"""add version counter to optimized schedules
+
+Revision ID: w5x6y7z8a9b0
+Revises: v4w5x6y7z8a9
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "w5x6y7z8a9b0"
+down_revision: Union[str, Sequence[str], None] = "v4w5x6y7z8a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "optimized_schedules",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("optimized_schedules", "version")
@@ -0,0 +1,81 @@
+"""add summary columns and keyset index to optimized schedules
+
+Revision ID: x6y7z8a9b0c1
+Revises: w5x6y7z8a9b0
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "x6y7z8a9b0c1"
+down_revision: Union[str, Sequence[str], None] = "w5x6y7z8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "optimized_schedules",
+        sa.Column("family_root_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column("optimized_schedules", sa.Column("period_start", sa.String(), nullable=True))
+    op.add_column("optimized_schedules", sa.Column("period_end", sa.String(), nullable=True))
+    op.add_column("optimized_schedules", sa.Column("created_by", sa.String(), nullable=True))
+    op.add_column("optimized_schedules", sa.Column("created_by_name", sa.String(), nullable=True))
+    op.create_index(
+        "ix_optimized_schedules_family_root_id",
+        "optimized_schedules",
+        ["family_root_id"],
+    )
+    op.create_index(
+        "ix_optimized_schedules_org_created",
+        "optimized_schedules",
+        ["organization_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+    # Best-effort period backfill for the common payload shapes so date-range
+    # filters see existing rows. family_root_id stays NULL until
+    # backfill_schedule_summaries.py stamps it (and the actor columns).
+    op.execute(
+        """
+        UPDATE optimized_schedules
+        SET period_start = COALESCE(
+                result->>'start_date',
+                result->'dateRange'->>'start',
+                result->'schedule_data'->>'start_date',
+                result->'schedule_data'->'dateRange'->>'start',
+                result->'schedule_data'->'dates'->>0,
+                result->'dates'->>0
+            ),
+            period_end = COALESCE(
+                result->>'end_date',
+                result->'dateRange'->>'end',
+                result->'schedule_data'->>'end_date',
+                result->'schedule_data'->'dateRange'->>'end',
+                CASE WHEN json_typeof(result->'schedule_data'->'dates') = 'array'
+                    THEN result->'schedule_data'->'dates'->>(json_array_length(result->'schedule_data'->'dates') - 1)
+                END,
+                CASE WHEN json_typeof(result->'dates') = 'array'
+                    THEN result->'dates'->>(json_array_length(result->'dates') - 1)
+                END
+            )
+        WHERE result IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_optimized_schedules_org_created", table_name="optimized_schedules")
+    op.drop_index("ix_optimized_schedules_family_root_id", table_name="optimized_schedules")
+    op.drop_column("optimized_schedules", "created_by_name")
+    op.drop_column("optimized_schedules", "created_by")
+    op.drop_column("optimized_schedules", "period_end")
+    op.drop_column("optimized_schedules", "period_start")
+    op.drop_column("optimized_schedules", "family_root_id")
@@ -0,0 +1,31 @@
+"""add handover listing index
+
+Revision ID: y7z8a9b0c1d2
+Revises: x6y7z8a9b0c1
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "y7z8a9b0c1d2"
+down_revision: Union[str, Sequence[str], None] = "x6y7z8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_handovers_org_shift_date_updated",
+        "handovers",
+        ["organization_id", "shift_date", sa.text("updated_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_handovers_org_shift_date_updated", table_name="handovers")
@@ -0,0 +1,75 @@
+"""add burnout current risk table
+
+Revision ID: z8a9b0c1d2e3
+Revises: y7z8a9b0c1d2
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "z8a9b0c1d2e3"
+down_revision: Union[str, Sequence[str], None] = "y7z8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "burnout_current_risk",
+        sa.Column("nurse_id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("snapshot_id", sa.UUID(), nullable=False),
+        sa.Column("overall_risk_score", sa.Float(), nullable=False),
+        sa.Column("risk_level", sa.String(), nullable=False),
+        sa.Column("overtime_score", sa.Float(), nullable=True),
+        sa.Column("schedule_density_score", sa.Float(), nullable=True),
+        sa.Column("night_shift_load_score", sa.Float(), nullable=True),
+        sa.Column("weekend_load_score", sa.Float(), nullable=True),
+        sa.Column("short_rest_score", sa.Float(), nullable=True),
+        sa.Column("pattern_disruption_score", sa.Float(), nullable=True),
+        sa.Column("tenure_risk_score", sa.Float(), nullable=True),
+        sa.Column("trend", sa.String(), nullable=True),
+        sa.Column("snapshot_date", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("nurse_id"),
+    )
+    op.create_index(
+        "ix_burnout_current_risk_organization_id",
+        "burnout_current_risk",
+        ["organization_id"],
+    )
+    # History view: one nurse's snapshots, newest first.
+    op.create_index(
+        "ix_burnout_snapshots_nurse_date",
+        "burnout_snapshots",
+        ["nurse_id", sa.text("snapshot_date DESC")],
+    )
+
+    op.execute(
+        """
+        INSERT INTO burnout_current_risk (
+            nurse_id, organization_id, snapshot_id, overall_risk_score, risk_level,
+            overtime_score, schedule_density_score, night_shift_load_score,
+            weekend_load_score, short_rest_score, pattern_disruption_score,
+            tenure_risk_score, trend, snapshot_date
+        )
+        SELECT DISTINCT ON (nurse_id)
+            nurse_id, organization_id, id, overall_risk_score, risk_level,
+            overtime_score, schedule_density_score, night_shift_load_score,
+            weekend_load_score, short_rest_score, pattern_disruption_score,
+            tenure_risk_score, trend, snapshot_date
+        FROM burnout_snapshots
+        ORDER BY nurse_id, snapshot_date DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_burnout_snapshots_nurse_date", table_name="burnout_snapshots")
+    op.drop_index("ix_burnout_current_risk_organization_id", table_name="burnout_current_risk")
+    op.drop_table("burnout_current_risk")
@@ -12,7 +12,7 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.db.deps import get_db
-from app.services.analytics_service import AnalyticsService
+from app.services.analytics_service import AnalyticsService, event_buffer
 from app.core.auth import RequiredAuth, AdminAuth
 
 
@@ -74,7 +74,18 @@ class AnalyticsSummary(BaseModel):
 
 # ========== Event Tracking ==========
 
-@router.post("/events", status_code=201)
+def _queued(event_id: Optional[UUID]) -> Dict[str, str]:
+    if event_id is None:
+        # Buffer full: shed load and ask the client to back off.
+        raise HTTPException(
+            status_code=503,
+            detail="Analytics ingestion is busy, retry later",
+            headers={"Retry-After": "1"}
+        )
+    return {"id": str(event_id), "status": "queued"}
+
+
+@router.post("/events", status_code=202)
 async def track_event(
     event: AnalyticsEventCreate,
     auth: RequiredAuth,
@@ -82,10 +93,12 @@ async def track_event(
 ):
     """
     Track an analytics event.
+    
+    The event is buffered and written in a batch shortly after.
     """
     service = AnalyticsService(db)
     
-    result = service.track_event(
+    event_id = service.enqueue_event(
         event_type=event.event_type,
         event_name=event.event_name,
         event_category=event.event_category,
@@ -95,10 +108,10 @@ async def track_event(
         user_id=auth.user_id
     )
     
-    return {"id": str(result.id), "status": "tracked"}
+    return _queued(event_id)
 
 
-@router.post("/page-view", status_code=201)
+@router.post("/page-view", status_code=202)
 async def track_page_view(
     page_name: str,
     auth: RequiredAuth,
@@ -107,17 +120,29 @@ async def track_page_view(
 ):
     """
     Track a page view event.
+    
+    The event is buffered and written in a batch shortly after.
     """
     service = AnalyticsService(db)
     
-    result = service.track_page_view(
+    event_id = service.enqueue_page_view(
         page_name=page_name,
         organization_id=UUID(auth.organization_id) if auth.organization_id else None,
         user_id=auth.user_id,
         properties=properties
     )
     
-    return {"id": str(result.id), "status": "tracked"}
+    return _queued(event_id)
+
+
+@router.get("/ingestion-stats")
+async def get_ingestion_stats(auth: AdminAuth):
+    """
+    Event buffer counters for this worker (enqueued, written, dropped,
+    failed, batches, queued).
+    Admin only.
+    """
+    return event_buffer.stats()
 
 
 # ========== Scheduling Metrics ==========
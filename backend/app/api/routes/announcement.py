@@ -1,17 +1,21 @@
 """Announcement routes: manager-authored org/team broadcasts."""
+import base64
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import or_, tuple_
 from sqlalchemy.orm import Session
 
 from app.db.deps import get_db
 from app.models.announcement import Announcement
 from app.models.nurse import Nurse
 from app.models.organization import OrganizationMember
+from app.core.event_bus import publish_event
+from app.services.notifications import fan_out_notifications
+from app.services.viewer_team import viewer_team
 from app.schemas.announcement import (
     AnnouncementCreate,
     AnnouncementUpdate,
@@ -66,17 +70,57 @@ def _resolve_author_display_name(
     return user_id or current_name
 
 
-def _viewer_team(db: Session, auth: AuthContext) -> Optional[str]:
-    """Resolve the requesting user's team from their nurse profile, if any."""
-    nurse = (
-        db.query(Nurse)
-        .filter(
-            Nurse.organization_id == auth.organization_id,
-            Nurse.user_id == auth.user_id,
-        )
-        .first()
-    )
-    return nurse.team if nurse else None
+def _resolve_author_display_names(
+    db: Session,
+    organization_id: str,
+    announcements: List[Announcement],
+) -> Dict[str, str]:
+    """Batch form of ``_resolve_author_display_name`` for a page of rows.
+
+    One nurse query and at most one member query, however many authors.
+    """
+    user_ids = {a.created_by for a in announcements if a.created_by}
+    if not user_ids:
+        return {}
+    names: Dict[str, str] = {}
+    for user_id, name in (
+        db.query(Nurse.user_id, Nurse.name)
+        .filter(Nurse.organization_id == organization_id, Nurse.user_id.in_(user_ids))
+    ):
+        if name:
+            names.setdefault(user_id, name)
+
+    # Stored names are kept unless missing or just the raw user id.
+    unresolved = {
+        a.created_by for a in announcements
+        if a.created_by and a.created_by not in names
+        and (not a.created_by_name or a.created_by_name == a.created_by)
+    }
+    if unresolved:
+        for user_id, user_name, user_email in (
+            db.query(OrganizationMember.user_id, OrganizationMember.user_name, OrganizationMember.user_email)
+            .filter(
+                OrganizationMember.organization_id == organization_id,
+                OrganizationMember.user_id.in_(unresolved),
+            )
+        ):
+            if user_name or user_email:
+                names.setdefault(user_id, user_name or user_email)
+    return names
+
+
+def _encode_announcement_cursor(announcement: Announcement) -> str:
+    raw = f"{int(announcement.is_pinned)}|{announcement.created_at.isoformat()}|{announcement.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_announcement_cursor(cursor: str) -> Tuple[bool, datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        pinned, created_at, announcement_id = base64.urlsafe_b64decode(padded).decode().split("|", 2)
+        return pinned == "1", datetime.fromisoformat(created_at), UUID(announcement_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.post("", response_model=AnnouncementResponse, status_code=201, include_in_schema=False)
@@ -106,11 +150,34 @@ def create_announcement(
         created_by_name=author_name,
     )
     db.add(announcement)
+    notified = fan_out_notifications(
+        db,
+        organization_id=auth.organization_id,
+        team=announcement.target_team,
+        exclude_user_ids=[auth.user_id],
+        type="announcement",
+        title=f"New announcement: {announcement.title}",
+        body=(announcement.body or "")[:500] or None,
+        link="/announcements",
+    )
+    db.flush()
+    publish_event(
+        db,
+        "announcement",
+        {
+            "id": str(announcement.id),
+            "title": announcement.title,
+            "is_pinned": announcement.is_pinned,
+            "created_at": announcement.created_at,
+        },
+        organization_id=auth.organization_id,
+        team=announcement.target_team,
+    )
     db.commit()
     db.refresh(announcement)
 
     logger.info(
-        f"Announcement '{announcement.title}' created in org {auth.organization_id} by {auth.user_id}"
+        f"Announcement '{announcement.title}' ({notified} notified) created in org {auth.organization_id} by {auth.user_id}"
     )
     return announcement
 
@@ -118,15 +185,19 @@ def create_announcement(
 @router.get("", response_model=List[AnnouncementResponse], include_in_schema=False)
 @router.get("/", response_model=List[AnnouncementResponse])
 def list_announcements(
+    response: Response,
     include_expired: bool = Query(False),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     auth: AuthContext = Depends(get_org_required_auth),
     db: Session = Depends(get_db),
 ):
     """
-    List announcements visible to the caller.
+    List announcements visible to the caller, pinned first, then newest.
 
     Members only see org-wide announcements plus those targeted at their team.
-    Managers see everything in the organization.
+    Managers see everything in the organization. When more rows remain, the
+    response carries an ``X-Next-Cursor`` header to pass back as ``cursor``.
     """
     query = db.query(Announcement).filter(
         Announcement.organization_id == auth.organization_id
@@ -139,7 +210,7 @@ def list_announcements(
         )
 
     if not auth.has_permission("manage_announcements"):
-        team = _viewer_team(db, auth)
+        team = viewer_team(db, auth.organization_id, auth.user_id)
         if team:
             query = query.filter(
                 or_(Announcement.target_team.is_(None), Announcement.target_team == team)
@@ -153,18 +224,32 @@ def list_announcements(
                 auth.organization_id,
             )
 
-    announcements = query.all()
-
-    for announcement in announcements:
-        announcement.created_by_name = _resolve_author_display_name(
-            db,
-            auth.organization_id,
-            announcement.created_by,
-            announcement.created_by_name,
+    # Served by ix_announcements_org_pinned_created: pinned first, then newest.
+    if cursor:
+        query = query.filter(
+            tuple_(Announcement.is_pinned, Announcement.created_at, Announcement.id)
+            < tuple_(*_decode_announcement_cursor(cursor))
         )
+    announcements = (
+        query.order_by(
+            Announcement.is_pinned.desc(),
+            Announcement.created_at.desc(),
+            Announcement.id.desc(),
+        )
+        .limit(limit + 1)
+        .all()
+    )
+    if len(announcements) > limit:
+        announcements = announcements[:limit]
+        response.headers["X-Next-Cursor"] = _encode_announcement_cursor(announcements[-1])
 
-    # Pinned first, then newest first.
-    announcements.sort(key=lambda a: (not a.is_pinned, -a.created_at.timestamp()))
+    names = _resolve_author_display_names(db, auth.organization_id, announcements)
+    for announcement in announcements:
+        name = names.get(announcement.created_by)
+        if name:
+            announcement.created_by_name = name
+        elif not announcement.created_by_name:
+            announcement.created_by_name = announcement.created_by
     return announcements
 
 
@@ -4,15 +4,15 @@ Burnout & Retention Prediction API Routes
 Endpoints for viewing burnout risk dashboards, nurse detail,
 running assessments, managing alerts, and configuring thresholds.
 """
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, literal_column, select
 
 from app.db.deps import get_db
-from app.models.burnout import BurnoutSnapshot, BurnoutAlert, BurnoutConfig
+from app.models.burnout import BurnoutSnapshot, BurnoutCurrentRisk, BurnoutAlert, BurnoutConfig
 from app.models.nurse import Nurse
 from app.schemas.burnout import (
     BurnoutSnapshotResponse,
@@ -25,8 +25,10 @@ from app.schemas.burnout import (
     BurnoutConfigUpdate,
     BurnoutConfigResponse,
 )
-from app.services.burnout_service import run_burnout_assessment, _get_config
+from app.services.burnout_metrics import build_org_burnout_metrics
+from app.services.burnout_service import run_burnout_assessments, _get_config
 from app.core.auth import RequiredAuth, BurnoutViewAuth as ManagerAuth
+from app.core.responses import model_response
 
 router = APIRouter()
 
@@ -41,91 +43,61 @@ def burnout_dashboard(
     """Manager dashboard showing risk distribution and active alerts."""
     org_id = auth.organization_id or auth.user_id
 
-    # Get latest snapshot per nurse (subquery for max date per nurse)
-    latest_sub = (
-        db.query(
-            BurnoutSnapshot.nurse_id,
-            func.max(BurnoutSnapshot.snapshot_date).label("max_date"),
-        )
-        .filter(BurnoutSnapshot.organization_id == org_id)
-        .group_by(BurnoutSnapshot.nurse_id)
-        .subquery()
-    )
-
-    latest_snapshots: List[BurnoutSnapshot] = (
-        db.query(BurnoutSnapshot)
-        .join(
-            latest_sub,
-            (BurnoutSnapshot.nurse_id == latest_sub.c.nurse_id)
-            & (BurnoutSnapshot.snapshot_date == latest_sub.c.max_date),
-        )
-        .filter(BurnoutSnapshot.organization_id == org_id)
+    # One row per nurse, maintained by every assessment.
+    current_rows = (
+        db.query(BurnoutCurrentRisk, Nurse.name)
+        .outerjoin(Nurse, Nurse.id == BurnoutCurrentRisk.nurse_id)
+        .filter(BurnoutCurrentRisk.organization_id == org_id)
+        .order_by(BurnoutCurrentRisk.overall_risk_score.desc())
         .all()
     )
 
-    # Compute distribution
     dist = {"low": 0, "moderate": 0, "high": 0, "critical": 0}
     trend_summary = {"improving": 0, "stable": 0, "worsening": 0}
-    for snap in latest_snapshots:
-        dist[snap.risk_level] = dist.get(snap.risk_level, 0) + 1
-        if snap.trend:
-            trend_summary[snap.trend] = trend_summary.get(snap.trend, 0) + 1
-
-    # Build nurse name lookup
-    nurse_ids = [s.nurse_id for s in latest_snapshots]
-    nurses_by_id: Dict[Any, str] = {
-        n.id: n.name
-        for n in db.query(Nurse).filter(Nurse.id.in_(nurse_ids)).all()
-    }
-
-    # Top risks (high + critical sorted by score desc)
     risk_buckets: Dict[str, List[BurnoutRiskBucketItem]] = {
         "low": [],
         "moderate": [],
         "high": [],
         "critical": [],
     }
+    top_risks: List[BurnoutTopRiskItem] = []
 
-    for s in sorted(
-        latest_snapshots,
-        key=lambda snap: snap.overall_risk_score,
-        reverse=True,
-    ):
-        bucket = s.risk_level if s.risk_level in risk_buckets else "low"
+    # Rows arrive sorted by score desc, so buckets and top risks stay ordered.
+    for current, nurse_name in current_rows:
+        dist[current.risk_level] = dist.get(current.risk_level, 0) + 1
+        if current.trend:
+            trend_summary[current.trend] = trend_summary.get(current.trend, 0) + 1
+
+        name = nurse_name or "Unknown Nurse"
+        bucket = current.risk_level if current.risk_level in risk_buckets else "low"
         risk_buckets[bucket].append(
             BurnoutRiskBucketItem(
-                nurse_id=s.nurse_id,
-                nurse_name=nurses_by_id.get(s.nurse_id, "Unknown Nurse"),
-                overall_risk_score=s.overall_risk_score,
-                risk_level=s.risk_level,
+                nurse_id=current.nurse_id,
+                nurse_name=name,
+                overall_risk_score=current.overall_risk_score,
+                risk_level=current.risk_level,
             )
         )
 
-    # Top risks (high + critical sorted by score desc)
-    top_risk_snaps = sorted(
-        [s for s in latest_snapshots if s.risk_level in ("high", "critical")],
-        key=lambda s: s.overall_risk_score,
-        reverse=True,
-    )[:10]
-    top_risks = [
-        BurnoutTopRiskItem(
-            id=s.id,
-            nurse_id=s.nurse_id,
-            nurse_name=nurses_by_id.get(s.nurse_id, "Unknown Nurse"),
-            overall_risk_score=s.overall_risk_score,
-            risk_level=s.risk_level,
-            overtime_score=s.overtime_score,
-            schedule_density_score=s.schedule_density_score,
-            night_shift_load_score=s.night_shift_load_score,
-            weekend_load_score=s.weekend_load_score,
-            short_rest_score=s.short_rest_score,
-            pattern_disruption_score=s.pattern_disruption_score,
-            tenure_risk_score=s.tenure_risk_score,
-            trend=s.trend,
-            snapshot_date=s.snapshot_date,
-        )
-        for s in top_risk_snaps
-    ]
+        if current.risk_level in ("high", "critical") and len(top_risks) < 10:
+            top_risks.append(
+                BurnoutTopRiskItem(
+                    id=current.snapshot_id,
+                    nurse_id=current.nurse_id,
+                    nurse_name=name,
+                    overall_risk_score=current.overall_risk_score,
+                    risk_level=current.risk_level,
+                    overtime_score=current.overtime_score,
+                    schedule_density_score=current.schedule_density_score,
+                    night_shift_load_score=current.night_shift_load_score,
+                    weekend_load_score=current.weekend_load_score,
+                    short_rest_score=current.short_rest_score,
+                    pattern_disruption_score=current.pattern_disruption_score,
+                    tenure_risk_score=current.tenure_risk_score,
+                    trend=current.trend,
+                    snapshot_date=current.snapshot_date,
+                )
+            )
 
     # Recent unacknowledged alerts
     recent_alerts = (
@@ -141,14 +113,14 @@ def burnout_dashboard(
 
     total_nurses = db.query(Nurse).filter(Nurse.organization_id == org_id).count()
 
-    return BurnoutDashboardResponse(
+    return model_response(BurnoutDashboardResponse(
         total_nurses=total_nurses,
         risk_distribution=dist,
         risk_buckets=risk_buckets,
         top_risks=top_risks,
         recent_alerts=recent_alerts,
         trend_summary=trend_summary,
-    )
+    ))
 
 
 # ── Nurse Detail ──
@@ -158,6 +130,11 @@ def nurse_burnout_detail(
     nurse_id: UUID,
     auth: ManagerAuth,
     days: int = Query(90, ge=7, le=365),
+    bucket: Optional[str] = Query(
+        None,
+        pattern="^(day|week|month)$",
+        description="Downsample history to the latest snapshot per day, week or month",
+    ),
     db: Session = Depends(get_db),
 ):
     """Detailed burnout history for a specific nurse."""
@@ -166,12 +143,24 @@ def nurse_burnout_detail(
         raise HTTPException(status_code=404, detail="Nurse not found")
 
     since = datetime.utcnow() - timedelta(days=days)
-    history = (
-        db.query(BurnoutSnapshot)
-        .filter(BurnoutSnapshot.nurse_id == nurse_id, BurnoutSnapshot.snapshot_date >= since)
-        .order_by(BurnoutSnapshot.snapshot_date.desc())
-        .all()
+    history_query = db.query(BurnoutSnapshot).filter(
+        BurnoutSnapshot.nurse_id == nurse_id,
+        BurnoutSnapshot.snapshot_date >= since,
     )
+    if bucket:
+        # Inline the (pattern-validated) unit so DISTINCT ON and ORDER BY
+        # render the identical expression.
+        period = func.date_trunc(literal_column(f"'{bucket}'"), BurnoutSnapshot.snapshot_date)
+        latest_ids = (
+            history_query.with_entities(BurnoutSnapshot.id)
+            .distinct(period)
+            .order_by(period, BurnoutSnapshot.snapshot_date.desc())
+            .subquery()
+        )
+        history_query = db.query(BurnoutSnapshot).filter(
+            BurnoutSnapshot.id.in_(select(latest_ids.c.id))
+        )
+    history = history_query.order_by(BurnoutSnapshot.snapshot_date.desc()).all()
     alerts = (
         db.query(BurnoutAlert)
         .filter(BurnoutAlert.nurse_id == nurse_id)
@@ -180,13 +169,13 @@ def nurse_burnout_detail(
         .all()
     )
 
-    return BurnoutNurseDetail(
+    return model_response(BurnoutNurseDetail(
         nurse_id=nurse.id,
         nurse_name=nurse.name,
         current_snapshot=history[0] if history else None,
         history=history,
         alerts=alerts,
-    )
+    ))
 
 
 # ── Run Assessment ──
@@ -211,50 +200,15 @@ def run_assessment(
     else:
         nurses = db.query(Nurse).filter(Nurse.organization_id == org_id).all()
 
-    results = []
-    for nurse in nurses:
-        # Build metrics from available data (stub — production would query shift tables)
-        metrics = _build_metrics_for_nurse(db, nurse)
-        snapshot = run_burnout_assessment(db, org_id, nurse, metrics)
-        results.append({"nurse_id": str(nurse.id), "risk_level": snapshot.risk_level, "score": snapshot.overall_risk_score})
-
-    return {"assessed": len(results), "results": results}
+    metrics_by_nurse = build_org_burnout_metrics(db, org_id, nurses)
 
+    snapshots = run_burnout_assessments(db, org_id, nurses, metrics_by_nurse)
+    results = [
+        {"nurse_id": str(s.nurse_id), "risk_level": s.risk_level, "score": s.overall_risk_score}
+        for s in snapshots
+    ]
 
-def _build_metrics_for_nurse(db: Session, nurse: Nurse) -> Dict[str, Any]:
-    """
-    Build metrics dict from shift/schedule data.
-    Stub implementation — returns reasonable defaults.
-    In production, query OptimizedSchedule + ShiftCode tables.
-    """
-    import random
-    # Deterministic seed from nurse ID for consistent demo results
-    seed = int(str(nurse.id).replace("-", "")[:8], 16) % 10000
-    rng = random.Random(seed)
-
-    now = datetime.now(timezone.utc)
-    created = nurse.created_at
-    if created is not None and created.tzinfo is None:
-        created = created.replace(tzinfo=timezone.utc)
-    tenure_days = (now - (created or now)).days
-
-    return {
-        "hours_last_7d": rng.uniform(30, 55),
-        "hours_last_14d": rng.uniform(60, 100),
-        "hours_last_30d": rng.uniform(120, 200),
-        "overtime_hours_last_14d": rng.uniform(0, 20),
-        "consecutive_days_worked": rng.randint(1, 8),
-        "night_shifts_last_14d": rng.randint(0, 8),
-        "total_shifts_last_14d": rng.randint(8, 14),
-        "weekend_shifts_last_14d": rng.randint(0, 5),
-        "avg_rest_hours_between_shifts": rng.uniform(8, 14),
-        "min_rest_hours_last_7d": rng.uniform(7, 13),
-        "schedule_variance_coefficient": rng.uniform(0, 0.6),
-        "days_since_last_day_off": rng.randint(0, 7),
-        "sick_calls_last_90d": rng.randint(0, 4),
-        "swap_requests_last_30d": rng.randint(0, 3),
-        "tenure_days": tenure_days,
-    }
+    return {"assessed": len(results), "results": results}
 
 
 # ── Alerts ──
@@ -8,21 +8,22 @@ Reference: https://www.hl7.org/fhir/http.html
 """
 import logging
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.db.deps import get_db
 from app.core.auth import OrgAuth, AuthContext, get_org_required_auth
+from app.core.responses import FastJSONResponse, model_response
 from app.models.patient import Patient
 from app.models.nurse import Nurse
 from app.models.organization import Organization, OrganizationMember
-from app.models.optimized_schedule import OptimizedSchedule
+from app.models.shift_assignment import ShiftAssignment
 from app.fhir import (
     FHIRPatient, FHIRPractitioner, FHIRBundle, FHIROperationOutcome,
     patient_to_fhir, nurse_to_fhir, organization_to_fhir_careteam,
-    optimized_schedule_to_fhir_slots, create_search_bundle, create_operation_outcome
+    shift_assignments_to_fhir_slots, create_search_bundle, create_operation_outcome
 )
 
 router = APIRouter()
@@ -33,23 +34,36 @@ FHIR_JSON = "application/fhir+json"
 FHIR_JSON_CHARSET = "application/fhir+json; charset=utf-8"
 
 
-def fhir_response(data: dict, status_code: int = 200) -> JSONResponse:
-    """Create a FHIR-compliant JSON response"""
-    return JSONResponse(
+def fhir_response(data: Union[dict, BaseModel], status_code: int = 200) -> Response:
+    """Create a FHIR-compliant JSON response.
+
+    FHIR resources are serialized directly by pydantic-core
+    (by_alias, exclude_none) instead of being dumped to a dict first.
+    """
+    headers = {
+        "X-FHIR-Version": "5.0.0",
+        "X-Request-Id": datetime.utcnow().isoformat(),
+    }
+    if isinstance(data, BaseModel):
+        return model_response(
+            data,
+            status_code=status_code,
+            media_type=FHIR_JSON_CHARSET,
+            headers=headers,
+            exclude_none=True,
+        )
+    return FastJSONResponse(
         content=data,
         status_code=status_code,
         media_type=FHIR_JSON_CHARSET,
-        headers={
-            "X-FHIR-Version": "5.0.0",
-            "X-Request-Id": datetime.utcnow().isoformat(),
-        }
+        headers=headers,
     )
 
 
-def fhir_error(severity: str, code: str, message: str, status_code: int = 400) -> JSONResponse:
+def fhir_error(severity: str, code: str, message: str, status_code: int = 400) -> Response:
     """Create a FHIR OperationOutcome error response"""
     outcome = create_operation_outcome(severity, code, message)
-    return fhir_response(outcome.model_dump(by_alias=True, exclude_none=True), status_code)
+    return fhir_response(outcome, status_code)
 
 
 # ============== Capability Statement ==============
@@ -194,7 +208,7 @@ async def read_patient(
         return fhir_error("error", "not-found", f"Patient/{patient_id} not found", 404)
     
     fhir_patient = patient_to_fhir(patient, auth.organization_id)
-    return fhir_response(fhir_patient.model_dump(by_alias=True, exclude_none=True))
+    return fhir_response(fhir_patient)
 
 
 @router.get("/Patient")
@@ -235,7 +249,7 @@ async def search_patients(
     fhir_patients = [patient_to_fhir(p, auth.organization_id) for p in patients]
     bundle = create_search_bundle(fhir_patients, total, str(request.url) if request else "")
     
-    return fhir_response(bundle.model_dump(by_alias=True, exclude_none=True))
+    return fhir_response(bundle)
 
 
 # ============== Practitioner Resource ==============
@@ -260,7 +274,7 @@ async def read_practitioner(
         return fhir_error("error", "not-found", f"Practitioner/{practitioner_id} not found", 404)
     
     fhir_practitioner = nurse_to_fhir(nurse, auth.organization_id)
-    return fhir_response(fhir_practitioner.model_dump(by_alias=True, exclude_none=True))
+    return fhir_response(fhir_practitioner)
 
 
 @router.get("/Practitioner")
@@ -297,7 +311,7 @@ async def search_practitioners(
     fhir_practitioners = [nurse_to_fhir(n, auth.organization_id) for n in nurses]
     bundle = create_search_bundle(fhir_practitioners, total, str(request.url) if request else "")
     
-    return fhir_response(bundle.model_dump(by_alias=True, exclude_none=True))
+    return fhir_response(bundle)
 
 
 # ============== CareTeam Resource ==============
@@ -331,7 +345,7 @@ async def read_careteam(
     ).all()
     
     fhir_careteam = organization_to_fhir_careteam(organization, members)
-    return fhir_response(fhir_careteam.model_dump(by_alias=True, exclude_none=True))
+    return fhir_response(fhir_careteam)
 
 
 # ============== Slot Resource ==============
@@ -350,46 +364,32 @@ async def search_slots(
     
     Search for schedule slots (nurse shift assignments).
     """
-    query = db.query(OptimizedSchedule).filter(
-        OptimizedSchedule.organization_id == auth.organization_id,
-        OptimizedSchedule.is_finalized == True
+    query = db.query(ShiftAssignment).filter(
+        ShiftAssignment.organization_id == auth.organization_id
     )
     
     # Filter by schedule ID if provided
     if schedule:
         schedule_id = schedule.replace("Schedule/", "")
-        query = query.filter(OptimizedSchedule.id == schedule_id)
-    
-    schedules = query.limit(10).all()
-    
-    all_slots = []
-    for sched in schedules:
-        try:
-            data = sched.schedule_data
-            if isinstance(data, str):
-                import json
-                data = json.loads(data)
-            
-            slots = optimized_schedule_to_fhir_slots(data, str(sched.id), auth.organization_id)
-            all_slots.extend(slots)
-        except Exception as e:
-            logger.warning(f"Failed to convert schedule {sched.id} to slots: {e}")
-            continue
+        query = query.filter(ShiftAssignment.schedule_id == schedule_id)
     
     # Filter by start date if provided
     if start:
         try:
             start_date = datetime.fromisoformat(start.replace("Z", "+00:00"))
-            all_slots = [s for s in all_slots if s.start >= start_date]
-        except:
+            query = query.filter(ShiftAssignment.date >= start_date.date().isoformat())
+        except ValueError:
             pass
     
-    # Limit results
-    total = len(all_slots)
-    all_slots = all_slots[:_count]
+    # Count and limit in SQL over the (organization_id, date) index
+    total = query.count()
+    assignments = query.order_by(
+        ShiftAssignment.date, ShiftAssignment.nurse_name
+    ).limit(_count).all()
+    all_slots = shift_assignments_to_fhir_slots(assignments, auth.organization_id)
     
     bundle = create_search_bundle(all_slots, total, str(request.url) if request else "")
-    return fhir_response(bundle.model_dump(by_alias=True, exclude_none=True))
+    return fhir_response(bundle)
 
 
 # ============== $everything Operation ==============
@@ -436,7 +436,7 @@ async def patient_everything(
         resources.append(careteam)
     
     bundle = create_search_bundle(resources, len(resources), str(request.url) if request else "")
-    return fhir_response(bundle.model_dump(by_alias=True, exclude_none=True))
+    return fhir_response(bundle)
 
 
 # ============== Health Check ==============
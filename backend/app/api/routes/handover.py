@@ -1,8 +1,10 @@
 """API routes for Handover management."""
+import base64
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import or_
+from sqlalchemy import case, func, insert, literal, or_, select, tuple_
 from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from uuid import uuid4
 from datetime import datetime, date, timezone, timedelta
 from app.db.deps import get_db
 from app.models.patient import Patient
@@ -16,18 +18,118 @@ from app.schemas.handover import (
     BulkHandoverCreate,
 )
 from app.core.auth import OptionalAuth
+from app.core.responses import model_response
 from app.utils.audit import log_audit, diff_fields
 from app.services.deletion_activity import record_deletion_activity
 
 router = APIRouter()
 
 
+def _patient_identity_key(include_shift_type: bool = False):
+    """SQL expression for the patient identity handovers are deduplicated by.
+
+    patient_id when set, otherwise the embedded name + room (case- and
+    whitespace-insensitive), optionally split by shift type.
+    """
+    key = case(
+        (
+            func.coalesce(Handover.patient_id, "") != "",
+            literal("p:") + Handover.patient_id,
+        ),
+        else_=(
+            literal("n:")
+            + func.lower(func.trim(func.coalesce(Handover.p_first_name, "")))
+            + "|"
+            + func.lower(func.trim(func.coalesce(Handover.p_last_name, "")))
+            + "|"
+            + func.trim(func.coalesce(Handover.p_room_number, ""))
+        ),
+    )
+    if include_shift_type:
+        key = key + "|" + func.coalesce(Handover.shift_type, "")
+    return key
+
+
+def _encode_handover_cursor(handover: Handover) -> str:
+    raw = f"{handover.updated_at.isoformat()}|{handover.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_handover_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, handover_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(updated_at), handover_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _latest_handovers_page(
+    db: Session,
+    filters: list,
+    identity_key,
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+    skip: int = 0,
+):
+    """Return one page of the most recent handover per patient identity.
+
+    Deduplication runs in Postgres (DISTINCT ON the identity key, newest
+    ``updated_at`` first) and only the page itself is loaded with its
+    patients. Pages are ordered by (updated_at, id) descending; pass the
+    returned cursor back to continue after the last row.
+
+    Returns ``(handovers, total, next_cursor)``.
+    """
+    latest_ids = (
+        db.query(Handover.id)
+        .filter(*filters)
+        .distinct(identity_key)
+        .order_by(identity_key, Handover.updated_at.desc(), Handover.created_at.desc())
+        .subquery()
+    )
+    total = db.query(func.count()).select_from(latest_ids).scalar() or 0
+
+    query = (
+        db.query(Handover)
+        .options(joinedload(Handover.patient))
+        .filter(Handover.id.in_(select(latest_ids.c.id)))
+    )
+    if cursor:
+        cursor_updated_at, cursor_id = _decode_handover_cursor(cursor)
+        query = query.filter(
+            tuple_(Handover.updated_at, Handover.id) < tuple_(cursor_updated_at, cursor_id)
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    query = query.order_by(Handover.updated_at.desc(), Handover.id.desc())
+    if limit is None:
+        return query.all(), total, None
+
+    handovers = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(handovers) > limit:
+        handovers = handovers[:limit]
+        next_cursor = _encode_handover_cursor(handovers[-1])
+    return handovers, total, next_cursor
+
+
+def _handover_list_response(handovers, total: int, next_cursor: Optional[str]):
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return model_response(
+        HandoverListResponse(handovers=handovers, total=total),
+        headers=headers,
+    )
+
+
 @router.get("/", response_model=HandoverListResponse)
 def get_handovers(
     auth: OptionalAuth,
     db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    skip: int = Query(0, ge=0, description="Offset pagination (prefer cursor)"),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     shift_date: Optional[date] = Query(None, description="Filter by shift date"),
     shift_type: Optional[str] = Query(None, description="Filter by shift type"),
     is_completed: Optional[bool] = Query(None, description="Filter by completion status"),
@@ -35,59 +137,38 @@ def get_handovers(
     outgoing_nurse: Optional[str] = Query(None, description="Filter by outgoing nurse"),
 ):
     """
-    Get all handovers with optional filtering.
+    Get the most recent handover per patient, with optional filtering.
+
+    When more rows remain, the response carries an ``X-Next-Cursor`` header
+    to pass back as ``cursor``.
     """
-    query = db.query(Handover).options(joinedload(Handover.patient))
-    
     # Filter strictly by organization - no legacy NULL fallback to prevent data leakage
-    if auth.is_authenticated and auth.organization_id:
-        query = query.filter(Handover.organization_id == auth.organization_id)
-    else:
+    if not (auth.is_authenticated and auth.organization_id):
         # No auth or no organization -> return empty list to prevent data leakage
-        return HandoverListResponse(handovers=[], total=0)
-    
+        return model_response(HandoverListResponse(handovers=[], total=0))
+    filters = [Handover.organization_id == auth.organization_id]
+
     if shift_date:
         # Filter by date portion
-        query = query.filter(
-            Handover.shift_date >= datetime.combine(shift_date, datetime.min.time()),
-            Handover.shift_date < datetime.combine(shift_date, datetime.max.time())
-        )
-    
+        filters.append(Handover.shift_date >= datetime.combine(shift_date, datetime.min.time()))
+        filters.append(Handover.shift_date < datetime.combine(shift_date, datetime.max.time()))
+
     if shift_type:
-        query = query.filter(Handover.shift_type == shift_type)
-    
+        filters.append(Handover.shift_type == shift_type)
+
     if is_completed is not None:
-        query = query.filter(Handover.is_completed == is_completed)
-    
+        filters.append(Handover.is_completed == is_completed)
+
     if patient_id:
-        query = query.filter(Handover.patient_id == patient_id)
-    
-    if outgoing_nurse:
-        query = query.filter(Handover.outgoing_nurse.ilike(f"%{outgoing_nurse}%"))
-    
-    # Deduplicate: keep only the most recent handover per patient identity.
-    ordered = query.order_by(Handover.updated_at.desc(), Handover.created_at.desc()).all()
-
-    deduped: list[Handover] = []
-    seen_keys: set[tuple] = set()
-    for handover in ordered:
-        if handover.patient_id:
-            key = (handover.patient_id,)
-        else:
-            key = (
-                (handover.p_first_name or "").strip().lower(),
-                (handover.p_last_name or "").strip().lower(),
-                (handover.p_room_number or "").strip(),
-            )
-        if key in seen_keys:
-            continue
-        seen_keys.add(key)
-        deduped.append(handover)
+        filters.append(Handover.patient_id == patient_id)
 
-    total = len(deduped)
-    paginated = deduped[skip : skip + limit]
+    if outgoing_nurse:
+        filters.append(Handover.outgoing_nurse.ilike(f"%{outgoing_nurse}%"))
 
-    return HandoverListResponse(handovers=paginated, total=total)
+    handovers, total, next_cursor = _latest_handovers_page(
+        db, filters, _patient_identity_key(), limit, cursor=cursor, skip=skip
+    )
+    return _handover_list_response(handovers, total, next_cursor)
 
 
 @router.get("/today", response_model=HandoverListResponse)
@@ -99,6 +180,8 @@ def get_todays_handovers(
         False,
         description="When true and shift_type is not provided, keep separate day/night entries per patient",
     ),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size (default: all of today)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
 ):
     """
     Get all handovers for today's date.
@@ -111,46 +194,28 @@ def get_todays_handovers(
     # This ensures handovers created "today" in ANY timezone on Earth are captured.
     start = datetime.combine(today_utc - timedelta(days=1), datetime.min.time().replace(hour=8), tzinfo=timezone.utc)
     end = datetime.combine(today_utc + timedelta(days=1), datetime.min.time().replace(hour=20), tzinfo=timezone.utc)
-    query = db.query(Handover).options(joinedload(Handover.patient)).filter(
-        Handover.shift_date >= start,
-        Handover.shift_date < end
-    )
-    
+
     # Filter strictly by organization - no legacy NULL fallback to prevent data leakage
-    if auth.is_authenticated and auth.organization_id:
-        query = query.filter(Handover.organization_id == auth.organization_id)
-    else:
+    if not (auth.is_authenticated and auth.organization_id):
         # No auth or no organization -> return empty list to prevent data leakage
-        return HandoverListResponse(handovers=[], total=0)
-    
+        return model_response(HandoverListResponse(handovers=[], total=0))
+    filters = [
+        Handover.organization_id == auth.organization_id,
+        Handover.shift_date >= start,
+        Handover.shift_date < end,
+    ]
+
     if shift_type:
-        query = query.filter(Handover.shift_type == shift_type)
-    
+        filters.append(Handover.shift_type == shift_type)
+
     # Return only the most recent handover per patient key for today.
     # By default this dedupes patient identity across shifts. When callers
     # request split_by_shift, keep separate day/night rows for the same patient.
-    ordered = query.order_by(Handover.updated_at.desc(), Handover.created_at.desc()).all()
-
-    deduped: list[Handover] = []
-    seen_keys: set[tuple] = set()
-    for handover in ordered:
-        # Use patient_id when available, otherwise use embedded name+room
-        if handover.patient_id:
-            key = (handover.patient_id,)
-        else:
-            key = (
-                (handover.p_first_name or "").strip().lower(),
-                (handover.p_last_name or "").strip().lower(),
-                (handover.p_room_number or "").strip(),
-            )
-        if split_by_shift and not shift_type:
-            key = (*key, handover.shift_type or "")
-        if key in seen_keys:
-            continue
-        seen_keys.add(key)
-        deduped.append(handover)
-
-    return HandoverListResponse(handovers=deduped, total=len(deduped))
+    identity_key = _patient_identity_key(include_shift_type=split_by_shift and not shift_type)
+    handovers, total, next_cursor = _latest_handovers_page(
+        db, filters, identity_key, limit, cursor=cursor
+    )
+    return _handover_list_response(handovers, total, next_cursor)
 
 
 @router.get("/{handover_id}", response_model=HandoverResponse)
@@ -510,53 +575,62 @@ def create_handovers_bulk(
         raise HTTPException(status_code=401, detail="Authentication required")
     
     org_id = auth.organization_id
-    created_handovers = []
-    
-    for patient_id in bulk_data.patient_ids:
-        # Verify patient exists
-        patient_query = db.query(Patient).filter(
-            Patient.id == patient_id,
-            Patient.organization_id == org_id
+    # Preserve request order; a patient listed twice gets one draft.
+    requested_ids = list(dict.fromkeys(bulk_data.patient_ids))
+    if not requested_ids:
+        return []
+
+    known_ids = {
+        row.id
+        for row in db.query(Patient.id).filter(
+            Patient.id.in_(requested_ids),
+            Patient.organization_id == org_id,
         )
-        patient = patient_query.first()
-        if not patient:
-            continue
-        
-        # Skip if handover already exists
-        existing_query = db.query(Handover).filter(
-            Handover.patient_id == patient_id,
-            Handover.shift_date >= datetime.combine(bulk_data.shift_date.date(), datetime.min.time()),
-            Handover.shift_date < datetime.combine(bulk_data.shift_date.date(), datetime.max.time()),
+    }
+
+    # Skip patients that already have an open handover for this shift
+    shift_day = bulk_data.shift_date.date()
+    covered_ids = {
+        row.patient_id
+        for row in db.query(Handover.patient_id).filter(
+            Handover.patient_id.in_(known_ids),
+            Handover.shift_date >= datetime.combine(shift_day, datetime.min.time()),
+            Handover.shift_date < datetime.combine(shift_day, datetime.max.time()),
             Handover.shift_type == bulk_data.shift_type.value,
             Handover.is_completed == False,
-            Handover.organization_id == org_id
+            Handover.organization_id == org_id,
         )
-        
-        if existing_query.first():
-            continue
-        
-        handover = Handover(
-            patient_id=patient_id,
-            organization_id=org_id,
-            shift_date=bulk_data.shift_date,
-            shift_type=bulk_data.shift_type.value,
-            outgoing_nurse=bulk_data.outgoing_nurse,
-        )
-        db.add(handover)
-        created_handovers.append(handover)
-    
+    } if known_ids else set()
+
+    new_rows = [
+        {
+            "id": str(uuid4()),
+            "patient_id": patient_id,
+            "organization_id": org_id,
+            "shift_date": bulk_data.shift_date,
+            "shift_type": bulk_data.shift_type.value,
+            "outgoing_nurse": bulk_data.outgoing_nurse,
+        }
+        for patient_id in requested_ids
+        if patient_id in known_ids and patient_id not in covered_ids
+    ]
+    if not new_rows:
+        return []
+
+    # One multi-row INSERT ... RETURNING instead of an INSERT per patient
+    created_ids = db.scalars(
+        insert(Handover).returning(Handover.id, sort_by_parameter_order=True),
+        new_rows,
+    ).all()
     db.commit()
-    
-    # Refresh and load relationships
-    result = []
-    for handover in created_handovers:
-        db.refresh(handover)
-        h = db.query(Handover).options(
-            joinedload(Handover.patient)
-        ).filter(Handover.id == handover.id).first()
-        result.append(h)
-    
-    return result
+
+    by_id = {
+        handover.id: handover
+        for handover in db.query(Handover)
+        .options(joinedload(Handover.patient))
+        .filter(Handover.id.in_(created_ids))
+    }
+    return [by_id[handover_id] for handover_id in created_ids if handover_id in by_id]
 
 
 @router.get("/patient/{patient_id}/latest", response_model=Optional[HandoverResponse])
@@ -613,7 +687,7 @@ def get_handover_history_for_patient(
         query = query.filter(Handover.organization_id == auth.organization_id)
     else:
         # No auth or no organization -> return empty list
-        return HandoverListResponse(handovers=[], total=0)
+        return model_response(HandoverListResponse(handovers=[], total=0))
 
     total = query.count()
     handovers = query.order_by(
@@ -622,7 +696,7 @@ def get_handover_history_for_patient(
         Handover.created_at.desc(),
     ).limit(limit).all()
 
-    return HandoverListResponse(handovers=handovers, total=total)
+    return model_response(HandoverListResponse(handovers=handovers, total=total))
 
 
 @router.delete("/cleanup", status_code=200)
@@ -9,7 +9,7 @@ from typing import Optional, List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import distinct, func, select
 
 from app.db.deps import get_db
 from app.models.learning import (
@@ -38,6 +38,7 @@ from app.schemas.learning import (
     AssignmentCompletionResponse,
 )
 from app.core.auth import RequiredAuth, LearningManageAuth as ManagerAuth, OrgAuth
+from app.services.viewer_team import viewer_team
 
 router = APIRouter()
 
@@ -327,69 +328,83 @@ def list_paths(
 
 # ── Manager Dashboard ──
 
-@router.get("/dashboard", response_model=LearningDashboardResponse)
-def learning_dashboard(
-    auth: ManagerAuth,
-    db: Session = Depends(get_db),
-):
-    """Manager dashboard showing onboarding progress across all nurses."""
-    org_id = auth.organization_id or auth.user_id
+def build_learning_dashboard(db: Session, org_id: str) -> LearningDashboardResponse:
+    """Onboarding progress for every nurse in ``org_id``.
 
-    nurses = db.query(Nurse).filter(Nurse.organization_id == org_id).all()
+    Per-nurse counts come from one grouped aggregate over learning_progress,
+    so the query count does not grow with the number of nurses.
+    """
     modules = (
-        db.query(LearningModule)
+        db.query(LearningModule.id, LearningModule.is_mandatory)
         .filter(
             (LearningModule.organization_id == org_id) | (LearningModule.organization_id == None),
             LearningModule.is_published == True,
         )
         .all()
     )
-    paths = (
-        db.query(LearningPath)
+    paths_available = (
+        db.query(func.count(LearningPath.id))
         .filter(
             (LearningPath.organization_id == org_id) | (LearningPath.organization_id == None),
             LearningPath.is_published == True,
         )
-        .all()
-    )
+        .scalar()
+    ) or 0
 
-    mandatory_module_ids = {str(m.id) for m in modules if m.is_mandatory}
+    mandatory_module_ids = [m.id for m in modules if m.is_mandatory]
     total_modules = len(modules)
 
+    is_completed = LearningProgress.status == "completed"
+    org_nurse_ids = select(Nurse.id).where(Nurse.organization_id == org_id)
+    stats = (
+        db.query(
+            LearningProgress.nurse_id.label("nurse_id"),
+            func.count().filter(is_completed).label("completed"),
+            func.count().filter(LearningProgress.status == "in_progress").label("in_progress"),
+            func.count(distinct(LearningProgress.module_id))
+            .filter(is_completed, LearningProgress.module_id.in_(mandatory_module_ids))
+            .label("mandatory_completed"),
+            func.max(LearningProgress.last_accessed_at).label("last_activity_at"),
+        )
+        .filter(LearningProgress.nurse_id.in_(org_nurse_ids))
+        .group_by(LearningProgress.nurse_id)
+        .subquery()
+    )
+    rows = (
+        db.query(
+            Nurse.id,
+            Nurse.name,
+            stats.c.completed,
+            stats.c.in_progress,
+            stats.c.mandatory_completed,
+            stats.c.last_activity_at,
+        )
+        .outerjoin(stats, stats.c.nurse_id == Nurse.id)
+        .filter(Nurse.organization_id == org_id)
+        .all()
+    )
+
     nurse_statuses: List[NurseOnboardingStatus] = []
     fully_onboarded = 0
     in_progress = 0
     not_started_count = 0
 
-    for nurse in nurses:
-        progress_records = db.query(LearningProgress).filter(
-            LearningProgress.nurse_id == nurse.id,
-        ).all()
-
-        completed = sum(1 for p in progress_records if p.status == "completed")
-        in_prog = sum(1 for p in progress_records if p.status == "in_progress")
+    for row in rows:
+        completed = row.completed or 0
+        in_prog = row.in_progress or 0
         pct = (completed / total_modules * 100) if total_modules > 0 else 0
+        mandatory_done = (row.mandatory_completed or 0) >= len(mandatory_module_ids)
 
-        # Check mandatory completion
-        completed_ids = {str(p.module_id) for p in progress_records if p.status == "completed"}
-        mandatory_done = mandatory_module_ids.issubset(completed_ids)
-
-        last_activity = None
-        if progress_records:
-            dates = [p.last_accessed_at for p in progress_records if p.last_accessed_at]
-            last_activity = max(dates) if dates else None
-
-        status = NurseOnboardingStatus(
-            nurse_id=nurse.id,
-            nurse_name=nurse.name,
+        nurse_statuses.append(NurseOnboardingStatus(
+            nurse_id=row.id,
+            nurse_name=row.name,
             total_modules=total_modules,
             completed_modules=completed,
             in_progress_modules=in_prog,
             completion_percentage=round(pct, 1),
             mandatory_completed=mandatory_done,
-            last_activity_at=last_activity,
-        )
-        nurse_statuses.append(status)
+            last_activity_at=row.last_activity_at,
+        ))
 
         if pct >= 100:
             fully_onboarded += 1
@@ -399,30 +414,26 @@ def learning_dashboard(
             not_started_count += 1
 
     return LearningDashboardResponse(
-        total_nurses=len(nurses),
+        total_nurses=len(rows),
         fully_onboarded=fully_onboarded,
         in_progress=in_progress,
         not_started=not_started_count,
         modules_available=total_modules,
-        paths_available=len(paths),
+        paths_available=paths_available,
         nurse_statuses=nurse_statuses,
     )
 
 
-# ── Assignments ──
+@router.get("/dashboard", response_model=LearningDashboardResponse)
+def learning_dashboard(
+    auth: ManagerAuth,
+    db: Session = Depends(get_db),
+):
+    """Manager dashboard showing onboarding progress across all nurses."""
+    return build_learning_dashboard(db, auth.organization_id or auth.user_id)
 
-def _viewer_team(db: Session, auth) -> Optional[str]:
-    """Resolve the caller's team from their nurse profile, if one exists."""
-    nurse = (
-        db.query(Nurse)
-        .filter(
-            Nurse.organization_id == auth.organization_id,
-            Nurse.user_id == auth.user_id,
-        )
-        .first()
-    )
-    return nurse.team if nurse else None
 
+# ── Assignments ──
 
 def _decorate_assignment(
     assignment: LearningAssignment,
@@ -530,7 +541,7 @@ def list_assignments(
     )
 
     if not auth.has_permission("manage_learning"):
-        team = _viewer_team(db, auth)
+        team = viewer_team(db, auth.organization_id, auth.user_id)
         if team:
             query = query.filter(
                 (LearningAssignment.target_team == None) | (LearningAssignment.target_team == team)
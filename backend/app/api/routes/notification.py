@@ -1,14 +1,26 @@
 """In-app notification routes."""
 import logging
+import uuid
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.core.event_bus import HEARTBEAT_SECONDS, event_hub
+from app.core.event_hub import sse_stream
 from app.db.deps import get_db
 from app.models.notification import Notification
 from app.schemas.notification import NotificationResponse
+from app.services.notifications import (
+    decrement_unread,
+    increment_unread,
+    publish_notification_event,
+    unread_count,
+)
+from app.services.viewer_team import viewer_team
 from app.core.auth import AuthContext, get_required_auth
 
 router = APIRouter()
@@ -30,8 +42,11 @@ def create_notification(
 
     Shared helper so other routes (e.g. admin transfer) can raise alerts
     without duplicating persistence logic. Caller is responsible for commit.
+    For broadcasts use ``app.services.notifications.fan_out_notifications``.
     """
     notification = Notification(
+        id=uuid.uuid4(),
+        created_at=datetime.utcnow(),
         organization_id=organization_id,
         user_id=user_id,
         type=type,
@@ -40,6 +55,18 @@ def create_notification(
         link=link,
     )
     db.add(notification)
+    increment_unread(db, {user_id: 1})
+    publish_notification_event(
+        db,
+        {user_id: str(notification.id)},
+        {
+            "organization_id": organization_id,
+            "type": type,
+            "title": title,
+            "link": link,
+            "created_at": notification.created_at,
+        },
+    )
     return notification
 
 
@@ -64,6 +91,44 @@ def list_my_notifications(
     )
 
 
+@router.get("/unread-count")
+def get_unread_count(
+    auth: AuthContext = Depends(get_required_auth),
+    db: Session = Depends(get_db),
+):
+    """Unread badge count, served from the per-user counter."""
+    return {"unread": unread_count(db, auth.user_id)}
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    auth: AuthContext = Depends(get_required_auth),
+    db: Session = Depends(get_db),
+):
+    """
+    Server-Sent Events stream of the caller's notifications and their org's
+    announcements, replacing polling.
+
+    Sends a keepalive comment every EVENT_STREAM_HEARTBEAT_SECONDS. Clients
+    resume with ``Last-Event-ID``; a ``resync`` event means events were
+    missed and the client should refetch over REST.
+    """
+    team = viewer_team(db, auth.organization_id, auth.user_id)
+    # Release the pooled connection; the stream can stay open for hours.
+    db.close()
+
+    subscription = event_hub.subscribe(
+        auth.user_id, auth.organization_id, team, last_event_id=last_event_id
+    )
+    return StreamingResponse(
+        sse_stream(event_hub, subscription, request.is_disconnected, heartbeat=HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{notification_id}/read", response_model=NotificationResponse)
 def mark_notification_read(
     notification_id: UUID,
@@ -71,6 +136,20 @@ def mark_notification_read(
     db: Session = Depends(get_db),
 ):
     """Mark a single notification as read."""
+    # Flip the flag in one conditional UPDATE so concurrent requests cannot
+    # both see it unread and decrement the counter twice.
+    flipped = (
+        db.query(Notification)
+        .filter(
+            Notification.id == notification_id,
+            Notification.user_id == auth.user_id,
+            Notification.is_read == False,  # noqa: E712
+        )
+        .update({Notification.is_read: True}, synchronize_session=False)
+    )
+    if flipped == 1:
+        decrement_unread(db, auth.user_id)
+
     notification = (
         db.query(Notification)
         .filter(
@@ -82,7 +161,6 @@ def mark_notification_read(
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
 
-    notification.is_read = True
     db.commit()
     db.refresh(notification)
     return notification
@@ -102,5 +180,8 @@ def mark_all_notifications_read(
         )
         .update({Notification.is_read: True}, synchronize_session=False)
     )
+    # Subtract what this UPDATE flipped rather than zeroing the counter, so a
+    # fan-out committed meanwhile keeps its unread notifications counted.
+    decrement_unread(db, auth.user_id, updated)
     db.commit()
     return {"message": "Notifications marked as read", "updated": updated}
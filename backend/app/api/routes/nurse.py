@@ -11,6 +11,7 @@ from app.models.nurse import Nurse
 from app.models.organization import OrganizationMember, MemberRole
 from app.schemas.nurse import NurseCreate, NurseUpdate, NurseResponse, NurseListResponse
 from app.core.auth import OptionalAuth, ManagerAuth, AuthContext
+from app.core.cache_bus import publish_invalidation
 
 router = APIRouter()
 
@@ -262,6 +263,7 @@ def create_nurse(
     db.add(nurse)
     db.commit()
     db.refresh(nurse)
+    publish_invalidation("nurses", org_id)
     
     return _serialize_nurse_with_live_seniority(nurse)
 
@@ -361,6 +363,7 @@ def update_nurse(
     
     db.commit()
     db.refresh(nurse)
+    publish_invalidation("nurses", nurse.organization_id)
     
     return _serialize_nurse_with_live_seniority(nurse)
 
@@ -398,7 +401,9 @@ def delete_nurse(
     if not nurse:
         raise HTTPException(status_code=404, detail="Nurse not found")
     
+    organization_id = nurse.organization_id
     db.delete(nurse)
     db.commit()
+    publish_invalidation("nurses", organization_id)
     
     return None
@@ -2,35 +2,60 @@
 import uuid
 import re
 import json
+import base64
 import ast
 import logging
 import difflib
 import unicodedata
 import time as _time
 import traceback
+import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Union, Set, Tuple, Any, Optional
 import math
 from collections import defaultdict
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Header, Query
-from pydantic import UUID4, BaseModel, Field
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Header, Query, Request, Response
+from pydantic import UUID4, BaseModel, Field, ValidationError
+from sqlalchemy import or_, tuple_
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.exc import SQLAlchemyError
 from tenacity import retry, stop_after_attempt, wait_exponential
 from ortools.sat.python import cp_model
 from openai import OpenAI
 
 from app.db.deps import get_db
 from app.core.config import settings
+from app.core.responses import FastJSONResponse, model_response
 from app.core.auth import get_optional_auth, AuthContext
+from app.core.http_cache import (
+    CACHE_FINALIZED_SCHEDULE,
+    CACHE_REVALIDATE,
+    ImmutableBodyCache,
+    json_body_response,
+    not_modified,
+    render_json,
+    request_is_fresh,
+)
 from app.models.optimized_schedule import OptimizedSchedule
 from app.models.system_prompt import SystemPrompt
 from app.models.nurse import Nurse
 from app.models.organization import Organization, OrganizationMember
-from app.schemas.optimized_schedule import OptimizeRequest, OptimizeResponse, RefineRequest, InsightsRequest
-from app.api.routes.system_prompts import get_system_prompt, DEFAULT_PROMPT_CONTENT, build_default_prompt_content
+from app.schemas.optimized_schedule import OptimizeRequest, OptimizeResponse, RefineRequest, InsightsRequest, DraftPatchRequest
+from app.api.routes.system_prompts import get_rendered_system_prompt, DEFAULT_PROMPT_CONTENT, build_default_prompt_content
+from app.utils.token_count import count_tokens
 from app.services.deletion_activity import record_deletion_activity
+from app.services.roster_snapshot import RosterSnapshot, load_roster_snapshot, roster_name_key
+from app.services.shift_assignments import publish_shift_assignments, retract_shift_assignments
+from app.services.schedule_revisions import (
+    apply_cell_edits,
+    diff_schedules,
+    is_delta_stored,
+    load_schedule_payload,
+    prepare_schedule_delete,
+    store_schedule_payload,
+)
+from app.utils.json_patch import JsonPatchError, apply_patch, diff_payloads
 from app.services.self_scheduling import (
     SelfSchedulingEngine, 
     NurseSubmission, 
@@ -62,11 +87,29 @@ def _humanize_ai_error(action: str, exc: Exception) -> str:
     return f"Unable to {action} right now. Please try again."
 
 
-def _leave_name_key(name: Any) -> str:
-    """Normalize a nurse name for leave-status matching (accent/case/spacing safe)."""
-    text = unicodedata.normalize("NFKD", str(name or ""))
-    text = "".join(ch for ch in text if not unicodedata.combining(ch))
-    return re.sub(r"\s+", " ", text).strip().lower()
+def _load_roster(
+    db: Session,
+    organization_id: Optional[str],
+    roster: Optional[RosterSnapshot],
+    context: str,
+    required: bool = False,
+) -> Optional[RosterSnapshot]:
+    """Roster snapshot for the org, or None if it cannot be read.
+
+    Only database errors are tolerated, and not at all when ``required``:
+    leave enforcement must never silently degrade into scheduling nurses
+    who are on leave.
+    """
+    if roster is not None or not organization_id:
+        return roster
+    try:
+        return load_roster_snapshot(db, organization_id)
+    except SQLAlchemyError as exc:
+        if required:
+            logger.error(f"{context}: unable to read the roster: {exc}")
+            raise
+        logger.warning(f"{context}: unable to read the roster: {exc}")
+        return None
 
 
 def apply_org_leave_status(
@@ -74,51 +117,35 @@ def apply_org_leave_status(
     assignments: Optional[Dict[str, List[str]]],
     organization_id: Optional[str],
     db: Session,
+    roster: Optional[RosterSnapshot] = None,
 ) -> Set[str]:
     """Force leave status from the database onto the optimization payload.
 
     The frontend can omit or send stale leave flags (for example when nurses on
     leave are filtered out of the selectable list). Scheduling correctness must
-    not depend on that, so leave state is re-read from the database here and
-    applied to both the nurse objects and any pre-existing assignments.
+    not depend on that, so leave state is taken from the roster snapshot here
+    and applied to both the nurse objects and any pre-existing assignments.
 
     Returns the set of normalized names that are on leave.
     """
     if not organization_id or not nurses:
         return set()
 
-    try:
-        db_nurses = (
-            db.query(Nurse)
-            .filter(Nurse.organization_id == organization_id)
-            .all()
-        )
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning(f"LEAVE ENFORCEMENT: unable to read nurse leave status: {exc}")
-        return set()
-
-    leave_by_key: Dict[str, Dict[str, bool]] = {}
-    for db_nurse in db_nurses:
-        leave_by_key[_leave_name_key(db_nurse.name)] = {
-            "isOnMaternityLeave": bool(db_nurse.is_on_maternity_leave),
-            "isOnSickLeave": bool(db_nurse.is_on_sick_leave),
-            "isOnSabbatical": bool(db_nurse.is_on_sabbatical),
-        }
+    roster = _load_roster(db, organization_id, roster, "LEAVE ENFORCEMENT", required=True)
 
     on_leave_keys: Set[str] = set()
 
     for nurse in nurses:
-        key = _leave_name_key(nurse.get("name"))
-        db_flags = leave_by_key.get(key)
-        if not db_flags:
+        key = roster_name_key(nurse.get("name"))
+        roster_nurse = roster.by_key.get(key)
+        if roster_nurse is None:
             # Unknown to the roster (manual/OCR-only entry): keep payload values.
             continue
 
-        nurse["isOnMaternityLeave"] = db_flags["isOnMaternityLeave"]
-        nurse["isOnSickLeave"] = db_flags["isOnSickLeave"]
-        nurse["isOnSabbatical"] = db_flags["isOnSabbatical"]
+        db_flags = roster_nurse.leave_flags()
+        nurse.update(db_flags)
 
-        if any(db_flags.values()):
+        if roster_nurse.is_on_leave:
             on_leave_keys.add(key)
             logger.info(
                 f"  LEAVE ENFORCEMENT: '{nurse.get('name')}' is on leave "
@@ -130,7 +157,7 @@ def apply_org_leave_status(
     # Clear any carried-over shifts so a re-optimization cannot preserve them.
     if on_leave_keys and assignments:
         for assigned_name in list(assignments.keys()):
-            if _leave_name_key(assigned_name) in on_leave_keys:
+            if roster_name_key(assigned_name) in on_leave_keys:
                 assignments[assigned_name] = ["" for _ in assignments[assigned_name]]
 
     if on_leave_keys:
@@ -143,6 +170,7 @@ def apply_org_staffing_profile(
     nurses: List[Dict],
     organization_id: Optional[str],
     db: Session,
+    roster: Optional[RosterSnapshot] = None,
 ) -> Dict[str, Any]:
     """Stamp DB-owned staffing role / staffing team onto the optimization payload.
 
@@ -156,56 +184,28 @@ def apply_org_staffing_profile(
     """
     profile = {"weekendTeamRotationEnabled": False}
 
-    if not organization_id:
+    roster = _load_roster(db, organization_id, roster, "STAFFING PROFILE")
+    if roster is None:
         return profile
 
-    try:
-        org = (
-            db.query(Organization)
-            .filter(Organization.id == organization_id)
-            .first()
-        )
-        if org is not None:
-            profile["weekendTeamRotationEnabled"] = bool(
-                getattr(org, "weekend_team_rotation_enabled", False)
-            )
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning(f"STAFFING PROFILE: unable to read organization settings: {exc}")
+    profile["weekendTeamRotationEnabled"] = roster.weekend_team_rotation_enabled
 
     if not nurses:
         return profile
 
-    try:
-        db_nurses = (
-            db.query(Nurse)
-            .filter(Nurse.organization_id == organization_id)
-            .all()
-        )
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning(f"STAFFING PROFILE: unable to read nurse roles: {exc}")
-        return profile
-
-    profile_by_key = {
-        _leave_name_key(db_nurse.name): {
-            "staffingRole": (getattr(db_nurse, "staffing_role", None) or "nurse"),
-            "staffingTeam": getattr(db_nurse, "team", None),
-        }
-        for db_nurse in db_nurses
-    }
-
     assistant_managers: List[str] = []
     for nurse in nurses:
-        db_profile = profile_by_key.get(_leave_name_key(nurse.get("name")))
-        if not db_profile:
+        roster_nurse = roster.get(nurse.get("name"))
+        if roster_nurse is None:
             nurse.setdefault("staffingRole", "nurse")
             continue
 
-        nurse["staffingRole"] = db_profile["staffingRole"]
-        nurse["team"] = db_profile["staffingTeam"]
+        nurse["staffingRole"] = roster_nurse.staffing_role
+        nurse["team"] = roster_nurse.team
         # Backward compatibility for downstream code that still reads weekendTeam.
-        nurse["weekendTeam"] = db_profile["staffingTeam"]
+        nurse["weekendTeam"] = roster_nurse.team
 
-        if db_profile["staffingRole"] == "assistant_manager":
+        if roster_nurse.staffing_role == "assistant_manager":
             assistant_managers.append(str(nurse.get("name")))
 
     if assistant_managers:
@@ -238,7 +238,7 @@ def enforce_leave_all_off(
         return 0
 
     on_leave = {
-        _leave_name_key(n.get("name"))
+        roster_name_key(n.get("name"))
         for n in nurses
         if (
             bool(n.get("isOnMaternityLeave"))
@@ -251,7 +251,7 @@ def enforce_leave_all_off(
 
     cleared = 0
     for nurse_name, row in schedule.items():
-        if _leave_name_key(nurse_name) not in on_leave:
+        if roster_name_key(nurse_name) not in on_leave:
             continue
         for day_idx in range(len(row)):
             shift = row[day_idx]
@@ -5484,6 +5484,28 @@ class RobustScheduler:
 
         logger.info("=" * 60)
 
+# Prompt budget for the constraints-parsing call; checked before any network call.
+OPTIMIZE_PROMPT_TOKEN_BUDGET = int(os.getenv("OPTIMIZE_PROMPT_TOKEN_BUDGET", "120000"))
+
+_POLICY_SUFFIX = """
+
+    NON-NEGOTIABLE SCHEDULING POLICY:
+    - `dayShift.count` and `nightShift.count` are strict MINIMUM floors, not exact quotas.
+    - Meeting or exceeding minimums is valid (e.g., 4 night nurses when minimum is 3 is acceptable).
+    - Prioritize preserving OCR assignments as much as possible.
+    - Ensure coverage across D/E/N timeslots (day/evening/night), not only aggregate totals.
+    - Respect minimum certification requirements (chemo/renal when provided by input constraints).
+    - Respect FT/PT targets using 14-day reconciliation (default FT=75h per 2 weeks, PT=45h per 2 weeks unless overridden) and nurse `maxWeeklyHours` from input data.
+    - For 12h lines, allow week-to-week variation (e.g., 3 shifts one week, 4 the next) while balancing over the pay period.
+    - For full-time nurses, prefer at least one worked weekend in each 14-day period when feasible.
+    - Use pay-period staffing reality: average daily staff ≈ (sum of nurse 14-day target hours) / (11.25 * number_of_days).
+    - Avoid unnecessary overstaffing spikes; keep daily totals close to this computed average while never dropping below minimums.
+    - Prefer schedules with senior nurse presence in each timeslot and avoid junior-only slot coverage when possible.
+    - Keep workload balanced across days and nurses while honoring off requests.
+    """
+_POLICY_SUFFIX_TOKENS = count_tokens(_POLICY_SUFFIX)
+
+
 class ScheduleOptimizer:
 
     @staticmethod
@@ -5651,7 +5673,8 @@ class ScheduleOptimizer:
 
     @staticmethod
     def build_prompt_for_constraints_parsing(req: OptimizeRequest, db: Session) -> str:
-        prompt_template = get_system_prompt(db).content
+        rendered = get_rendered_system_prompt(db)
+        prompt_template = rendered.content
         nurses_json = json.dumps(
             [n.dict() if hasattr(n, "dict") else n for n in req.nurses],
             indent=2,
@@ -5661,6 +5684,26 @@ class ScheduleOptimizer:
         notes = req.notes or "No additional notes"
         comments_json = json.dumps(req.comments or {}, indent=2, ensure_ascii=False)
 
+        # Reject over-long input before spending a network round trip (and
+        # three tenacity retries) on a request OpenAI would refuse anyway.
+        estimated_tokens = (
+            rendered.token_count
+            + _POLICY_SUFFIX_TOKENS
+            + count_tokens(nurses_json)
+            + count_tokens(assignments_json)
+            + count_tokens(notes)
+            + count_tokens(comments_json)
+        )
+        if estimated_tokens > OPTIMIZE_PROMPT_TOKEN_BUDGET:
+            raise HTTPException(
+                status_code=413,
+                detail=(
+                    f"Scheduling input is too large for the AI parser "
+                    f"(~{estimated_tokens} tokens, limit {OPTIMIZE_PROMPT_TOKEN_BUDGET}). "
+                    "Reduce the number of nurses, dates or comments and try again."
+                ),
+            )
+
         formatted_prompt = prompt_template.format(
             start_date=req.dates[0],
             end_date=req.dates[-1],
@@ -5672,22 +5715,7 @@ class ScheduleOptimizer:
 
         # Always append authoritative policy guidance so behavior remains consistent
         # even when a custom saved prompt is stale.
-        policy_suffix = """
-
-    NON-NEGOTIABLE SCHEDULING POLICY:
-    - `dayShift.count` and `nightShift.count` are strict MINIMUM floors, not exact quotas.
-    - Meeting or exceeding minimums is valid (e.g., 4 night nurses when minimum is 3 is acceptable).
-    - Prioritize preserving OCR assignments as much as possible.
-    - Ensure coverage across D/E/N timeslots (day/evening/night), not only aggregate totals.
-    - Respect minimum certification requirements (chemo/renal when provided by input constraints).
-    - Respect FT/PT targets using 14-day reconciliation (default FT=75h per 2 weeks, PT=45h per 2 weeks unless overridden) and nurse `maxWeeklyHours` from input data.
-    - For 12h lines, allow week-to-week variation (e.g., 3 shifts one week, 4 the next) while balancing over the pay period.
-    - For full-time nurses, prefer at least one worked weekend in each 14-day period when feasible.
-    - Use pay-period staffing reality: average daily staff ≈ (sum of nurse 14-day target hours) / (11.25 * number_of_days).
-    - Avoid unnecessary overstaffing spikes; keep daily totals close to this computed average while never dropping below minimums.
-    - Prefer schedules with senior nurse presence in each timeslot and avoid junior-only slot coverage when possible.
-    - Keep workload balanced across days and nurses while honoring off requests.
-    """
+        policy_suffix = _POLICY_SUFFIX
 
         return f"{formatted_prompt.rstrip()}\n{policy_suffix}"
 
@@ -8547,9 +8575,9 @@ async def optimize_with_preferences(
         new_schedule = OptimizedSchedule(
             schedule_id=req.schedule_id if req.schedule_id else None,
             organization_id=org_id,
-            result=payload,
             finalized=False,
         )
+        _save_schedule_payload(db, new_schedule, payload)
         db.add(new_schedule)
         db.commit()
         db.refresh(new_schedule)
@@ -8632,6 +8660,9 @@ async def optimize_with_constraints(
         
         ScheduleOptimizer.validate_constraints_structure(constraints)
 
+        # One roster read serves leave enforcement, staffing profile and defaults.
+        roster = load_roster_snapshot(db, auth.organization_id, auth.organization)
+
         # AUTHORITATIVE LEAVE CHECK: the database decides who is on
         # maternity/sick/sabbatical leave, not the incoming payload. This also
         # wipes any shifts carried over from the version being re-optimized, so
@@ -8641,6 +8672,7 @@ async def optimize_with_constraints(
             assignments,
             auth.organization_id,
             db,
+            roster=roster,
         )
 
         # Assistant managers and weekend-rotation groups come from the roster,
@@ -8649,27 +8681,16 @@ async def optimize_with_constraints(
             constraints.get("nurses", []),
             auth.organization_id,
             db,
+            roster=roster,
         )
         constraints["weekendTeamRotationEnabled"] = staffing_profile[
             "weekendTeamRotationEnabled"
         ]
 
-        # Build nurse_defaults from database for any nurses missing from the frontend payload
-        nurse_defaults = {}
-        org_id = auth.organization_id
-        if org_id:
-            db_nurses = db.query(Nurse).filter(Nurse.organization_id == org_id).all()
-            for db_nurse in db_nurses:
-                nurse_defaults[db_nurse.name.strip().lower()] = {
-                    "employmentType": db_nurse.employment_type or "full-time",
-                    "maxWeeklyHours": db_nurse.max_weekly_hours or 60,
-                    "targetBiWeeklyHours": db_nurse.bi_weekly_target_hours or 75,
-                    "isChemoCertified": db_nurse.is_chemo_certified or False,
-                    "isTransplantCertified": db_nurse.is_transplant_certified or False,
-                    "isRenalCertified": db_nurse.is_renal_certified or False,
-                    "isChargeCertified": db_nurse.is_charge_certified or False,
-                }
-            logger.info(f"Loaded {len(nurse_defaults)} nurse defaults from database")
+        # Roster defaults for any nurses missing from the frontend payload
+        nurse_defaults = roster.nurse_defaults() if roster else {}
+        if roster:
+            logger.info(f"Loaded {len(nurse_defaults)} nurse defaults from roster v{roster.version}")
         
         schedule = ScheduleOptimizer.optimize_schedule_with_ortools(
             assignments=assignments or {},
@@ -8691,7 +8712,9 @@ async def optimize_with_constraints(
             if existing_draft:
                 # Keep one draft lifecycle: update existing draft instead of creating duplicates
                 existing_draft.organization_id = org_id
-                existing_draft.result = _with_actor_metadata(schedule, auth, db)
+                _save_schedule_payload(db, existing_draft, _with_actor_metadata(schedule, auth, db))
+                if existing_draft.finalized:
+                    retract_shift_assignments(db, existing_draft)
                 existing_draft.finalized = False
                 # No updated_at column yet; refresh created_at so Recent Activity reflects latest draft changes
                 existing_draft.created_at = datetime.utcnow()
@@ -8703,9 +8726,9 @@ async def optimize_with_constraints(
             else:
                 new_schedule = OptimizedSchedule(
                     organization_id=org_id,
-                    result=_with_actor_metadata(schedule, auth, db),
                     finalized=False,
                 )
+                _save_schedule_payload(db, new_schedule, _with_actor_metadata(schedule, auth, db))
                 db.add(new_schedule)
                 db.commit()
                 db.refresh(new_schedule)
@@ -8715,7 +8738,7 @@ async def optimize_with_constraints(
         else:
             logger.info("Successfully optimized schedule (not saved to DB)")
         
-        return response_data
+        return FastJSONResponse(response_data)
     
     except HTTPException as e:
         raise e
@@ -8828,6 +8851,9 @@ async def optimize_schedule(
         # Preprocess all nurses from frontend
         all_nurses = ScheduleOptimizer.preprocess_nurse_data(req.nurses)
 
+        # One roster read serves leave enforcement, staffing profile and defaults.
+        roster = load_roster_snapshot(db, auth.organization_id, auth.organization)
+
         # AUTHORITATIVE LEAVE CHECK: the database is the source of truth for
         # maternity/sick/sabbatical leave. This also clears any shifts carried
         # over from a previous version of the schedule being re-optimized.
@@ -8836,6 +8862,7 @@ async def optimize_schedule(
             req.assignments,
             auth.organization_id,
             db,
+            roster=roster,
         )
 
         # Assistant managers and weekend-rotation groups come from the roster,
@@ -8844,6 +8871,7 @@ async def optimize_schedule(
             all_nurses,
             auth.organization_id,
             db,
+            roster=roster,
         )
         constraints["weekendTeamRotationEnabled"] = staffing_profile[
             "weekendTeamRotationEnabled"
@@ -8975,21 +9003,11 @@ async def optimize_schedule(
         logger.info("=" * 60)
 
         # Use RobustScheduler which GUARANTEES full coverage
-        # Build nurse_defaults from database for any nurses missing from the frontend payload
+        # Roster defaults for any nurses missing from the frontend payload
         nurse_defaults = {}
-        if auth.is_authenticated and auth.organization_id:
-            db_nurses = db.query(Nurse).filter(Nurse.organization_id == auth.organization_id).all()
-            for db_nurse in db_nurses:
-                nurse_defaults[db_nurse.name.strip().lower()] = {
-                    "employmentType": db_nurse.employment_type or "full-time",
-                    "maxWeeklyHours": db_nurse.max_weekly_hours or 60,
-                    "targetBiWeeklyHours": db_nurse.bi_weekly_target_hours or 75,
-                    "isChemoCertified": db_nurse.is_chemo_certified or False,
-                    "isTransplantCertified": db_nurse.is_transplant_certified or False,
-                    "isRenalCertified": db_nurse.is_renal_certified or False,
-                    "isChargeCertified": db_nurse.is_charge_certified or False,
-                }
-            logger.info(f"Loaded {len(nurse_defaults)} nurse defaults from database")
+        if auth.is_authenticated and roster:
+            nurse_defaults = roster.nurse_defaults()
+            logger.info(f"Loaded {len(nurse_defaults)} nurse defaults from roster v{roster.version}")
         
         schedule = ScheduleOptimizer.optimize_schedule_with_ortools(
             assignments=req.assignments or {},
@@ -9008,15 +9026,15 @@ async def optimize_schedule(
         new_schedule = OptimizedSchedule(
             schedule_id=req.schedule_id if req.schedule_id else None,
             organization_id=org_id,
-            result=schedule_payload,
             finalized=False,
         )
+        _save_schedule_payload(db, new_schedule, schedule_payload)
         db.add(new_schedule)
         db.commit()
         db.refresh(new_schedule)
 
         logger.info(f"Successfully optimized schedule with ID: {new_schedule.id}")
-        return {"optimized_schedule": schedule, "id": str(new_schedule.id)}
+        return model_response(OptimizeResponse(optimized_schedule=schedule, id=str(new_schedule.id)))
     
     except HTTPException as he:
         logger.error(f"HTTPException during optimization: {he.detail}")
@@ -9031,6 +9049,78 @@ async def optimize_schedule(
 # IMPORTANT: Specific routes must come BEFORE parameterized routes in FastAPI
 # Otherwise /{schedule_id} will match /refine and treat "refine" as an ID
 
+SCHEDULE_LIST_FIELDS = (
+    "id",
+    "family_root_id",
+    "schedule_id",
+    "organization_id",
+    "is_finalized",
+    "start_date",
+    "end_date",
+    "schedule_data",
+    "created_by",
+    "created_by_name",
+    "created_at",
+    "version",
+)
+
+
+def _encode_list_cursor(schedule: OptimizedSchedule) -> str:
+    raw = f"{schedule.created_at.isoformat()}|{schedule.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_list_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, schedule_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(schedule_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _resolve_actor_display_names(
+    db: Session,
+    organization_id: Optional[str],
+    actors: List[Tuple[Optional[str], Optional[str]]],
+) -> Dict[Tuple[Optional[str], Optional[str]], Optional[str]]:
+    """Batch version of _resolve_actor_display_name: two queries for a whole page."""
+    user_ids = {created_by for created_by, _ in actors if created_by}
+    nurse_names: Dict[str, str] = {}
+    member_names: Dict[str, str] = {}
+    if user_ids and organization_id:
+        nurse_rows = (
+            db.query(Nurse.user_id, Nurse.name)
+            .filter(Nurse.organization_id == organization_id, Nurse.user_id.in_(user_ids))
+            .all()
+        )
+        for user_id, name in nurse_rows:
+            if name:
+                nurse_names.setdefault(user_id, name)
+        member_rows = (
+            db.query(OrganizationMember.user_id, OrganizationMember.user_name, OrganizationMember.user_email)
+            .filter(
+                OrganizationMember.organization_id == organization_id,
+                OrganizationMember.user_id.in_(user_ids),
+            )
+            .all()
+        )
+        for user_id, user_name, user_email in member_rows:
+            if user_name or user_email:
+                member_names.setdefault(user_id, user_name or user_email)
+
+    resolved = {}
+    for created_by, created_by_name in actors:
+        resolved[(created_by, created_by_name)] = (
+            nurse_names.get(created_by)
+            or member_names.get(created_by)
+            or (created_by_name if created_by_name and created_by_name != created_by else None)
+            or created_by
+            or created_by_name
+        )
+    return resolved
+
+
 # Registered with and without the trailing slash to avoid a 307 redirect
 # round trip from the Next.js proxy on every dashboard load.
 @router.get("", include_in_schema=False)
@@ -9040,72 +9130,196 @@ async def list_optimized_schedules(
         True,
         description="Include full schedule_data payload in each row",
     ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated subset of fields to return; overrides include_schedule_data",
+    ),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from a previous page's X-Next-Cursor header",
+    ),
+    start_date: Optional[str] = Query(None, description="Only schedules whose period ends on or after this date"),
+    end_date: Optional[str] = Query(None, description="Only schedules whose period starts on or before this date"),
+    finalized: Optional[bool] = Query(None, description="Filter by finalized status"),
+    family_id: Optional[str] = Query(None, description="Only revisions of this family root"),
     auth: AuthContext = Depends(get_optional_auth),
     db: Session = Depends(get_db)
 ):
-    """List optimized schedules for the current organization, most recent first"""
+    """
+    List optimized schedules for the current organization, most recent first.
+
+    Pages are keyset-paginated on (created_at, id); when more rows exist the
+    cursor for the next page is returned in the ``X-Next-Cursor`` header.
+    Without ``schedule_data`` in the requested fields, payload columns are
+    never loaded and each row is served from its summary columns.
+    """
     # If no organization context, return empty list - never expose all schedules
     if not auth.is_authenticated or not auth.organization_id:
         return []
-    
-    query = db.query(OptimizedSchedule)
-    
+
+    requested_fields = None
+    if fields:
+        requested_fields = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = requested_fields - set(SCHEDULE_LIST_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+    wants_payload = (
+        "schedule_data" in requested_fields
+        if requested_fields is not None
+        else include_schedule_data
+    )
+
     # Filter strictly by organization - no legacy NULL fallback to prevent data leakage
-    query = query.filter(OptimizedSchedule.organization_id == auth.organization_id)
-    
-    schedules = query.order_by(OptimizedSchedule.created_at.desc()).limit(50).all()
-    schedule_lookup = {str(s.id): s for s in schedules}
+    query = db.query(OptimizedSchedule).filter(
+        OptimizedSchedule.organization_id == auth.organization_id
+    )
+    if not wants_payload:
+        query = query.options(defer(OptimizedSchedule.result), defer(OptimizedSchedule.delta))
+    if start_date:
+        query = query.filter(OptimizedSchedule.period_end >= start_date)
+    if end_date:
+        query = query.filter(OptimizedSchedule.period_start <= end_date)
+    if finalized is not None:
+        query = query.filter(OptimizedSchedule.finalized == finalized)
+    if family_id:
+        try:
+            family_uuid = uuid.UUID(family_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid family_id")
+        query = query.filter(
+            or_(
+                OptimizedSchedule.family_root_id == family_uuid,
+                OptimizedSchedule.id == family_uuid,
+            )
+        )
+    if cursor:
+        cursor_created_at, cursor_id = _decode_list_cursor(cursor)
+        query = query.filter(
+            tuple_(OptimizedSchedule.created_at, OptimizedSchedule.id)
+            < tuple_(cursor_created_at, cursor_id)
+        )
+
+    schedules = (
+        query.order_by(OptimizedSchedule.created_at.desc(), OptimizedSchedule.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    headers = None
+    if len(schedules) > limit:
+        schedules = schedules[:limit]
+        headers = {"X-Next-Cursor": _encode_list_cursor(schedules[-1])}
+
+    # Legacy rows from before the summary columns (family_root_id still NULL)
+    # are summarized from their payload here; backfill_schedule_summaries.py
+    # stamps them. The listing itself never writes.
+    payloads: Dict[str, Dict[str, Any]] = {}
+    summaries: Dict[str, Tuple[str, str, Optional[str], Optional[str]]] = {}
+    for s in schedules:
+        if s.family_root_id is None:
+            payload = payloads[str(s.id)] = load_schedule_payload(db, s)
+            schedule_data = _normalize_schedule_payload(payload)
+            start_date, end_date = _resolve_schedule_date_range(payload, schedule_data)
+            summaries[str(s.id)] = (
+                start_date or "",
+                end_date or "",
+                *_extract_schedule_actor(payload, schedule_data),
+            )
+        else:
+            summaries[str(s.id)] = (s.period_start or "", s.period_end or "", s.created_by, s.created_by_name)
+
+    display_names = _resolve_actor_display_names(
+        db,
+        auth.organization_id,
+        [summary[2:] for summary in summaries.values()],
+    )
+
     result = []
     for s in schedules:
-        result_data = s.result or {}
-        schedule_data = _normalize_schedule_payload(result_data)
-        start_date, end_date = _resolve_schedule_date_range(result_data, schedule_data)
-        created_by, created_by_name = _extract_schedule_actor(result_data, schedule_data)
-        display_name = _resolve_actor_display_name(
-            db,
-            s.organization_id,
-            created_by,
-            created_by_name,
-        )
-        
-        result.append({
+        schedule_data = {}
+        if wants_payload:
+            payload = payloads.get(str(s.id))
+            if payload is None:
+                payload = load_schedule_payload(db, s)
+            schedule_data = _normalize_schedule_payload(payload)
+
+        start_date, end_date, created_by, created_by_name = summaries[str(s.id)]
+        row = {
             "id": str(s.id),
-            "family_root_id": _schedule_revision_root(s, schedule_lookup),
+            "family_root_id": str(s.family_root_id or s.id),
             "schedule_id": str(s.schedule_id) if s.schedule_id else None,
             "organization_id": s.organization_id,
             "is_finalized": s.finalized,
             "start_date": start_date,
             "end_date": end_date,
-            "schedule_data": schedule_data if include_schedule_data else {},
+            "schedule_data": schedule_data,
             "created_by": created_by,
-            "created_by_name": display_name,
+            "created_by_name": display_names.get((created_by, created_by_name)),
             "created_at": s.created_at.isoformat() if s.created_at else None,
-        })
-    return result
+            "version": s.version,
+        }
+        if requested_fields is not None:
+            row = {key: value for key, value in row.items() if key in requested_fields}
+        result.append(row)
+    return FastJSONResponse(result, headers=headers)
+
+# Serialized bodies of finalized versions, keyed by their row-version ETag.
+_finalized_schedule_bodies = ImmutableBodyCache(maxsize=64)
+
+
+def _schedule_etag(schedule: OptimizedSchedule) -> str:
+    """Row-version ETag: changes whenever the payload or finalized flag changes."""
+    state = "f" if schedule.finalized else "d"
+    return f'"{schedule.id}-v{schedule.version}-{state}"'
+
 
 # Parameterized routes come last to avoid matching specific paths
 @router.get("/{schedule_id}")
 async def get_optimized_schedule(
     schedule_id: str,
+    request: Request,
     auth: AuthContext = Depends(get_optional_auth),
     db: Session = Depends(get_db),
 ):
-    """Get a specific optimized schedule by ID"""
+    """
+    Get a specific optimized schedule by ID.
+
+    The ETag is derived from the row version, so a matching If-None-Match is
+    answered with 304 before the payload is loaded, and the body holds only
+    data stored with that version. Finalized versions are additionally
+    served from an in-process cache of serialized bodies.
+    """
     try:
-        schedule = _get_scoped_schedule_or_404(db, auth, schedule_id)
-        
-        result_data = schedule.result or {}
+        schedule = (
+            _scoped_schedule_query(db, auth, schedule_id)
+            .options(defer(OptimizedSchedule.result), defer(OptimizedSchedule.delta))
+            .first()
+        )
+        if not schedule:
+            raise HTTPException(status_code=404, detail="Schedule not found")
+
+        etag = _schedule_etag(schedule)
+        cache_control = CACHE_FINALIZED_SCHEDULE if schedule.finalized else CACHE_REVALIDATE
+        if request_is_fresh(request, etag):
+            return not_modified(etag, cache_control)
+        if schedule.finalized:
+            cached = _finalized_schedule_bodies.get(etag)
+            if cached:
+                return json_body_response(cached[1], etag, cache_control)
+
+        result_data = load_schedule_payload(db, schedule)
         schedule_data = _normalize_schedule_payload(result_data)
         start_date, end_date = _resolve_schedule_date_range(result_data, schedule_data)
         created_by, created_by_name = _extract_schedule_actor(result_data, schedule_data)
-        display_name = _resolve_actor_display_name(
-            db,
-            schedule.organization_id,
-            created_by,
-            created_by_name,
-        )
-        
-        return {
+        # Only the name stored with this version: a name resolved from the
+        # (mutable) nurse/member rows is not covered by the row-version ETag
+        # or the finalized body cache.
+        display_name = schedule.created_by_name or created_by_name or created_by
+
+        body = render_json({
             "id": str(schedule.id),
             "family_root_id": _schedule_revision_root(schedule),
             "schedule_id": str(schedule.schedule_id) if schedule.schedule_id else None,
@@ -9117,7 +9331,11 @@ async def get_optimized_schedule(
             "created_by": created_by,
             "created_by_name": display_name,
             "created_at": schedule.created_at.isoformat() if schedule.created_at else None,
-        }
+            "version": schedule.version,
+        })
+        if schedule.finalized:
+            _finalized_schedule_bodies.put(etag, etag, body)
+        return json_body_response(body, etag, cache_control)
     except HTTPException:
         raise
     except Exception as e:
@@ -9136,6 +9354,7 @@ async def finalize_schedule(
         schedule = _get_scoped_schedule_or_404(db, auth, schedule_id)
         
         schedule.finalized = True
+        publish_shift_assignments(db, schedule)
         db.commit()
         db.refresh(schedule)
         
@@ -9148,9 +9367,8 @@ async def finalize_schedule(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _extract_revision_parent_id(schedule) -> Optional[str]:
-    """Return the direct revision parent id for a schedule, if present."""
-    result_data = schedule.result or {}
+def _extract_payload_revision_parent_id(result_data: Any) -> Optional[str]:
+    """Return the revision_of id referenced by a schedule payload, if present."""
     schedule_data = _normalize_schedule_payload(result_data)
 
     root = None
@@ -9166,15 +9384,121 @@ def _extract_revision_parent_id(schedule) -> Optional[str]:
     return str(root) if root else None
 
 
+def _extract_revision_parent_id(schedule) -> Optional[str]:
+    """Return the direct revision parent id for a schedule, if present."""
+    # Delta rows are always stored against their revision_of parent.
+    if is_delta_stored(schedule):
+        return str(schedule.delta_base_id)
+    return _extract_payload_revision_parent_id(schedule.result or {})
+
+
+def _resolve_revision_base(
+    db: Session,
+    organization_id: Optional[str],
+    payload: Any,
+    exclude_id: Any = None,
+) -> Optional[OptimizedSchedule]:
+    """Load the revision_of parent of a payload so it can serve as a delta base."""
+    parent_id = _extract_payload_revision_parent_id(payload)
+    if not parent_id or not organization_id:
+        return None
+    if exclude_id is not None and parent_id == str(exclude_id):
+        return None
+    try:
+        parent_uuid = uuid.UUID(parent_id)
+    except ValueError:
+        return None
+    return (
+        db.query(OptimizedSchedule)
+        .filter(
+            OptimizedSchedule.id == parent_uuid,
+            OptimizedSchedule.organization_id == organization_id,
+        )
+        .first()
+    )
+
+
+def _compute_family_root(db: Session, schedule) -> Any:
+    """Resolve a schedule's family root id, preferring stamped family_root_id values."""
+    current = schedule
+    visited = set()
+    while current.family_root_id is None:
+        visited.add(str(current.id))
+        parent_id = _extract_revision_parent_id(current)
+        if not parent_id or parent_id in visited:
+            return current.id
+        try:
+            parent_uuid = uuid.UUID(parent_id)
+        except ValueError:
+            return current.id
+        parent = db.get(OptimizedSchedule, parent_uuid)
+        if parent is None:
+            # Same convention as _schedule_revision_root: an unknown ancestor
+            # still names the family.
+            return parent_uuid
+        current = parent
+    return current.family_root_id
+
+
+def _stamp_schedule_summary(
+    db: Session,
+    schedule: OptimizedSchedule,
+    payload: Dict[str, Any],
+    base: Optional[OptimizedSchedule],
+) -> None:
+    """Copy listing fields (period, actor, family root) from the payload onto columns."""
+    schedule_data = _normalize_schedule_payload(payload)
+    start_date, end_date = _resolve_schedule_date_range(payload, schedule_data)
+    created_by, created_by_name = _extract_schedule_actor(payload, schedule_data)
+    schedule.period_start = start_date or None
+    schedule.period_end = end_date or None
+    schedule.created_by = created_by
+    schedule.created_by_name = created_by_name
+
+    if base is not None:
+        schedule.family_root_id = _compute_family_root(db, base)
+        return
+    parent_id = _extract_payload_revision_parent_id(payload)
+    try:
+        parent_uuid = uuid.UUID(parent_id) if parent_id else None
+    except ValueError:
+        parent_uuid = None
+    if parent_uuid is None or parent_uuid == schedule.id:
+        schedule.family_root_id = schedule.id
+        return
+    parent = db.get(OptimizedSchedule, parent_uuid)
+    schedule.family_root_id = _compute_family_root(db, parent) if parent else parent_uuid
+
+
+def _save_schedule_payload(
+    db: Session,
+    schedule: OptimizedSchedule,
+    payload: Dict[str, Any],
+) -> None:
+    """Persist a schedule payload (delta or snapshot) and stamp its summary columns.
+
+    ``schedule.organization_id`` must already be set; the caller commits.
+    """
+    if schedule.id is None:
+        schedule.id = uuid.uuid4()
+    base = _resolve_revision_base(db, schedule.organization_id, payload, exclude_id=schedule.id)
+    store_schedule_payload(db, schedule, payload, base=base)
+    _stamp_schedule_summary(db, schedule, payload, base)
+
+
 def _schedule_revision_root(
     schedule,
     schedule_lookup: Optional[Dict[str, Any]] = None,
 ) -> str:
     """Return the canonical root id of a revision family.
 
-    Revisions may be chained (A -> B -> C). We walk parent pointers until we
-    reach the earliest known ancestor so all descendants stay in one family.
+    Revisions may be chained (A -> B -> C). Rows written since the summary
+    columns exist carry family_root_id; for legacy rows we walk parent
+    pointers until we reach the earliest known ancestor.
     """
+    if schedule.family_root_id is not None:
+        return str(schedule.family_root_id)
+
     current_id = str(schedule.id)
     parent_id = _extract_revision_parent_id(schedule)
     if not parent_id:
@@ -9205,7 +9529,7 @@ def _schedule_revision_root(
 
 
 def _serialize_version_entry(db: Session, schedule) -> Dict[str, Any]:
-    result_data = schedule.result or {}
+    result_data = load_schedule_payload(db, schedule)
     schedule_data = _normalize_schedule_payload(result_data)
     start_date, end_date = _resolve_schedule_date_range(result_data, schedule_data)
     created_by, created_by_name = _extract_schedule_actor(result_data, schedule_data)
@@ -9281,6 +9605,37 @@ async def list_schedule_versions(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{schedule_id}/diff/{other_id}")
+async def diff_schedule_versions(
+    schedule_id: str,
+    other_id: str,
+    auth: AuthContext = Depends(get_optional_auth),
+    db: Session = Depends(get_db),
+):
+    """
+    Return the JSON-Patch operations that turn one schedule into another.
+
+    When the target is stored as a delta against the source the ops come
+    straight from storage; otherwise both payloads are materialized and diffed.
+    """
+    try:
+        source = _get_scoped_schedule_or_404(db, auth, schedule_id)
+        target = _get_scoped_schedule_or_404(db, auth, other_id)
+
+        operations, origin = diff_schedules(db, source, target)
+        return {
+            "from_id": str(source.id),
+            "to_id": str(target.id),
+            "source": origin,
+            "operations": operations,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error diffing schedules: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{schedule_id}/promote")
 async def promote_schedule_version(
     schedule_id: str,
@@ -9305,6 +9660,11 @@ async def promote_schedule_version(
 
         for sibling in family:
             sibling.finalized = str(sibling.id) == str(schedule.id)
+        publish_shift_assignments(
+            db,
+            schedule,
+            superseded_ids=[s.id for s in family if s.id != schedule.id],
+        )
 
         db.commit()
         db.refresh(schedule)
@@ -9341,9 +9701,9 @@ async def create_draft_schedule(
 
         new_schedule = OptimizedSchedule(
             organization_id=org_id,
-            result=payload,
             finalized=False,
         )
+        _save_schedule_payload(db, new_schedule, payload)
         db.add(new_schedule)
         db.commit()
         db.refresh(new_schedule)
@@ -9352,6 +9712,7 @@ async def create_draft_schedule(
         return {
             "success": True,
             "id": str(new_schedule.id),
+            "version": new_schedule.version,
             "finalized": False,
             "message": "Draft schedule created successfully"
         }
@@ -9361,23 +9722,103 @@ async def create_draft_schedule(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """Parse an If-Match header carrying a draft version ETag ("7", W/"7" or 7)."""
+    if not if_match or if_match.strip() == "*":
+        return None
+    token = if_match.split(",")[0].strip()
+    if token.startswith("W/"):
+        token = token[2:]
+    try:
+        return int(token.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must carry a schedule version")
+
+
+def _is_draft_patch_body(body: Any) -> bool:
+    """True when a draft body is a partial update rather than a payload merge."""
+    if isinstance(body, list):
+        return True
+    return (
+        isinstance(body, dict)
+        and bool(body)
+        and set(body) <= {"base_version", "operations", "cells"}
+        and ("operations" in body or "cells" in body)
+    )
+
+
 @router.patch("/{schedule_id}/draft")
 async def update_draft_schedule(
     schedule_id: str,
-    schedule_data: Dict[str, Any],
+    response: Response,
+    schedule_data: Union[List[Dict[str, Any]], Dict[str, Any]] = Body(...),
+    if_match: Optional[str] = Header(None, alias="If-Match"),
     auth: AuthContext = Depends(get_optional_auth),
     db: Session = Depends(get_db)
 ):
-    """Update an existing draft schedule payload and refresh activity timestamp."""
+    """
+    Update an existing draft schedule and refresh its activity timestamp.
+
+    Accepts three body shapes:
+      - a JSON array of RFC 6902 operations,
+      - ``{"base_version", "operations", "cells"}`` (see DraftPatchRequest),
+      - any other object, shallow-merged into the stored payload (legacy).
+
+    Partial updates are applied server-side and answer with the new version
+    plus the ops for any server-side corrections, instead of the roster.
+    ``If-Match`` / ``base_version`` must match the stored version or the
+    request fails with 412 / 409.
+    """
     try:
         schedule = _get_mutable_schedule_or_404(db, auth, schedule_id)
+        expected_version = _parse_if_match(if_match)
+        is_partial = _is_draft_patch_body(schedule_data)
+        patch_request = None
+        if is_partial:
+            try:
+                patch_request = (
+                    DraftPatchRequest(operations=schedule_data)
+                    if isinstance(schedule_data, list)
+                    else DraftPatchRequest(**schedule_data)
+                )
+            except ValidationError as exc:
+                raise HTTPException(status_code=422, detail=f"Invalid draft patch: {exc}")
+
+        if expected_version is not None or (patch_request and patch_request.base_version is not None):
+            # Lock the row so concurrent autosaves serialize on the version check.
+            db.refresh(schedule, with_for_update=True)
+        if expected_version is not None and expected_version != schedule.version:
+            raise HTTPException(
+                status_code=412,
+                detail=f"Draft has changed (current version {schedule.version})",
+            )
+        if patch_request and patch_request.base_version is not None and patch_request.base_version != schedule.version:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Draft has changed (current version {schedule.version})",
+            )
 
-        existing_payload = schedule.result if isinstance(schedule.result, dict) else {}
-        patch_payload = schedule_data if isinstance(schedule_data, dict) else {}
-        merged_payload = _with_actor_metadata({**existing_payload, **patch_payload}, auth, db)
+        existing_payload = load_schedule_payload(db, schedule)
+        if patch_request:
+            try:
+                client_payload = apply_patch(existing_payload, patch_request.operations)
+                client_payload = apply_cell_edits(
+                    client_payload,
+                    [edit.model_dump() for edit in patch_request.cells],
+                )
+            except JsonPatchError as exc:
+                raise HTTPException(status_code=422, detail=f"Invalid draft patch: {exc}")
+            if not isinstance(client_payload, dict):
+                raise HTTPException(status_code=422, detail="Invalid draft patch: payload must stay an object")
+        else:
+            patch_payload = schedule_data if isinstance(schedule_data, dict) else {}
+            client_payload = {**existing_payload, **patch_payload}
+        merged_payload = _with_actor_metadata(client_payload, auth, db)
 
         schedule.organization_id = auth.organization_id if auth.is_authenticated else schedule.organization_id
-        schedule.result = merged_payload
+        _save_schedule_payload(db, schedule, merged_payload)
+        if schedule.finalized:
+            retract_shift_assignments(db, schedule)
         schedule.finalized = False
         # No updated_at column exists, so use created_at as latest activity timestamp
         schedule.created_at = datetime.utcnow()
@@ -9385,14 +9826,23 @@ async def update_draft_schedule(
         db.commit()
         db.refresh(schedule)
 
-        logger.info(f"Draft schedule {schedule_id} updated")
+        response.headers["ETag"] = f'"{schedule.version}"'
+        logger.info(f"Draft schedule {schedule_id} updated to version {schedule.version}")
+        if patch_request:
+            return {
+                "id": str(schedule.id),
+                "version": schedule.version,
+                "corrections": diff_payloads(client_payload, merged_payload),
+            }
         return {
             "success": True,
             "id": str(schedule.id),
+            "version": schedule.version,
             "finalized": False,
             "message": "Draft updated successfully"
         }
     except HTTPException:
+        db.rollback()
         raise
     except Exception as e:
         logger.error(f"Error updating draft schedule: {str(e)}")
@@ -9425,8 +9875,10 @@ async def save_and_finalize_schedule(
 
         if existing_draft:
             existing_draft.organization_id = org_id
-            existing_draft.result = _with_actor_metadata(schedule_data, auth, db)
+            payload = _with_actor_metadata(schedule_data, auth, db)
+            _save_schedule_payload(db, existing_draft, payload)
             existing_draft.finalized = True
+            publish_shift_assignments(db, existing_draft, payload)
             # Surface finalize action in Recent Activity ordering
             existing_draft.created_at = datetime.utcnow()
             db.commit()
@@ -9444,10 +9896,12 @@ async def save_and_finalize_schedule(
 
         new_schedule = OptimizedSchedule(
             organization_id=org_id,
-            result=payload,
             finalized=True,  # Immediately finalized
         )
+        _save_schedule_payload(db, new_schedule, payload)
         db.add(new_schedule)
+        db.flush()
+        publish_shift_assignments(db, new_schedule, payload)
         db.commit()
         db.refresh(new_schedule)
 
@@ -9474,7 +9928,7 @@ async def delete_schedule(
     try:
         schedule = _get_scoped_schedule_or_404(db, auth, schedule_id)
 
-        schedule_payload = getattr(schedule, "schedule_data", None) or getattr(schedule, "result", None)
+        schedule_payload = getattr(schedule, "schedule_data", None) or load_schedule_payload(db, schedule)
         if isinstance(schedule_payload, str):
             try:
                 schedule_payload = json.loads(schedule_payload)
@@ -9516,6 +9970,7 @@ async def delete_schedule(
             auth=auth,
             organization_id=getattr(schedule, "organization_id", None),
         )
+        prepare_schedule_delete(db, schedule)
         db.delete(schedule)
         db.commit()
 
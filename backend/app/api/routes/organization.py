@@ -3,7 +3,7 @@ import logging
 import secrets
 import re
 from typing import Any, Dict, List
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from clerk_backend_api import Clerk
@@ -27,7 +27,9 @@ from app.core.auth import (
     RequiredAuth, OrgAuth, AdminAuth, AuthContext,
     get_required_auth, get_org_required_auth, get_admin_auth, require_permission
 )
+from app.core.cache_bus import publish_invalidation
 from app.api.routes.notification import create_notification
+from app.core.http_cache import CACHE_REFERENCE_DATA, json_response_with_etag
 from app.core.config import settings
 
 router = APIRouter()
@@ -174,6 +176,7 @@ def create_organization(
         db.add(member)
         db.commit()
         db.refresh(org)
+        publish_invalidation("organization_members", org.id)
         
         logger.info(f"Created organization '{org.name}' (id={org.id}) by user {auth.user_id}")
         return org
@@ -328,6 +331,7 @@ def update_organization(
     
     db.commit()
     db.refresh(org)
+    publish_invalidation("organizations", org_id)
     
     return org
 
@@ -389,6 +393,7 @@ def update_role_permissions(
 
     db.commit()
     db.refresh(org)
+    publish_invalidation("organizations", org_id)
 
     return {
         "available_permissions": DELEGATABLE_PERMISSIONS,
@@ -401,14 +406,22 @@ def update_role_permissions(
 @router.get("/{org_id}/config-options", response_model=OrganizationConfigOptions)
 def get_organization_config_options(
     org_id: str,
+    request: Request,
     auth: AuthContext = Depends(get_org_required_auth),
     db: Session = Depends(get_db)
 ):
-    """Get shared org-scoped teams and rooms options for members."""
+    """Get shared org-scoped teams and rooms options for members.
+
+    Served with a content ETag; unchanged options revalidate as 304.
+    """
     if auth.organization_id != org_id:
         raise HTTPException(status_code=403, detail="Cannot view a different organization")
 
-    return _current_org_config(auth.organization)
+    return json_response_with_etag(
+        request,
+        _current_org_config(auth.organization),
+        cache_control=CACHE_REFERENCE_DATA,
+    )
 
 
 @router.patch("/{org_id}/config-options", response_model=OrganizationConfigOptions)
@@ -440,6 +453,7 @@ def update_organization_config_options(
 
     db.commit()
     db.refresh(org)
+    publish_invalidation("organizations", org_id)
     return _current_org_config(org)
 
 
@@ -458,6 +472,7 @@ def delete_organization(
     org = auth.organization
     org.is_active = False
     db.commit()
+    publish_invalidation("organizations", org_id)
     
     logger.info(f"Organization '{org.name}' (id={org.id}) deleted by user {auth.user_id}")
     return {"message": "Organization deleted"}
@@ -497,6 +512,7 @@ def join_organization(
             existing.is_active = True
             db.commit()
             db.refresh(existing)
+            publish_invalidation("organization_members", org.id)
             return existing
     
     # Create membership with default nurse role — pending admin approval
@@ -511,6 +527,7 @@ def join_organization(
     db.add(member)
     db.commit()
     db.refresh(member)
+    publish_invalidation("organization_members", org.id)
     
     logger.info(f"User {auth.user_id} requested to join organization '{org.name}' (pending approval)")
     return member
@@ -531,6 +548,7 @@ def regenerate_invite_code(
     org = auth.organization
     org.invite_code = generate_invite_code()
     db.commit()
+    publish_invalidation("organizations", org_id)
     
     return {
         "invite_code": org.invite_code,
@@ -627,6 +645,7 @@ def approve_member(
     member.is_approved = True
     db.commit()
     db.refresh(member)
+    publish_invalidation("organization_members", org_id)
     
     logger.info(f"Admin {auth.user_id} approved member {member.user_email or member.user_id} in org {org_id}")
     return member
@@ -659,6 +678,7 @@ def reject_member(
     
     member.is_active = False
     db.commit()
+    publish_invalidation("organization_members", org_id)
     
     logger.info(f"Admin {auth.user_id} rejected member {member.user_email or member.user_id} in org {org_id}")
     return {"message": "Member request rejected"}
@@ -737,6 +757,7 @@ def update_member(
     
     db.commit()
     db.refresh(member)
+    publish_invalidation("organization_members", org_id)
     
     return member
 
@@ -812,6 +833,7 @@ def transfer_admin_role(
 
     db.commit()
     db.refresh(target_member)
+    publish_invalidation("organization_members", org_id)
 
     logger.info(
         f"Admin role transferred in org {org_id}: {auth.user_id} -> {target_member.user_id}"
@@ -859,6 +881,7 @@ def remove_member(
     # Soft delete
     member.is_active = False
     db.commit()
+    publish_invalidation("organization_members", org_id)
     
     return {"message": "Member removed"}
 
@@ -896,6 +919,7 @@ def leave_organization(
     
     auth.membership.is_active = False
     db.commit()
+    publish_invalidation("organization_members", org_id)
     
     return {"message": "Left organization"}
 
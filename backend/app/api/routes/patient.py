@@ -1,7 +1,9 @@
 """API routes for Patient management."""
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from uuid import uuid4
 from app.db.deps import get_db
 from app.models.patient import Patient
 from app.schemas.patient import (
@@ -214,28 +216,43 @@ def create_patients_bulk(
         raise HTTPException(status_code=401, detail="Authentication required")
     
     org_id = auth.organization_id
-    created_patients = []
-    
-    for patient_data in patients_data:
-        # Skip if MRN already exists
-        existing_query = db.query(Patient).filter(
-            Patient.mrn == patient_data.mrn,
+
+    # Skip MRNs that already belong to an active patient (or repeat within
+    # this batch). Patients without an MRN are always created.
+    requested_mrns = {p.mrn for p in patients_data if p.mrn}
+    taken_mrns = {
+        row.mrn
+        for row in db.query(Patient.mrn).filter(
+            Patient.mrn.in_(requested_mrns),
             Patient.is_active == True,
-            Patient.organization_id == org_id
+            Patient.organization_id == org_id,
         )
-        
-        existing = existing_query.first()
-        
-        if existing:
-            continue
-        
-        patient = Patient(**patient_data.model_dump(), organization_id=org_id)
-        db.add(patient)
-        created_patients.append(patient)
-    
+    } if requested_mrns else set()
+
+    new_rows = []
+    for patient_data in patients_data:
+        if patient_data.mrn:
+            if patient_data.mrn in taken_mrns:
+                continue
+            taken_mrns.add(patient_data.mrn)
+        new_rows.append({
+            **patient_data.model_dump(),
+            "id": str(uuid4()),
+            "organization_id": org_id,
+            "is_active": True,
+        })
+    if not new_rows:
+        return []
+
+    # One multi-row INSERT ... RETURNING instead of an INSERT per patient
+    created_ids = db.scalars(
+        insert(Patient).returning(Patient.id, sort_by_parameter_order=True),
+        new_rows,
+    ).all()
     db.commit()
-    
-    for patient in created_patients:
-        db.refresh(patient)
-    
-    return created_patients
+
+    by_id = {
+        patient.id: patient
+        for patient in db.query(Patient).filter(Patient.id.in_(created_ids))
+    }
+    return [by_id[patient_id] for patient_id in created_ids if patient_id in by_id]
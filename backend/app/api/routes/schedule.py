@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.db.deps import get_db
 from app.models.schedule import Schedule
 from app.schemas.schedule import ScheduleCreate
-from app.core.auth import get_optional_auth, AuthContext, OrgAuth
+from app.core.auth import get_optional_auth, AuthContext, OrgAuth, AdminAuth
 import uuid, shutil, os, json, re
-from app.services.textract_parser import parse_schedule_from_image
+from app.services.ocr_cache import ocr_cache
+from app.services.textract_parser import parse_schedule_from_images
 
 router = APIRouter(redirect_slashes=True)
 
@@ -16,6 +18,9 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 # Allowed file extensions for uploads (security)
 ALLOWED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.pdf'}
 
+# Pages accepted by one multi-image upload-schedule request.
+MAX_SCHEDULE_IMAGES = 20
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -50,29 +55,59 @@ def validate_file_extension(filename: str) -> bool:
 
 @router.post("/upload-schedule/")
 async def upload_schedule(
-    file: UploadFile = File(...),
+    file: Optional[UploadFile] = File(None),
+    files: Optional[List[UploadFile]] = File(None),
     start_date: str = Form(...),
     end_date: str = Form(...),
+    refresh_ocr: bool = Form(False),
     auth: AuthContext = Depends(get_optional_auth)
 ):
-    """Upload and parse a schedule image. Requires authentication."""
+    """
+    Upload and parse a schedule image. Requires authentication.
+
+    Send one ``file``, or several ``files`` for a roster split across
+    images: pages are OCR'd concurrently and merged into one grid, with
+    per-page failures listed under ``errors``. Images already parsed for
+    the same date range are served from the OCR cache; ``refresh_ocr``
+    forces a new Textract call.
+    """
     if not auth.is_authenticated:
         raise HTTPException(status_code=401, detail="Authentication required")
-    
+
+    uploads = ([file] if file else []) + list(files or [])
+    if not uploads:
+        raise HTTPException(status_code=400, detail="No schedule image uploaded")
+    if len(uploads) > MAX_SCHEDULE_IMAGES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SCHEDULE_IMAGES} images per upload")
+
     # Validate file extension
-    if not validate_file_extension(file.filename or ""):
-        raise HTTPException(status_code=400, detail=f"File type not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}")
-    
-    contents = await file.read()
+    for upload in uploads:
+        if not validate_file_extension(upload.filename or ""):
+            raise HTTPException(status_code=400, detail=f"File type not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}")
+
+    contents = [await upload.read() for upload in uploads]
     try:
         from datetime import datetime
         start = datetime.strptime(start_date, "%Y-%m-%d").date()
         end = datetime.strptime(end_date, "%Y-%m-%d").date()
 
-        result = parse_schedule_from_image(contents, start, end)
+        # Textract calls block; keep them off the event loop.
+        result = await run_in_threadpool(
+            parse_schedule_from_images, contents, start, end, bypass_cache=refresh_ocr
+        )
         return result
     except Exception as e:
         return {"error": str(e)}
+
+
+@router.get("/ocr-cache-stats")
+async def get_ocr_cache_stats(auth: AdminAuth):
+    """
+    OCR cache counters for this worker (memory_hits, db_hits, misses,
+    bypassed, stored, store_failed, hit_rate).
+    Admin only.
+    """
+    return ocr_cache.stats()
     
 
 @router.post("/")
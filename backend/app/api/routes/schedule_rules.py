@@ -1,5 +1,5 @@
 """Schedule Rules API routes - persist and retrieve scheduling rules per org."""
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from typing import Optional, List
@@ -13,10 +13,33 @@ from app.schemas.schedule_rule import (
     ScheduleRuleResponse,
 )
 from app.core.auth import OrgAuth
+from app.core.cache_bus import publish_invalidation, register_invalidator
+from app.core.http_cache import (
+    CACHE_REVALIDATE,
+    compute_etag,
+    json_body_response,
+    not_modified,
+    render_json,
+    request_is_fresh,
+)
+from app.core.ttl_cache import TTLCache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Serialized (etag, body) of the latest rule per organization.
+_latest_rule_bodies = TTLCache(maxsize=512, ttl=300)
+
+
+def _evict_latest_rule_bodies(organization_id: Optional[str]) -> None:
+    if organization_id is None:
+        _latest_rule_bodies.clear()
+    else:
+        _latest_rule_bodies.pop(organization_id)
+
+
+register_invalidator("schedule_rules", _evict_latest_rule_bodies)
+
 
 @router.get("/schedule-rules", response_model=List[ScheduleRuleResponse], tags=["Schedule Rules"])
 def list_schedule_rules(
@@ -35,17 +58,31 @@ def list_schedule_rules(
 
 @router.get("/schedule-rules/latest", response_model=Optional[ScheduleRuleResponse], tags=["Schedule Rules"])
 def get_latest_schedule_rule(
+    request: Request,
     auth: OrgAuth,
     db: Session = Depends(get_db),
 ):
-    """Get the most recently updated schedule rule for the organization."""
-    rule = (
-        db.query(ScheduleRule)
-        .filter(ScheduleRule.organization_id == auth.organization_id)
-        .order_by(desc(ScheduleRule.updated_at))
-        .first()
-    )
-    return rule
+    """Get the most recently updated schedule rule for the organization.
+
+    Fetched on every scheduler load, so it carries a content ETag and
+    unchanged rules revalidate as 304.
+    """
+    cached = _latest_rule_bodies.get(auth.organization_id)
+    if cached is None:
+        rule = (
+            db.query(ScheduleRule)
+            .filter(ScheduleRule.organization_id == auth.organization_id)
+            .order_by(desc(ScheduleRule.updated_at))
+            .first()
+        )
+        body = render_json(ScheduleRuleResponse.model_validate(rule) if rule else None)
+        cached = (compute_etag(body), body)
+        _latest_rule_bodies.put(auth.organization_id, cached)
+
+    etag, body = cached
+    if request_is_fresh(request, etag):
+        return not_modified(etag, CACHE_REVALIDATE)
+    return json_body_response(body, etag, CACHE_REVALIDATE)
 
 
 @router.post("/schedule-rules", response_model=ScheduleRuleResponse, tags=["Schedule Rules"])
@@ -72,6 +109,7 @@ def save_schedule_rule(
         existing.created_by = auth.user_id
         db.commit()
         db.refresh(existing)
+        publish_invalidation("schedule_rules", auth.organization_id)
         return existing
 
     new_rule = ScheduleRule(
@@ -83,6 +121,7 @@ def save_schedule_rule(
     db.add(new_rule)
     db.commit()
     db.refresh(new_rule)
+    publish_invalidation("schedule_rules", auth.organization_id)
     return new_rule
 
 
@@ -102,4 +141,5 @@ def delete_schedule_rule(
         raise HTTPException(status_code=404, detail="Schedule rule not found")
     db.delete(rule)
     db.commit()
+    publish_invalidation("schedule_rules", auth.organization_id)
     return {"detail": "Deleted"}
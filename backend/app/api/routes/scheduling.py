@@ -27,6 +27,9 @@ from app.core.auth import OrgAuth
 
 router = APIRouter(prefix="/api/scheduling", tags=["scheduling"])
 
+# Upper bound on rolling windows per calculate-all request (one year).
+MAX_RECONCILIATION_WINDOWS = 366
+
 
 # ============= Schedule Demands =============
 
@@ -431,37 +434,63 @@ def get_nurse_reconciliation(
 def recalculate_all_reconciliations(
     auth: OrgAuth,
     period_end_date: str = Query(...),
+    period_end_to: Optional[str] = Query(None, description="Also reconcile every window ending up to this date (YYYY-MM-DD)"),
     db: Session = Depends(get_db)
 ):
-    """Recalculate reconciliations for all nurses in org."""
+    """Recalculate reconciliations for all nurses in org.
+    
+    All windows come from one batch pass over shared prefix sums and are
+    written with a single upsert; pending rows are refreshed, reconciled or
+    approved rows are kept.
+    """
     if not auth or not auth.organization_id:
         raise HTTPException(status_code=403, detail="Organization context required")
     
-    period_start, period_end = ReconciliationService.calculate_28day_window(period_end_date)
+    try:
+        first_end = datetime.strptime(period_end_date, "%Y-%m-%d")
+        last_end = datetime.strptime(period_end_to or period_end_date, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates must be YYYY-MM-DD")
+    window_count = (last_end - first_end).days + 1
+    if window_count < 1 or window_count > MAX_RECONCILIATION_WINDOWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"period_end_to must be within {MAX_RECONCILIATION_WINDOWS} days after period_end_date"
+        )
+    end_dates = [
+        (first_end + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(window_count)
+    ]
+    period_starts = [ReconciliationService.calculate_28day_window(d)[0] for d in end_dates]
     
     nurses = db.query(Nurse).filter(Nurse.organization_id == auth.organization_id).all()
     
-    created_count = 0
-    for nurse in nurses:
-        existing = db.query(NurseHoursReconciliation).filter(
-            NurseHoursReconciliation.nurse_id == nurse.id,
-            NurseHoursReconciliation.period_start_date == period_start
-        ).first()
-        
-        if not existing:
-            reconciliation = ReconciliationService.calculate_reconciliation(
-                db, nurse, period_start, period_end, auth.organization_id
-            )
-            db.add(reconciliation)
-            created_count += 1
+    existing = {
+        (str(nurse_id), period_start)
+        for nurse_id, period_start in db.query(
+            NurseHoursReconciliation.nurse_id,
+            NurseHoursReconciliation.period_start_date
+        ).filter(
+            NurseHoursReconciliation.organization_id == auth.organization_id,
+            NurseHoursReconciliation.period_start_date.in_(period_starts)
+        )
+    }
     
+    rows = ReconciliationService.calculate_reconciliations_batch(
+        db, nurses, end_dates, auth.organization_id
+    )
+    ReconciliationService.upsert_reconciliations(db, rows)
     db.commit()
     
+    created_count = sum(
+        1 for row in rows if (str(row["nurse_id"]), row["period_start_date"]) not in existing
+    )
+    
     compliance = ReconciliationService.get_compliance_score(db, auth.organization_id)
     
     return {
         "success": True,
         "created_reconciliations": created_count,
+        "periods": len(end_dates),
         "compliance_score": compliance
     }
 
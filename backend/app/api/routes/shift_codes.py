@@ -1,5 +1,5 @@
 """API routes for managing shift codes and time slots."""
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from typing import List, Optional
@@ -11,9 +11,34 @@ from app.schemas.shift_code import (
     ShiftCodeFrontend, TimeSlotFrontend, ShiftCodesListResponse
 )
 from app.core.auth import OrgAuth, OptionalAuth
+from app.core.cache_bus import publish_invalidation, register_invalidator
+from app.core.http_cache import (
+    CACHE_REFERENCE_DATA,
+    compute_etag,
+    json_body_response,
+    not_modified,
+    render_json,
+    request_is_fresh,
+)
+from app.core.ttl_cache import TTLCache
 
 router = APIRouter(prefix="/shift-codes", tags=["Shift Codes"])
 
+# Serialized (etag, body) of GET /shift-codes per organization. Evicted across
+# workers through the cache bus whenever an org's codes or slots change.
+_shift_code_bodies = TTLCache(maxsize=512, ttl=300)
+
+
+def _evict_shift_code_bodies(organization_id: Optional[str]) -> None:
+    if organization_id is None:
+        _shift_code_bodies.clear()
+    else:
+        _shift_code_bodies.pop(organization_id)
+
+
+register_invalidator("shift_codes", _evict_shift_code_bodies)
+register_invalidator("time_slots", _evict_shift_code_bodies)
+
 
 # Default shift codes (used when organization has none)
 # Hours are PAID hours (clock time minus unpaid breaks)
@@ -43,19 +68,33 @@ DEFAULT_TIME_SLOTS = [
 
 @router.get("", response_model=ShiftCodesListResponse)
 async def get_shift_codes(
+    request: Request,
     auth: OrgAuth,
     db: Session = Depends(get_db)
 ):
     """
     Get shift codes and time slots for an organization.
     Falls back to system defaults if organization has none.
+    Served with a content ETag; unchanged codes revalidate as 304. The body
+    is cached per organization, so repeat loads skip the queries entirely.
     """
-    # Try to get organization-specific codes
+    organization_id = auth.organization_id
+    cached = _shift_code_bodies.get(organization_id)
+    if cached is None:
+        body = render_json(_load_shift_codes(db, organization_id))
+        cached = (compute_etag(body), body)
+        _shift_code_bodies.put(organization_id, cached)
+
+    etag, body = cached
+    if request_is_fresh(request, etag):
+        return not_modified(etag, CACHE_REFERENCE_DATA)
+    return json_body_response(body, etag, CACHE_REFERENCE_DATA)
+
+
+def _load_shift_codes(db: Session, organization_id: Optional[str]) -> ShiftCodesListResponse:
     shift_codes = []
     time_slots = []
-    
-    organization_id = auth.organization_id
-    
+
     # Get organization-specific or system defaults (where organization_id is null)
     db_shift_codes = db.query(ShiftCode).filter(
         or_(
@@ -145,6 +184,7 @@ async def create_shift_code(
     )
     db.add(db_shift_code)
     db.commit()
+    publish_invalidation("shift_codes", auth.organization_id)
     db.refresh(db_shift_code)
     return db_shift_code
 
@@ -172,6 +212,7 @@ async def update_shift_code(
         setattr(db_shift_code, key, value)
     
     db.commit()
+    publish_invalidation("shift_codes", auth.organization_id)
     db.refresh(db_shift_code)
     return db_shift_code
 
@@ -192,6 +233,7 @@ async def delete_shift_code(
     
     db.delete(db_shift_code)
     db.commit()
+    publish_invalidation("shift_codes", auth.organization_id)
     return {"message": "Shift code deleted"}
 
 
@@ -215,6 +257,7 @@ async def create_time_slot(
     )
     db.add(db_time_slot)
     db.commit()
+    publish_invalidation("time_slots", auth.organization_id)
     db.refresh(db_time_slot)
     return db_time_slot
 
@@ -239,6 +282,7 @@ async def update_time_slot(
         setattr(db_time_slot, key, value)
     
     db.commit()
+    publish_invalidation("time_slots", auth.organization_id)
     db.refresh(db_time_slot)
     return db_time_slot
 
@@ -259,6 +303,7 @@ async def delete_time_slot(
     
     db.delete(db_time_slot)
     db.commit()
+    publish_invalidation("time_slots", auth.organization_id)
     return {"message": "Time slot deleted"}
 
 
@@ -310,5 +355,7 @@ async def initialize_defaults(
         db.add(db_time_slot)
     
     db.commit()
+    publish_invalidation("shift_codes", auth.organization_id)
+    publish_invalidation("time_slots", auth.organization_id)
     
     return {"message": f"Initialized {len(DEFAULT_SHIFT_CODES)} shift codes and {len(DEFAULT_TIME_SLOTS)} time slots"}
@@ -6,8 +6,13 @@ from app.db.deps import get_db
 from app.models.system_prompt import SystemPrompt as SystemPromptModel
 from app.schemas.system_prompt import SystemPrompt as SystemPromptSchema, SystemPromptUpdate
 from app.core.auth import OrgAuth, AdminAuth
+from app.core.cache_bus import publish_invalidation, register_invalidator
+from app.core.ttl_cache import TTLCache
+from app.utils.token_count import count_tokens
 import logging
 import json
+import threading
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 router = APIRouter()
@@ -305,6 +310,61 @@ def build_default_prompt_content(db: Session = None) -> str:
 DEFAULT_PROMPT_CONTENT = build_default_prompt_content()
 
 
+# ---------------------------------------------------------------------------
+# Rendered prompt cache
+# ---------------------------------------------------------------------------
+# The prompt only changes when shift codes or the saved global prompt change,
+# so the rendered text (and its token count) is cached under a version that
+# bumps on those writes in any worker (via the cache bus).
+
+PROMPT_CACHE_TTL = 600
+
+_ACTIVE_PROMPT_KEY = "active"
+_DEFAULT_CONTENT_KEY = "default"
+
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    """The active system prompt template with its precomputed token count."""
+    id: int
+    name: str
+    content: str
+    token_count: int
+    version: int
+
+
+_prompt_cache = TTLCache(maxsize=8, ttl=PROMPT_CACHE_TTL)
+_prompt_version = 0
+_prompt_version_lock = threading.Lock()
+
+
+def _current_prompt_version() -> int:
+    with _prompt_version_lock:
+        return _prompt_version
+
+
+def bump_prompt_version(organization_id: Optional[str] = None) -> None:
+    """Drop rendered prompts; shift codes feed every org's default prompt."""
+    global _prompt_version
+    with _prompt_version_lock:
+        _prompt_version += 1
+    _prompt_cache.clear()
+
+
+register_invalidator("shift_codes", bump_prompt_version)
+register_invalidator("system_prompts", bump_prompt_version)
+
+
+def _cached_default_prompt_content(db: Session) -> str:
+    version = _current_prompt_version()
+    cached = _prompt_cache.get(_DEFAULT_CONTENT_KEY)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    content = build_default_prompt_content(db)
+    _prompt_cache.put(_DEFAULT_CONTENT_KEY, (version, content))
+    return content
+
+
 # ---------------------------------------------------------------------------
 # DB helpers
 # ---------------------------------------------------------------------------
@@ -315,7 +375,7 @@ def get_default_prompt(db: Session) -> SystemPromptModel:
         SystemPromptModel.id == DEFAULT_PROMPT_ID
     ).first()
 
-    fresh_content = build_default_prompt_content(db)
+    fresh_content = _cached_default_prompt_content(db)
 
     if not prompt:
         try:
@@ -372,6 +432,28 @@ def get_system_prompt(db: Session) -> SystemPromptModel:
     return get_default_prompt(db)
 
 
+def get_rendered_system_prompt(db: Session) -> RenderedPrompt:
+    """Cached ``get_system_prompt`` with the template's token count.
+
+    Skips the prompt and shift-code queries entirely while nothing changed.
+    """
+    version = _current_prompt_version()
+    cached = _prompt_cache.get(_ACTIVE_PROMPT_KEY)
+    if cached is not None and cached.version == version:
+        return cached
+
+    prompt = get_system_prompt(db)
+    rendered = RenderedPrompt(
+        id=prompt.id,
+        name=prompt.name,
+        content=prompt.content,
+        token_count=count_tokens(prompt.content),
+        version=version,
+    )
+    _prompt_cache.put(_ACTIVE_PROMPT_KEY, rendered)
+    return rendered
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -415,6 +497,7 @@ def update_system_prompt(
             prompt.content = prompt_in.content
         db.commit()
         db.refresh(prompt)
+        publish_invalidation("system_prompts")
         return prompt
     except Exception as e:
         logger.error(f"Prompt update failed: {e}")
@@ -434,6 +517,7 @@ def reset_system_prompt(
         if prompt:
             db.delete(prompt)
             db.commit()
+            publish_invalidation("system_prompts")
         return get_default_prompt(db)
     except Exception as e:
         logger.error(f"Prompt reset failed: {e}")
@@ -9,6 +9,7 @@ from app.models.nurse import Nurse
 from app.models.patient import Patient
 from app.models.handover import Handover
 from app.core.config import settings
+from app.core.cache_bus import publish_invalidation
 from sqlalchemy.orm import Session
 
 router = APIRouter(redirect_slashes=True)
@@ -178,6 +179,11 @@ def delete_user(
     # Delete the user
     db.delete(user)
     db.commit()
+
+    # Memberships across several orgs changed (deleted, or a member promoted
+    # to admin), so evict every organization's cached memberships.
+    publish_invalidation("organization_members")
+    publish_invalidation("nurses")
     
     logger.info(f"User {user_id} and all related data deleted successfully")
     return {
@@ -1,9 +1,13 @@
 """Authentication and authorization middleware for multi-tenant support."""
+import copy
+import hashlib
 import logging
 import os
-from typing import Optional, Annotated
+import time
+from typing import Any, Dict, FrozenSet, Optional, Annotated, Tuple
 from fastapi import Depends, HTTPException, Header, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 import jwt
 from jwt import PyJWKClient
 from functools import lru_cache
@@ -16,6 +20,8 @@ from app.models.organization import (
     DELEGATABLE_PERMISSIONS,
 )
 from app.core.config import settings
+from app.core.cache_bus import register_invalidator
+from app.core.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,17 @@ CLERK_JWKS_URL = os.getenv(
     "https://helpful-parrot-18.clerk.accounts.dev/.well-known/jwks.json"
 )
 
+# Verified token claims are reused until the token's own ``exp`` (capped).
+TOKEN_CACHE_MAX_TTL = 300
+TOKEN_CACHE_SIZE = 4096
+# Organization + membership rows per (user_id, organization_id). Writes in this
+# process invalidate explicitly; the TTL bounds staleness across workers.
+AUTH_CONTEXT_TTL = float(os.getenv("AUTH_CONTEXT_TTL_SECONDS", "30"))
+AUTH_CONTEXT_CACHE_SIZE = 2048
+
+_token_claims_cache = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_MAX_TTL)
+_auth_context_cache = TTLCache(maxsize=AUTH_CONTEXT_CACHE_SIZE, ttl=AUTH_CONTEXT_TTL)
+
 
 class AuthContext:
     """Context object containing authenticated user and organization info."""
@@ -38,7 +55,8 @@ class AuthContext:
         organization_id: Optional[str] = None,
         organization: Optional[Organization] = None,
         membership: Optional[OrganizationMember] = None,
-        is_authenticated: bool = False
+        is_authenticated: bool = False,
+        permissions: Optional[Tuple[str, ...]] = None,
     ):
         self.user_id = user_id
         self.user_email = user_email
@@ -47,6 +65,8 @@ class AuthContext:
         self.organization = organization
         self.membership = membership
         self.is_authenticated = is_authenticated
+        self._permissions = permissions
+        self._permission_set: Optional[FrozenSet[str]] = None
     
     @property
     def role(self) -> Optional[MemberRole]:
@@ -72,23 +92,23 @@ class AuthContext:
         hold whatever the organization's admin has granted their role. Nurses
         hold none of the delegatable permissions (they can still do everything
         that isn't gated, such as assigning a nurse to a hand-off).
+
+        Computed once per context (or carried over from the auth cache).
         """
-        if not self.membership:
-            return []
-        if self.membership.role == MemberRole.ADMIN:
-            return list(DELEGATABLE_PERMISSIONS)
-        if not self.organization:
-            return []
-        if self.membership.role == MemberRole.MANAGER:
-            granted = self.organization.manager_permissions
-        elif self.membership.role == MemberRole.ASSISTANT_MANAGER:
-            granted = self.organization.assistant_manager_permissions
-        else:
-            return []
-        return [p for p in (granted or []) if p in DELEGATABLE_PERMISSIONS]
+        if self._permissions is None:
+            self._permissions = _effective_permissions(self.organization, self.membership)
+        return list(self._permissions)
+
+    @property
+    def permission_set(self) -> FrozenSet[str]:
+        if self._permission_set is None:
+            if self._permissions is None:
+                self._permissions = _effective_permissions(self.organization, self.membership)
+            self._permission_set = frozenset(self._permissions)
+        return self._permission_set
 
     def has_permission(self, permission: str) -> bool:
-        return permission in self.permissions
+        return permission in self.permission_set
 
     @property
     def can_manage(self) -> bool:
@@ -100,12 +120,31 @@ class AuthContext:
         """
         if self.is_admin:
             return True
-        return bool(self.permissions)
+        return bool(self.permission_set)
     
     def __repr__(self):
         return f"<AuthContext user={self.user_id} org={self.organization_id} role={self.role}>"
 
 
+def _effective_permissions(
+    organization: Optional[Organization],
+    membership: Optional[OrganizationMember],
+) -> Tuple[str, ...]:
+    if not membership:
+        return ()
+    if membership.role == MemberRole.ADMIN:
+        return tuple(DELEGATABLE_PERMISSIONS)
+    if not organization:
+        return ()
+    if membership.role == MemberRole.MANAGER:
+        granted = organization.manager_permissions
+    elif membership.role == MemberRole.ASSISTANT_MANAGER:
+        granted = organization.assistant_manager_permissions
+    else:
+        return ()
+    return tuple(p for p in (granted or []) if p in DELEGATABLE_PERMISSIONS)
+
+
 @lru_cache(maxsize=1)
 def get_jwks_client():
     """Get cached JWKS client for Clerk JWT verification."""
@@ -125,11 +164,18 @@ def verify_clerk_token(token: str) -> dict:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    # Remove "Bearer " prefix if present
+    if token.startswith("Bearer "):
+        token = token[7:]
+
+    # Signature checks dominate auth cost; a token verified once stays valid
+    # until its own expiry, so repeat requests skip JWKS + RSA entirely.
+    cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    cached = _token_claims_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Remove "Bearer " prefix if present
-        if token.startswith("Bearer "):
-            token = token[7:]
-        
         # Get the signing key from Clerk's JWKS
         jwks_client = get_jwks_client()
         signing_key = jwks_client.get_signing_key_from_jwt(token)
@@ -142,7 +188,13 @@ def verify_clerk_token(token: str) -> dict:
             leeway=60,
             options={"verify_aud": False}  # Clerk doesn't always set audience
         )
-        
+
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            _token_claims_cache.put(
+                cache_key, payload, ttl=min(exp - time.time(), TOKEN_CACHE_MAX_TTL)
+            )
+
         return payload
         
     except jwt.ExpiredSignatureError:
@@ -306,25 +358,92 @@ def _build_auth_context(
     
     # If organization ID provided, check membership
     if organization_id:
+        _attach_membership(auth, organization_id, db)
+
+    return auth
+
+
+def _row_snapshot(instance) -> Dict[str, Any]:
+    """Column values of an ORM row, deep-copied so JSON columns aren't shared."""
+    return {
+        attr.key: copy.deepcopy(getattr(instance, attr.key))
+        for attr in sa_inspect(instance).mapper.column_attrs
+    }
+
+
+def _attach_row(db: Session, model, columns: Optional[Dict[str, Any]]):
+    """Rebuild a cached row as a persistent instance of ``db`` without a query.
+
+    Routes may read relationships from or write through ``auth.organization``
+    and ``auth.membership``, so they must belong to the request's session.
+    """
+    if columns is None:
+        return None
+    instance = model(**copy.deepcopy(columns))
+    make_transient_to_detached(instance)
+    return db.merge(instance, load=False)
+
+
+def _attach_membership(auth: AuthContext, organization_id: str, db: Session) -> None:
+    key = (auth.user_id, organization_id)
+    cached = _auth_context_cache.get(key)
+    if cached is None:
         org = db.query(Organization).filter(
             Organization.id == organization_id,
             Organization.is_active == True
         ).first()
-        
+
+        membership = None
         if org:
-            auth.organization_id = organization_id
-            auth.organization = org
-            
             # Check if user is a member
             membership = db.query(OrganizationMember).filter(
                 OrganizationMember.organization_id == organization_id,
-                OrganizationMember.user_id == user_id,
+                OrganizationMember.user_id == auth.user_id,
                 OrganizationMember.is_active == True
             ).first()
-            
+
+        if org:
+            auth.organization_id = organization_id
+            auth.organization = org
             auth.membership = membership
-    
-    return auth
+        auth._permissions = _effective_permissions(org, membership)
+        _auth_context_cache.put(key, (
+            _row_snapshot(org) if org else None,
+            _row_snapshot(membership) if membership else None,
+            auth._permissions,
+        ))
+        return
+
+    org_columns, membership_columns, permissions = cached
+    if org_columns is not None:
+        auth.organization_id = organization_id
+        auth.organization = _attach_row(db, Organization, org_columns)
+        auth.membership = _attach_row(db, OrganizationMember, membership_columns)
+    auth._permissions = permissions
+
+
+def invalidate_auth_context(organization_id: Optional[str] = None, user_id: Optional[str] = None) -> None:
+    """Forget cached org/membership lookups after a write that changes them.
+
+    Pass both ids for a single member, only ``organization_id`` for org-wide
+    changes (role permissions, settings, deactivation), or only ``user_id``
+    for changes to one user across every organization.
+    """
+    if organization_id is not None and user_id is not None:
+        _auth_context_cache.pop((str(user_id), str(organization_id)))
+        return
+    _auth_context_cache.evict_where(
+        lambda key: (organization_id is None or key[1] == str(organization_id))
+        and (user_id is None or key[0] == str(user_id))
+    )
+
+
+def _evict_organization_contexts(organization_id: Optional[str]) -> None:
+    invalidate_auth_context(organization_id)
+
+
+register_invalidator("organizations", _evict_organization_contexts)
+register_invalidator("organization_members", _evict_organization_contexts)
 
 
 # Type aliases for cleaner dependency injection
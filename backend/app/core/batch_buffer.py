@@ -0,0 +1,136 @@
+"""Bounded in-process write buffer flushed in batches by a daemon thread.
+
+High-volume, loss-tolerant writes (analytics events) are queued by the
+request and written later in bulk:
+
+    buffer = BatchBuffer("analytics-events", write_rows, max_items=10_000)
+    if not buffer.put(row):
+        ...  # full: the row was dropped, tell the client to back off
+
+The flusher hands ``writer`` up to ``batch_size`` items at a time, waiting at
+most ``flush_interval`` seconds after the first queued item. ``stop()``
+drains whatever is still queued, so call it on shutdown. Memory is bounded by
+``max_items``; when the queue is full ``put`` drops the item and counts it
+instead of blocking the event loop. ``stats()`` exposes the counters.
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Log the first drop and then every Nth, not every one.
+DROP_LOG_EVERY = 1000
+# Queued by stop() to wake a flusher blocked on an empty queue.
+_WAKE = object()
+
+
+class BatchBuffer:
+    def __init__(
+        self,
+        name: str,
+        writer: Callable[[List[Any]], None],
+        max_items: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+    ):
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._writer = writer
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_items)
+        self._stop = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._counters = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0}
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._closed:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"{self.name}-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop accepting items, flush the queue and join the flusher."""
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            try:
+                self._queue.put_nowait(_WAKE)
+            except queue.Full:
+                pass  # a full queue means the flusher is not waiting
+            thread.join(timeout=timeout)
+        # Flusher never started (or timed out): drain inline.
+        while self._write_next_batch():
+            pass
+
+    def put(self, item: Any) -> bool:
+        """Queue ``item``; False (and counted as dropped) when full or stopped."""
+        if self._thread is None and not self._closed:
+            self.start()
+        try:
+            if self._closed:
+                raise queue.Full
+            self._queue.put_nowait(item)
+        except queue.Full:
+            dropped = self._count("dropped")
+            if dropped == 1 or dropped % DROP_LOG_EVERY == 0:
+                logger.warning(f"{self.name} buffer full, dropped {dropped} item(s) so far")
+            return False
+        self._count("enqueued")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._counters)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def _count(self, key: str, amount: int = 1) -> int:
+        with self._lock:
+            self._counters[key] += amount
+            return self._counters[key]
+
+    def _next_batch(self, wait: bool) -> List[Any]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval) if wait else self._queue.get_nowait()]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if wait and remaining > 0 and not self._stop.is_set():
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return [item for item in batch if item is not _WAKE]
+
+    def _write_next_batch(self, wait: bool = False) -> bool:
+        batch = self._next_batch(wait)
+        if not batch:
+            return not self._queue.empty()
+        try:
+            self._writer(batch)
+        except Exception as e:
+            self._count("failed", len(batch))
+            logger.error(f"{self.name} flush of {len(batch)} item(s) failed: {e}", exc_info=True)
+        else:
+            self._count("written", len(batch))
+            self._count("batches")
+        return True
+
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            self._write_next_batch(wait=not self._stop.is_set())
@@ -0,0 +1,201 @@
+"""Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+Each uvicorn worker keeps its own in-process caches (auth memberships, shift
+codes, schedule rules, ...). A write in one worker must evict the matching
+entries in every other worker, so writes publish a ``(table, org_id)`` event:
+
+    db.commit()
+    publish_invalidation("shift_codes", auth.organization_id)
+
+and caches subscribe by table:
+
+    register_invalidator("shift_codes", lambda org_id: _cache.evict_org(org_id))
+
+``publish_invalidation`` evicts locally right away, then sends a NOTIFY; a
+listener thread per worker receives it and runs the same handlers. An
+``org_id`` of None means "every organization". When the listener loses its
+connection it clears all registered caches after reconnecting, since
+notifications sent in the meantime are lost. Cache TTLs bound staleness if
+the bus is down entirely.
+"""
+import json
+import logging
+import os
+import select
+import threading
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+POLL_SECONDS = 5.0
+MAX_RECONNECT_DELAY = 30.0
+BUS_ENABLED = os.getenv("CACHE_INVALIDATION_BUS", "1") not in ("0", "false", "False")
+
+# Identifies this process so the listener skips events it already applied.
+_SENDER_ID = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+Invalidator = Callable[[Optional[str]], None]
+_handlers: Dict[str, List[Invalidator]] = defaultdict(list)
+_handlers_lock = threading.Lock()
+
+
+def register_invalidator(table: str, handler: Invalidator) -> Invalidator:
+    """Run ``handler(org_id)`` whenever ``table`` is invalidated in any worker."""
+    with _handlers_lock:
+        _handlers[table].append(handler)
+    return handler
+
+
+def invalidate_local(table: str, organization_id: Optional[str] = None) -> None:
+    with _handlers_lock:
+        handlers = list(_handlers.get(table, ()))
+    for handler in handlers:
+        try:
+            handler(organization_id)
+        except Exception as e:
+            logger.error(f"Cache invalidator for {table} failed: {e}", exc_info=True)
+
+
+def invalidate_all_local() -> None:
+    with _handlers_lock:
+        tables = list(_handlers)
+    for table in tables:
+        invalidate_local(table, None)
+
+
+def bus_available() -> bool:
+    return BUS_ENABLED and engine is not None and engine.dialect.name == "postgresql"
+
+
+def publish_invalidation(table: str, organization_id: Optional[str] = None) -> None:
+    """Evict ``(table, organization_id)`` here and in every other worker.
+
+    Call after the write has committed so other workers never reload the
+    old rows. Delivery failures are logged, not raised: the write itself
+    already succeeded and cache TTLs cap the staleness.
+    """
+    organization_id = str(organization_id) if organization_id is not None else None
+    invalidate_local(table, organization_id)
+    if not bus_available():
+        return
+
+    payload = json.dumps({"t": table, "o": organization_id, "s": _SENDER_ID})
+    try:
+        with engine.connect() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": CHANNEL, "payload": payload},
+            )
+            conn.commit()
+    except Exception as e:
+        logger.warning(f"Failed to publish cache invalidation for {table}: {e}")
+
+
+def _dispatch(raw_payload: str) -> None:
+    try:
+        event = json.loads(raw_payload)
+        table = event["t"]
+    except (ValueError, KeyError, TypeError):
+        logger.warning(f"Ignoring malformed cache invalidation payload: {raw_payload!r}")
+        return
+    if event.get("s") == _SENDER_ID:
+        return
+    invalidate_local(table, event.get("o"))
+
+
+class NotifyListener:
+    """Daemon thread holding a dedicated LISTEN connection for this worker.
+
+    Each payload received on ``channel`` is passed to ``dispatch``;
+    ``on_reconnect`` runs after a dropped connection is re-established,
+    since notifications sent in the meantime are lost.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        dispatch: Callable[[str], None],
+        on_reconnect: Callable[[], None],
+        name: str,
+    ):
+        self.channel = channel
+        self.dispatch = dispatch
+        self.on_reconnect = on_reconnect
+        self.name = name
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None or not bus_available():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=POLL_SECONDS + 1)
+            self._thread = None
+
+    def _connect(self):
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+        # A dedicated connection: LISTEN holds it for the worker's lifetime,
+        # so it must not come out of the request pool.
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        conn = psycopg2.connect(dsn)
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {self.channel}")
+        return conn
+
+    def _run(self) -> None:
+        delay = 1.0
+        connected_before = False
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                if connected_before:
+                    # Anything published while we were disconnected was missed.
+                    self.on_reconnect()
+                connected_before = True
+                delay = 1.0
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], POLL_SECONDS) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self.dispatch(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning(f"{self.name} error, reconnecting in {delay:.0f}s: {e}")
+                self._stop.wait(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+_listener = NotifyListener(
+    CHANNEL, _dispatch, invalidate_all_local, "cache-invalidation-listener"
+)
+
+
+def start_invalidation_listener() -> None:
+    _listener.start()
+
+
+def stop_invalidation_listener() -> None:
+    _listener.stop()
@@ -0,0 +1,170 @@
+"""Negotiated response compression and compressed request bodies.
+
+``CompressionMiddleware`` compresses complete (non-streaming) responses above
+``minimum_size`` with brotli when the client accepts it and the optional
+``brotli`` package is installed, otherwise with gzip. Streaming responses,
+event streams and already-encoded bodies pass through untouched.
+
+``RequestDecompressionMiddleware`` accepts ``Content-Encoding: gzip`` request
+bodies (e.g. large OCR grids posted to /optimize) and hands the handler the
+decoded JSON, bounded by ``max_size`` to guard against decompression bombs.
+"""
+import gzip
+import zlib
+from typing import List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import PlainTextResponse
+
+try:  # Optional dependency: brotli is preferred when available.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+UNCOMPRESSIBLE_TYPES = ("text/event-stream", "image/", "application/zip", "application/gzip")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick "br" or "gzip" from an Accept-Encoding header (q=0 means refused)."""
+    offered = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        offered[token] = quality
+    if brotli is not None and offered.get("br", 0) > 0:
+        return "br"
+    if offered.get("gzip", 0) > 0 or offered.get("*", 0) > 0:
+        return "gzip"
+    return None
+
+
+def compress_body(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            if start_message is None:  # pragma: no cover - protocol violation
+                await send(message)
+                return
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            content_type = headers.get("content-type", "")
+            skip = (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or content_type.startswith(UNCOMPRESSIBLE_TYPES)
+            )
+            if skip:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress_body(body, encoding, self.gzip_level, self.brotli_quality)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # The encoded bytes differ from the tagged representation.
+                headers["ETag"] = f"W/{etag}"
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+            passthrough = True
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class RequestDecompressionMiddleware:
+    def __init__(self, app, max_size: int = 50 * 1024 * 1024):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = Headers(scope=scope).get("content-encoding", "").strip().lower()
+        if encoding not in ("gzip", "x-gzip"):
+            await self.app(scope, receive, send)
+            return
+
+        compressed = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            compressed.extend(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+
+        # wbits=16+MAX_WBITS reads the gzip container; max_length bounds output.
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(bytes(compressed), self.max_size + 1)
+        except zlib.error:
+            response = PlainTextResponse("Invalid gzip request body", status_code=400)
+            await response(scope, receive, send)
+            return
+        if len(body) > self.max_size or decompressor.unconsumed_tail:
+            response = PlainTextResponse("Decompressed request body too large", status_code=413)
+            await response(scope, receive, send)
+            return
+
+        raw_headers: List[Tuple[bytes, bytes]] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        scope = {**scope, "headers": raw_headers}
+
+        delivered = False
+
+        async def receive_decoded():
+            nonlocal delivered
+            if not delivered:
+                delivered = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, receive_decoded, send)
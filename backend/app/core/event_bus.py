@@ -0,0 +1,145 @@
+"""Push events to connected clients in every worker over Postgres LISTEN/NOTIFY.
+
+Writers queue events inside their transaction and commit as usual:
+
+    publish_event(db, "announcement", {"id": str(a.id), ...},
+                  organization_id=org_id, team=a.target_team)
+    db.commit()
+
+On Postgres the event is a ``pg_notify`` in the caller's transaction, so it
+is delivered only if the write commits, and in commit order. Every worker
+(including the publisher) receives it on its LISTEN connection and hands it
+to ``event_hub``, which feeds the SSE streams (``GET /notifications/stream``).
+Without the bus (non-Postgres, or ``EVENT_STREAM_BUS=0``) events are
+delivered to this worker's hub after the session commits.
+
+NOTIFY payloads are capped at 8000 bytes, so large audiences are split into
+several events and event data should stay small: clients fetch anything
+bulky over REST.
+"""
+import json
+import logging
+import os
+import uuid
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.cache_bus import NotifyListener, bus_available
+from app.core.event_hub import EventHub
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "app_events"
+STREAM_BUS_ENABLED = os.getenv("EVENT_STREAM_BUS", "1") not in ("0", "false", "False")
+HEARTBEAT_SECONDS = float(os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", "15"))
+REPLAY_SIZE = int(os.getenv("EVENT_STREAM_REPLAY_SIZE", "2000"))
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "100"))
+
+# ~80 bytes per (user_id, ref) pair keeps each NOTIFY well under 8000 bytes.
+MAX_USERS_PER_EVENT = 60
+MAX_PAYLOAD_BYTES = 7900
+
+_PENDING_KEY = "pending_stream_events"
+
+event_hub = EventHub(replay_size=REPLAY_SIZE, max_queued=SUBSCRIBER_QUEUE_SIZE)
+
+
+def _use_notify() -> bool:
+    return STREAM_BUS_ENABLED and bus_available()
+
+
+def _encode(event_: Dict[str, Any]) -> str:
+    payload = json.dumps(event_, separators=(",", ":"), default=str)
+    if len(payload.encode("utf-8")) > MAX_PAYLOAD_BYTES:
+        logger.warning(f"Stream event {event_['type']} too large, sending without data")
+        event_ = dict(event_, data={})
+        payload = json.dumps(event_, separators=(",", ":"), default=str)
+    return payload
+
+
+def publish_event(
+    db: Session,
+    type: str,
+    data: Optional[Dict[str, Any]] = None,
+    *,
+    users: Optional[Union[Mapping[str, Optional[str]], Iterable[str]]] = None,
+    organization_id: Optional[str] = None,
+    team: Optional[str] = None,
+) -> None:
+    """Queue an event for delivery when ``db``'s transaction commits.
+
+    Address it to ``users`` (ids, or a mapping of id -> per-user ref that
+    is delivered as ``data["id"]``) or to an organization, optionally one
+    team. Never raises for the event itself (the NOTIFY runs in a
+    savepoint, so a failure leaves the caller's transaction usable): a lost
+    push only means the client sees the change on its next refetch.
+    """
+    if users is not None:
+        refs = dict(users) if isinstance(users, Mapping) else dict.fromkeys(users)
+        items = list(refs.items())
+        events = [
+            {"type": type, "users": dict(items[start:start + MAX_USERS_PER_EVENT]), "data": data}
+            for start in range(0, len(items), MAX_USERS_PER_EVENT)
+        ]
+    elif organization_id is not None:
+        events = [{"type": type, "org": str(organization_id), "team": team, "data": data}]
+    else:
+        raise ValueError("publish_event needs users or an organization_id")
+
+    use_notify = _use_notify()
+    if use_notify:
+        # begin_nested() flushes first; the caller's own flush errors must
+        # surface to the caller, not be swallowed below.
+        db.flush()
+    for event_ in events:
+        event_["id"] = uuid.uuid4().hex
+        try:
+            if use_notify:
+                # A SAVEPOINT, so a failed NOTIFY cannot abort the caller's
+                # transaction (Postgres would otherwise fail their commit).
+                with db.begin_nested():
+                    db.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": CHANNEL, "payload": _encode(event_)},
+                    )
+            else:
+                db.info.setdefault(_PENDING_KEY, []).append(event_)
+        except Exception as e:
+            logger.warning(f"Failed to queue stream event {type}: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending(session: Session) -> None:
+    for event_ in session.info.pop(_PENDING_KEY, ()):
+        event_hub.publish(event_)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _dispatch(raw_payload: str) -> None:
+    try:
+        event_ = json.loads(raw_payload)
+        event_["type"]
+    except (ValueError, KeyError, TypeError):
+        logger.warning(f"Ignoring malformed stream event payload: {raw_payload[:200]!r}")
+        return
+    event_hub.publish(event_)
+
+
+_listener = NotifyListener(CHANNEL, _dispatch, event_hub.resync_all, "event-stream-listener")
+
+
+def start_event_listener() -> None:
+    if STREAM_BUS_ENABLED:
+        _listener.start()
+
+
+def stop_event_listener() -> None:
+    # Close open streams first so uvicorn is not left waiting on them.
+    event_hub.close()
+    _listener.stop()
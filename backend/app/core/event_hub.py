@@ -0,0 +1,182 @@
+"""In-process pub/sub hub behind the Server-Sent Events stream.
+
+Each connected client holds a ``Subscription``; events are dicts published
+from any thread (the LISTEN thread in production) and routed by audience:
+
+    {"id": "...", "type": "notification", "users": {user_id: ref}, "data": {...}}
+    {"id": "...", "type": "announcement", "org": org_id, "team": None, "data": {...}}
+
+A ``users`` event reaches only those users; when a user's ``ref`` is set it
+is delivered as ``data["id"]`` (e.g. their own notification id), so one
+event can carry a whole fan-out without exposing other recipients. An
+``org`` event reaches every member of that org whose team matches
+(``team`` None means the whole org).
+
+The hub keeps the last ``replay_size`` events in arrival order. A client
+reconnecting with ``Last-Event-ID`` gets everything after that id; if the
+id has already been evicted (or a subscriber's queue overflowed, or the
+hub missed events) it gets a ``resync`` event and should refetch over REST.
+"""
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+
+RESYNC: Event = {"type": "resync", "data": {}}
+_CLOSE: Event = {"type": "_close"}
+
+
+def format_sse(event: Event) -> str:
+    lines = []
+    if event.get("id"):
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event.get('data') or {}, separators=(',', ':'), default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscription:
+    def __init__(
+        self,
+        user_id: str,
+        organization_id: Optional[str],
+        team: Optional[str],
+        loop: asyncio.AbstractEventLoop,
+        max_queued: int,
+    ):
+        self.user_id = user_id
+        self.organization_id = organization_id
+        self.team = team
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=max_queued)
+        self._loop = loop
+
+    def view(self, event: Event) -> Optional[Event]:
+        """The event as this subscriber should see it, or None."""
+        users = event.get("users")
+        if users is not None:
+            if self.user_id not in users:
+                return None
+            ref = users[self.user_id]
+            data = dict(event.get("data") or {}, id=ref) if ref else event.get("data")
+            return {"id": event.get("id"), "type": event["type"], "data": data}
+        if event.get("org") is None or event["org"] != self.organization_id:
+            return None
+        if event.get("team") and event["team"] != self.team:
+            return None
+        return {"id": event.get("id"), "type": event["type"], "data": event.get("data")}
+
+    def push(self, event: Event) -> None:
+        """Queue an event from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            pass  # loop already closed: the client is gone
+
+    def _put(self, event: Event) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A client this far behind gets a clean slate instead of a gap.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class EventHub:
+    def __init__(self, replay_size: int = 2000, max_queued: int = 100):
+        self.max_queued = max_queued
+        self._subscriptions: Set[Subscription] = set()
+        self._recent: Deque[Event] = deque(maxlen=replay_size)
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self,
+        user_id: str,
+        organization_id: Optional[str] = None,
+        team: Optional[str] = None,
+        last_event_id: Optional[str] = None,
+    ) -> Subscription:
+        """Register a subscriber; must be called on its event loop."""
+        subscription = Subscription(
+            user_id, organization_id, team, asyncio.get_running_loop(), self.max_queued
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+            backlog = self._replay(subscription, last_event_id) if last_event_id else []
+        for event in backlog:
+            subscription._put(event)
+        return subscription
+
+    def _replay(self, subscription: Subscription, last_event_id: str) -> List[Event]:
+        ids = [event.get("id") for event in self._recent]
+        if last_event_id not in ids:
+            return [RESYNC]
+        after = list(self._recent)[ids.index(last_event_id) + 1:]
+        return [view for view in map(subscription.view, after) if view is not None]
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event: Event) -> None:
+        with self._lock:
+            self._recent.append(event)
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            view = subscription.view(event)
+            if view is not None:
+                subscription.push(view)
+
+    def resync_all(self) -> None:
+        """Events may have been missed (e.g. the LISTEN connection dropped)."""
+        with self._lock:
+            self._recent.clear()
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.push(RESYNC)
+
+    def close(self) -> None:
+        """End every open stream (worker shutdown)."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.push(_CLOSE)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"subscribers": len(self._subscriptions), "replayable": len(self._recent)}
+
+
+async def sse_stream(
+    hub: EventHub,
+    subscription: Subscription,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat: float = 15.0,
+    retry_ms: int = 5000,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for ``subscription`` until the client goes away.
+
+    A comment line is sent every ``heartbeat`` seconds of silence so proxies
+    keep the connection open and dead clients are noticed.
+    """
+    try:
+        yield f"retry: {retry_ms}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                if await is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            if event is _CLOSE:
+                return
+            yield format_sse(event)
+    finally:
+        hub.unsubscribe(subscription)
@@ -0,0 +1,124 @@
+"""HTTP caching helpers: strong ETags, conditional GETs and an LRU of immutable bodies.
+
+Usage in routes:
+    from app.core.http_cache import json_response_with_etag, CACHE_REFERENCE_DATA
+
+    @router.get("/things")
+    def list_things(request: Request, ...):
+        return json_response_with_etag(request, payload, cache_control=CACHE_REFERENCE_DATA)
+
+A repeat request carrying the ETag in If-None-Match gets an empty 304.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.responses import dumps_json
+
+# Per-route Cache-Control policies. Everything is org-scoped, so never "public".
+CACHE_REVALIDATE = "private, no-cache"
+CACHE_REFERENCE_DATA = "private, max-age=30, must-revalidate"
+CACHE_FINALIZED_SCHEDULE = "private, max-age=60, must-revalidate"
+
+# Responses differ per user/org, so shared caches must key on these headers.
+VARY_HEADERS = "Authorization, X-Organization-ID"
+
+
+def render_json(content: Any) -> bytes:
+    """Serialize with the app's response encoder so ETags match the bytes sent."""
+    return dumps_json(content)
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag from the response bytes."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate If-None-Match (weak comparison, as RFC 9110 requires for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+def _cache_headers(etag: str, cache_control: str) -> dict:
+    return {"ETag": etag, "Cache-Control": cache_control, "Vary": VARY_HEADERS}
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers=_cache_headers(etag, cache_control))
+
+
+def request_is_fresh(request: Optional[Request], etag: str) -> bool:
+    """True when the client already holds the representation tagged ``etag``."""
+    if request is None:
+        return False
+    return etag_matches(request.headers.get("if-none-match"), etag)
+
+
+def json_body_response(body: bytes, etag: str, cache_control: str) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=_cache_headers(etag, cache_control),
+    )
+
+
+def json_response_with_etag(
+    request: Optional[Request],
+    content: Any,
+    *,
+    cache_control: str = CACHE_REVALIDATE,
+    etag: Optional[str] = None,
+) -> Response:
+    """Serialize ``content`` and answer 304 when the client's copy is current.
+
+    Without an explicit ``etag`` the tag is a hash of the serialized body, so
+    the handler still runs its queries but unchanged data costs no transfer.
+    Pass a row-version ``etag`` and check ``request_is_fresh`` first to skip
+    the work entirely.
+    """
+    body = render_json(content)
+    etag = etag or compute_etag(body)
+    if request_is_fresh(request, etag):
+        return not_modified(etag, cache_control)
+    return json_body_response(body, etag, cache_control)
+
+
+class ImmutableBodyCache:
+    """Thread-safe LRU of serialized bodies for resources keyed by immutable versions."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, etag: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
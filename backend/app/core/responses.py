@@ -0,0 +1,55 @@
+"""Fast JSON responses backed by orjson.
+
+``FastJSONResponse`` is the application's default response class. Handlers
+that already hold plain dict/list payloads (schedule results, dashboards,
+handover lists) can return ``FastJSONResponse(payload)`` directly, which
+skips FastAPI's ``jsonable_encoder`` walk as well as response_model
+re-validation.
+"""
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, falling back to jsonable_encoder for
+    values orjson cannot handle natively (pydantic models, Decimal, sets...)."""
+    try:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+    except TypeError:
+        return orjson.dumps(jsonable_encoder(content), option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def model_response(
+    model: BaseModel,
+    *,
+    status_code: int = 200,
+    media_type: str = "application/json",
+    headers: Optional[Dict[str, str]] = None,
+    **dump_kwargs: Any,
+) -> Response:
+    """Serialize a pydantic model straight to bytes with pydantic-core.
+
+    Skips FastAPI's response_model round trip (validate -> dict ->
+    jsonable_encoder -> encode). Aliases are used, as FastAPI does by default.
+    """
+    dump_kwargs.setdefault("by_alias", True)
+    return Response(
+        content=model.model_dump_json(**dump_kwargs),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
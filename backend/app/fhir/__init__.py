@@ -16,6 +16,7 @@ from app.fhir.converters import (
     fhir_to_patient,
     nurse_to_fhir,
     optimized_schedule_to_fhir_slots,
+    shift_assignments_to_fhir_slots,
     organization_to_fhir_careteam,
     create_search_bundle,
     create_audit_event,
@@ -39,6 +40,7 @@ __all__ = [
     "fhir_to_patient",
     "nurse_to_fhir",
     "optimized_schedule_to_fhir_slots",
+    "shift_assignments_to_fhir_slots",
     "organization_to_fhir_careteam",
     "create_search_bundle",
     "create_audit_event",
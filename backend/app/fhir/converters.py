@@ -4,8 +4,8 @@ FHIR Resource Converters
 Convert between internal Chronofy models and FHIR R5 resources.
 This enables interoperability with other healthcare systems per Bill S-5.
 """
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Optional, List, Tuple
 from uuid import uuid4
 
 from app.fhir.resources import (
@@ -215,6 +215,66 @@ def optimized_schedule_to_fhir_slots(
     return slots
 
 
+def _clock_hour(value: Optional[str], default: int) -> Tuple[int, int]:
+    try:
+        hours, minutes = str(value).split(":")[:2]
+        return int(hours) % 24, int(minutes[:2])
+    except (TypeError, ValueError):
+        return default, 0
+
+
+def shift_assignments_to_fhir_slots(
+    assignments: List,
+    organization_id: Optional[str] = None
+) -> List[FHIRSlot]:
+    """Convert ShiftAssignment rows to FHIR Slot resources"""
+    slots = []
+    
+    for assignment in assignments:
+        schedule_id = str(assignment.schedule_id)
+        nurse_name = assignment.nurse_name or ""
+        date_str = assignment.date
+        shift_code = assignment.shift_code or ""
+        night = assignment.shift_type == "night"
+        
+        start_h, start_m = _clock_hour(assignment.start_time, 19 if night else 7)
+        end_h, end_m = _clock_hour(assignment.end_time, 7 if night else 19)
+        try:
+            start_dt = datetime.fromisoformat(f"{date_str}T{start_h:02d}:{start_m:02d}:00")
+        except ValueError:
+            continue
+        end_dt = start_dt.replace(hour=end_h, minute=end_m)
+        if end_dt <= start_dt:
+            # Night shift ends next day
+            end_dt += timedelta(days=1)
+        
+        slots.append(FHIRSlot(
+            id=f"{schedule_id}-{nurse_name.replace(' ', '-')}-{date_str}",
+            meta=Meta(
+                source=f"{CHRONOFY_SYSTEM}/organizations/{organization_id}" if organization_id else CHRONOFY_SYSTEM
+            ),
+            identifier=[
+                Identifier(system=CHRONOFY_SYSTEM, value=f"{schedule_id}-{date_str}-{shift_code}")
+            ],
+            serviceType=[
+                CodeableConcept(
+                    coding=[Coding(
+                        system=f"{CHRONOFY_SYSTEM}/CodeSystem/shift-type",
+                        code=shift_code or assignment.shift_type,
+                        display="Night Shift" if night else "Day Shift"
+                    )]
+                )
+            ],
+            schedule=Reference(reference=f"Schedule/{schedule_id}", type="Schedule"),
+            status=SlotStatus.BUSY,
+            start=start_dt,
+            end=end_dt,
+            comment=f"Assigned to {nurse_name}"
+        ))
+    
+    return slots
+
+
 # ============== CareTeam Conversions ==============
 
 def organization_to_fhir_careteam(
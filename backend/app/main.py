@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 # Use the main optimizer with RobustScheduler
@@ -13,16 +15,46 @@ from app.api.routes import announcement
 from app.api.routes import notification
 # from app.api.routes import privacy  # TODO: Fix parameter ordering
 from app.core.config import settings
+from app.core.cache_bus import start_invalidation_listener, stop_invalidation_listener
+from app.core.event_bus import start_event_listener, stop_event_listener
+from app.core.compression import CompressionMiddleware, RequestDecompressionMiddleware
+from app.core.responses import FastJSONResponse
+from app.services.analytics_service import event_buffer
+from app.utils.audit import start_audit_writer, stop_audit_writer
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each worker listens for cache invalidations published by the others.
+    start_invalidation_listener()
+    # ...and for pushed notification/announcement events.
+    start_event_listener()
+    event_buffer.start()
+    # Ships audit WAL segments, including any left by a crashed worker.
+    start_audit_writer()
+    yield
+    # Write out buffered analytics events and audit entries before exiting.
+    event_buffer.stop()
+    stop_audit_writer()
+    stop_event_listener()
+    stop_invalidation_listener()
+
+
 app = FastAPI(
     title="Chronofy API",
     description="Healthcare scheduling platform API with HL7 FHIR R5 support for Quebec Bill S-5 compliance",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
 )
 
+# Added before CORS so CORS stays outermost; large roster/dashboard JSON
+# compresses ~10x and editors upload gzip-encoded draft payloads.
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+app.add_middleware(RequestDecompressionMiddleware)
+
 # CORS defaults are explicit to keep browser behavior predictable and secure.
 # Browsers reject credentialed requests when allow_origins includes '*'.
 cors_origins = settings.ALLOW_ORIGINS if settings.ALLOW_ORIGINS else [
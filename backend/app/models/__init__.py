@@ -1,6 +1,8 @@
 from .system_prompt import SystemPrompt
 from .optimized_schedule import OptimizedSchedule  
+from .shift_assignment import ShiftAssignment
 from .schedule import Schedule  
+from .ocr_result import OcrResult
 from .user import User
 from .patient import Patient
 from .handover import Handover, PatientStatus, AcuityLevel, IsolationType
@@ -15,11 +17,14 @@ from .schedule_rule import ScheduleRule
 
 # Quebec Compliance Models
 from .privacy import PrivacyConsent, DataAccessRequest, PrivacyAuditLog, PrivacyBreach, DataRetentionPolicy
-from .analytics import AnalyticsEvent, SchedulingMetrics, HandoverMetrics, UserActivityMetrics, PilotStudyReport
+from .analytics import (
+    AnalyticsEvent, SchedulingMetrics, SchedulingMetricsDaily, HandoverMetrics, HandoverMetricsDaily,
+    UserActivityMetrics, PilotStudyReport
+)
 
 # 2026 Features
 from .ambient_session import AmbientSession, AmbientTemplate
-from .burnout import BurnoutSnapshot, BurnoutAlert, BurnoutConfig
+from .burnout import BurnoutSnapshot, BurnoutCurrentRisk, BurnoutAlert, BurnoutConfig
 from .learning import (
     LearningModule,
     LearningProgress,
@@ -28,4 +33,4 @@ from .learning import (
     LearningAssignmentCompletion,
 )
 from .announcement import Announcement
-from .notification import Notification
+from .notification import Notification, NotificationUnreadCount
@@ -10,7 +10,7 @@ Key metrics needed for CHUM/MUHC pilot studies:
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, Date, DateTime, Integer, Float, Text, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
@@ -101,10 +101,39 @@ class SchedulingMetrics(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        # Partial-day tails of summary windows.
+        Index("ix_scheduling_metrics_org_created", "organization_id", "created_at"),
+    )
+    
     def __repr__(self):
         return f"<SchedulingMetrics schedule={self.schedule_id}>"
 
 
+class SchedulingMetricsDaily(Base):
+    """
+    Per-organization daily rollup of SchedulingMetrics.
+    
+    One row per org and created_at day, incremented as metrics are recorded.
+    Sums use 0 for missing values so averages match the raw-row summary.
+    """
+    __tablename__ = "scheduling_metrics_daily"
+    
+    organization_id = Column(String, ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    
+    schedules_count = Column(Integer, nullable=False, default=0)
+    time_saved_seconds_sum = Column(Float, nullable=False, default=0.0)
+    time_saved_percentage_sum = Column(Float, nullable=False, default=0.0)
+    coverage_percentage_sum = Column(Float, nullable=False, default=0.0)
+    conflicts_resolved_sum = Column(Integer, nullable=False, default=0)
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<SchedulingMetricsDaily {self.organization_id} {self.day}>"
+
+
 class HandoverMetrics(Base):
     """
     Handover efficiency metrics
@@ -143,10 +172,40 @@ class HandoverMetrics(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        # Partial-day tails of summary windows.
+        Index("ix_handover_metrics_org_period", "organization_id", "period_start", "period_end"),
+    )
+    
     def __repr__(self):
         return f"<HandoverMetrics {self.period_type} {self.period_start}>"
 
 
+class HandoverMetricsDaily(Base):
+    """
+    Per-organization rollup of HandoverMetrics by period start/end day.
+    
+    Keyed on both days so a window can take every period that starts and
+    ends on whole days inside it without touching the raw rows.
+    """
+    __tablename__ = "handover_metrics_daily"
+    
+    organization_id = Column(String, ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    start_day = Column(Date, primary_key=True)
+    end_day = Column(Date, primary_key=True)
+    
+    periods_count = Column(Integer, nullable=False, default=0)
+    handovers_created_sum = Column(Integer, nullable=False, default=0)
+    handovers_completed_sum = Column(Integer, nullable=False, default=0)
+    completion_rate_sum = Column(Float, nullable=False, default=0.0)
+    completion_time_seconds_sum = Column(Float, nullable=False, default=0.0)
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<HandoverMetricsDaily {self.organization_id} {self.start_day}-{self.end_day}>"
+
+
 class UserActivityMetrics(Base):
     """
     User activity and engagement metrics
@@ -1,6 +1,6 @@
 """Announcement model for org-wide and team-targeted manager broadcasts."""
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Text, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
@@ -37,5 +37,10 @@ class Announcement(Base):
         DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    __table_args__ = (
+        # Listing order: pinned first, then newest, paged by keyset.
+        Index("ix_announcements_org_pinned_created", "organization_id", "is_pinned", "created_at"),
+    )
+
     def __repr__(self):
         return f"<Announcement {self.title} org={self.organization_id}>"
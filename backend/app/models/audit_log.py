@@ -12,6 +12,8 @@ class AuditLog(Base):
     __tablename__ = "audit_log"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # Client-generated id; makes at-least-once WAL delivery idempotent.
+    entry_id = Column(String(36), nullable=True, unique=True)
     organization_id = Column(String, nullable=True, index=True)
     user_id = Column(String, nullable=False, index=True)
     user_name = Column(String(200), nullable=True)
@@ -5,7 +5,7 @@ Uses shift data, overtime patterns, and engagement signals to
 predict nurse burnout risk and alert managers before attrition.
 """
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
@@ -64,10 +64,45 @@ class BurnoutSnapshot(Base):
     snapshot_date = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # History view: one nurse's snapshots, newest first.
+        Index("ix_burnout_snapshots_nurse_date", "nurse_id", snapshot_date.desc()),
+    )
+
     def __repr__(self):
         return f"<BurnoutSnapshot nurse={self.nurse_id} risk={self.risk_level}>"
 
 
+class BurnoutCurrentRisk(Base):
+    """
+    Latest burnout snapshot per nurse, maintained on every assessment.
+
+    Lets the dashboard read one row per nurse instead of searching the
+    growing snapshot history for each nurse's most recent entry.
+    """
+    __tablename__ = "burnout_current_risk"
+
+    nurse_id = Column(UUID(as_uuid=True), primary_key=True)
+    organization_id = Column(String, nullable=False, index=True)
+    snapshot_id = Column(UUID(as_uuid=True), nullable=False)
+
+    overall_risk_score = Column(Float, nullable=False, default=0.0)
+    risk_level = Column(String, nullable=False, default="low")
+    overtime_score = Column(Float, nullable=True)
+    schedule_density_score = Column(Float, nullable=True)
+    night_shift_load_score = Column(Float, nullable=True)
+    weekend_load_score = Column(Float, nullable=True)
+    short_rest_score = Column(Float, nullable=True)
+    pattern_disruption_score = Column(Float, nullable=True)
+    tenure_risk_score = Column(Float, nullable=True)
+    trend = Column(String, nullable=True)
+
+    snapshot_date = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<BurnoutCurrentRisk nurse={self.nurse_id} risk={self.risk_level}>"
+
+
 class BurnoutAlert(Base):
     """
     Alert generated when a nurse's risk crosses a threshold.
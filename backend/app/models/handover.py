@@ -1,5 +1,5 @@
 """Handover model for shift handover tool."""
-from sqlalchemy import Column, String, DateTime, Text, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, Text, Boolean, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -255,5 +255,15 @@ class Handover(Base):
     # Relationships
     patient = relationship("Patient", back_populates="handovers")
 
+    __table_args__ = (
+        # Per-patient "latest handover" listings: org + shift window, newest first.
+        Index(
+            "ix_handovers_org_shift_date_updated",
+            "organization_id",
+            "shift_date",
+            updated_at.desc(),
+        ),
+    )
+
     def __repr__(self):
         return f"<Handover {self.id} - Patient {self.patient_id} - {self.shift_date}>"
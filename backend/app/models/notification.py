@@ -1,6 +1,6 @@
 """In-app notification model for per-user alerts (e.g. admin role transfer)."""
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Text, Boolean, Integer
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
@@ -26,3 +26,18 @@ class Notification(Base):
 
     def __repr__(self):
         return f"<Notification {self.type} user={self.user_id} read={self.is_read}>"
+
+
+class NotificationUnreadCount(Base):
+    """Per-user unread notification counter backing the unread badge.
+
+    Kept in step with ``notifications.is_read`` by app/services/notifications.py
+    so polling the badge is a primary-key lookup instead of a COUNT(*).
+    """
+    __tablename__ = "notification_unread_counts"
+
+    user_id = Column(String, primary_key=True)
+    unread = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<NotificationUnreadCount user={self.user_id} unread={self.unread}>"
@@ -0,0 +1,28 @@
+"""Parsed OCR results cached by image content hash."""
+from datetime import datetime
+
+from sqlalchemy import Column, String, Date, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.db.database import Base
+
+
+class OcrResult(Base):
+    """
+    The parsed roster grid for one image and requested date range.
+
+    Keyed by the SHA-256 of the image bytes, so re-uploading the same photo
+    skips Textract entirely. The range is part of the key because header
+    matching depends on it. Written by app/services/ocr_cache.py; only
+    successful parses are stored.
+    """
+    __tablename__ = "ocr_results"
+
+    image_sha256 = Column(String(64), primary_key=True)
+    start_date = Column(Date, primary_key=True)
+    end_date = Column(Date, primary_key=True)
+    result = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<OcrResult {self.image_sha256[:12]} {self.start_date}..{self.end_date}>"
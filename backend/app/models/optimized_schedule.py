@@ -1,5 +1,4 @@
-## models/optimized_schedule.py
-from sqlalchemy import Column, String, ForeignKey, JSON, DateTime, Boolean
+from sqlalchemy import Column, String, ForeignKey, JSON, DateTime, Boolean, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from uuid import uuid4
 from datetime import datetime
@@ -10,6 +9,42 @@ class OptimizedSchedule(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     schedule_id = Column(UUID(as_uuid=True), ForeignKey("schedules.id"), nullable=True)
     organization_id = Column(String, nullable=True, index=True)  # Multi-tenant org ID
+    # Full payload for snapshot rows; NULL when the row is stored as a delta.
     result = Column(JSON)
     finalized = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # Bumped on every payload write; used as the draft's optimistic-concurrency
+    # token (If-Match / base_version on PATCH /optimize/{id}/draft).
+    version = Column(Integer, default=1, nullable=False)
+
+    # Delta storage for revision families: intermediate revisions keep only
+    # the JSON-Patch ops against their revision_of parent (see
+    # app/services/schedule_revisions.py). delta_depth counts the hops back
+    # to the nearest full snapshot.
+    delta_base_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("optimized_schedules.id"),
+        nullable=True,
+        index=True,
+    )
+    delta = Column(JSON, nullable=True)
+    delta_depth = Column(Integer, default=0, nullable=False)
+
+    # Summary columns stamped from the payload on every write so listings can
+    # filter and render rows without loading result/delta. NULL family_root_id
+    # marks a legacy row that has not been stamped yet.
+    family_root_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    period_start = Column(String, nullable=True)  # ISO date, e.g. 2026-01-05
+    period_end = Column(String, nullable=True)
+    created_by = Column(String, nullable=True)
+    created_by_name = Column(String, nullable=True)
+
+    __table_args__ = (
+        # Keyset pagination for GET /optimize: newest first within an org.
+        Index(
+            "ix_optimized_schedules_org_created",
+            "organization_id",
+            created_at.desc(),
+            id.desc(),
+        ),
+    )
@@ -0,0 +1,55 @@
+"""Per-nurse, per-day shift facts taken from the active finalized schedule."""
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.database import Base
+
+
+class ShiftAssignment(Base):
+    """
+    One worked shift on a finalized roster.
+
+    OptimizedSchedule stores a whole roster as one JSON payload; this table
+    repeats its worked cells as rows so per-nurse and per-date questions
+    (hours worked, calendars, FHIR Slots) are indexed range scans. Rows are
+    written by app/services/shift_assignments.py whenever a schedule is
+    finalized or promoted, and replaced per revision family so only the
+    active version contributes. When rosters of different families cover
+    the same dates, only the most recently published one keeps rows there.
+    """
+    __tablename__ = "shift_assignments"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    organization_id = Column(String, nullable=False)
+    # NULL when the grid row does not match a nurse on the roster.
+    nurse_id = Column(UUID(as_uuid=True), ForeignKey("nurses.id", ondelete="CASCADE"), nullable=True)
+    nurse_name = Column(String, nullable=False)
+
+    date = Column(String(10), nullable=False)  # YYYY-MM-DD
+    shift_code = Column(String(20), nullable=True)
+    shift_code_id = Column(String, ForeignKey("shift_codes.id", ondelete="SET NULL"), nullable=True)
+    shift_type = Column(String(20), nullable=True)  # "day", "night", ...
+    start_time = Column(String(10), nullable=True)  # "07:00"
+    end_time = Column(String(10), nullable=True)
+    paid_hours = Column(Float, nullable=False, default=0.0)
+
+    schedule_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("optimized_schedules.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_shift_assignments_org_nurse_date", "organization_id", "nurse_id", "date"),
+        Index("ix_shift_assignments_org_date", "organization_id", "date"),
+    )
+
+    def __repr__(self):
+        return f"<ShiftAssignment {self.nurse_name} {self.date} {self.shift_code}>"
@@ -1,5 +1,5 @@
 """Time-off requests and reconciliation models."""
-from sqlalchemy import Column, String, DateTime, Text, Boolean, ForeignKey, Float, Integer
+from sqlalchemy import Column, String, DateTime, Text, Boolean, ForeignKey, Float, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
@@ -54,6 +54,10 @@ class NurseHoursReconciliation(Base):
     - Vacation offset adjustments
     """
     __tablename__ = "nurse_hours_reconciliation"
+    __table_args__ = (
+        # One row per nurse and window; batch recalculation upserts on it.
+        UniqueConstraint("nurse_id", "period_start_date", name="uq_nurse_hours_reconciliation_nurse_period"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     
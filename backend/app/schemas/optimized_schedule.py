@@ -84,3 +84,16 @@ class InsightsRequest(BaseModel):
     markerComments: Optional[str] = None
     locale: Optional[str] = "en"  # Default to English
     requiredStaff: Optional[Dict[str, Dict[str, int]]] = None
+
+# Cell-level edit for partial draft updates (PATCH /optimize/{id}/draft)
+class DraftCellEdit(BaseModel):
+    nurse: str  # Grid row id or nurse name
+    date: str
+    changes: Optional[Dict[str, Any]] = None  # None clears the cell
+    grid: Optional[str] = None  # JSON Pointer to the row list; defaults to the editor grid
+
+# Partial draft update: RFC 6902 operations and/or cell edits against base_version
+class DraftPatchRequest(BaseModel):
+    base_version: Optional[int] = None
+    operations: List[Dict[str, Any]] = []
+    cells: List[DraftCellEdit] = []
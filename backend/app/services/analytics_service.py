@@ -3,17 +3,35 @@ Analytics Service
 
 Provides methods for tracking and aggregating analytics data
 for pilot study ROI demonstration.
+
+Summaries read the per-org daily rollup tables (scheduling_metrics_daily,
+handover_metrics_daily) for every whole day in the window and aggregate
+the raw rows in SQL only for the partial days at either end, so their cost
+follows the number of days rather than the number of recorded metrics.
+Recording a metric bumps its rollup row in the same transaction;
+``compact_rollups`` rebuilds rollups from the raw rows.
+
+Tracked events go through ``event_buffer``: requests enqueue a row and a
+background flusher bulk-inserts batches, one commit per batch.
 """
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from uuid import UUID
+import os
+from datetime import date, datetime, time
+from typing import Dict, List, Optional, Any, Tuple
+from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, or_, select, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.batch_buffer import BatchBuffer
+from app.db.database import SessionLocal
+from app.utils.day_windows import tail_conditions, whole_days
 
 from app.models.analytics import (
     AnalyticsEvent,
     SchedulingMetrics,
+    SchedulingMetricsDaily,
     HandoverMetrics,
+    HandoverMetricsDaily,
     UserActivityMetrics,
     PilotStudyReport
 )
@@ -26,6 +44,58 @@ MANUAL_SCHEDULING_BENCHMARK_MINUTES_PER_NURSE = 5.0
 # Average nurse hourly rate in Quebec (CAD)
 NURSE_HOURLY_RATE_CAD = 45.0
 
+# Event ingestion buffer (per worker)
+EVENT_BUFFER_MAX_EVENTS = int(os.getenv("ANALYTICS_BUFFER_MAX_EVENTS", "10000"))
+EVENT_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "500"))
+EVENT_FLUSH_SECONDS = float(os.getenv("ANALYTICS_FLUSH_SECONDS", "2.0"))
+
+_SCHEDULING_SUMS = (
+    "schedules_count",
+    "time_saved_seconds_sum",
+    "time_saved_percentage_sum",
+    "coverage_percentage_sum",
+    "conflicts_resolved_sum",
+)
+_HANDOVER_SUMS = (
+    "periods_count",
+    "handovers_created_sum",
+    "handovers_completed_sum",
+    "completion_rate_sum",
+    "completion_time_seconds_sum",
+)
+
+
+def _tail_filter(column, lo: Optional[datetime], hi: Optional[datetime], end_column=None):
+    """Rows outside the whole-day span, or None when there is no tail."""
+    conditions = tail_conditions(column, lo, hi, end_column)
+    return or_(*conditions) if conditions else None
+
+
+def _sum0(column):
+    return func.coalesce(func.sum(func.coalesce(column, 0)), 0)
+
+
+def _write_event_batch(rows: List[Dict[str, Any]]) -> None:
+    """Bulk insert one batch of buffered events in its own session."""
+    db = SessionLocal()
+    try:
+        db.execute(insert(AnalyticsEvent), rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+event_buffer = BatchBuffer(
+    "analytics-events",
+    _write_event_batch,
+    max_items=EVENT_BUFFER_MAX_EVENTS,
+    batch_size=EVENT_BATCH_SIZE,
+    flush_interval=EVENT_FLUSH_SECONDS,
+)
+
 
 class AnalyticsService:
     """
@@ -103,6 +173,55 @@ class AnalyticsService:
             properties=properties
         )
     
+    def enqueue_event(
+        self,
+        event_type: str,
+        event_name: str,
+        organization_id: Optional[UUID] = None,
+        user_id: Optional[str] = None,
+        event_category: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
+    ) -> Optional[UUID]:
+        """
+        Queue an event for the background batch writer.
+        
+        Returns the new event id, or None when the buffer is full and the
+        event was dropped.
+        """
+        event_id = uuid4()
+        accepted = event_buffer.put({
+            "id": event_id,
+            "event_type": event_type,
+            "event_name": event_name,
+            "organization_id": organization_id,
+            "user_id": user_id,
+            "event_category": event_category,
+            "properties": properties or {},
+            "session_id": session_id,
+            "timestamp": datetime.utcnow(),
+        })
+        return event_id if accepted else None
+    
+    def enqueue_page_view(
+        self,
+        page_name: str,
+        organization_id: Optional[UUID] = None,
+        user_id: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None
+    ) -> Optional[UUID]:
+        """
+        Queue a page view event.
+        """
+        return self.enqueue_event(
+            event_type="page_view",
+            event_name=page_name,
+            organization_id=organization_id,
+            user_id=user_id,
+            event_category="navigation",
+            properties=properties
+        )
+    
     # ========== Scheduling Metrics ==========
     
     def record_scheduling_metrics(
@@ -156,12 +275,38 @@ class AnalyticsService:
             time_saved_seconds=time_saved,
             time_saved_percentage=time_saved_percentage,
             schedule_creation_completed_at=datetime.utcnow(),
+            created_at=datetime.utcnow(),
             **kwargs
         )
         self.db.add(metrics)
+        self._bump_scheduling_rollup(metrics)
         self.db.commit()
         return metrics
     
+    def _bump_scheduling_rollup(self, metrics: SchedulingMetrics) -> None:
+        """Add one metrics row to its org/day rollup (same transaction)."""
+        stmt = pg_insert(SchedulingMetricsDaily).values(
+            organization_id=str(metrics.organization_id),
+            day=metrics.created_at.date(),
+            schedules_count=1,
+            time_saved_seconds_sum=metrics.time_saved_seconds or 0,
+            time_saved_percentage_sum=metrics.time_saved_percentage or 0,
+            coverage_percentage_sum=metrics.coverage_percentage or 0,
+            conflicts_resolved_sum=metrics.conflicts_resolved or 0,
+            updated_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SchedulingMetricsDaily.organization_id, SchedulingMetricsDaily.day],
+            set_={
+                **{
+                    key: getattr(SchedulingMetricsDaily, key) + stmt.excluded[key]
+                    for key in _SCHEDULING_SUMS
+                },
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        self.db.execute(stmt)
+    
     def get_scheduling_summary(
         self,
         organization_id: UUID,
@@ -171,33 +316,63 @@ class AnalyticsService:
         """
         Get scheduling metrics summary for a time period.
         """
-        query = self.db.query(SchedulingMetrics).filter(
-            SchedulingMetrics.organization_id == organization_id
-        )
+        lo, hi = whole_days(start_date, end_date)
+        count = time_saved = pct_sum = coverage_sum = conflicts = 0
         
-        if start_date:
-            query = query.filter(SchedulingMetrics.created_at >= start_date)
-        if end_date:
-            query = query.filter(SchedulingMetrics.created_at <= end_date)
+        # Whole days from the rollup
+        if lo is None or hi is None or lo < hi:
+            query = self.db.query(
+                *(func.coalesce(func.sum(getattr(SchedulingMetricsDaily, key)), 0) for key in _SCHEDULING_SUMS)
+            ).filter(SchedulingMetricsDaily.organization_id == str(organization_id))
+            if lo is not None:
+                query = query.filter(SchedulingMetricsDaily.day >= lo.date())
+            if hi is not None:
+                query = query.filter(SchedulingMetricsDaily.day < hi.date())
+            count, time_saved, pct_sum, coverage_sum, conflicts = query.one()
+            tail = _tail_filter(SchedulingMetrics.created_at, lo, hi)
+        else:
+            # Window inside a single day pair: raw rows only
+            tail = True
         
-        metrics = query.all()
+        # Partial days at either end from the raw rows
+        if tail is not None:
+            query = self.db.query(
+                func.count(SchedulingMetrics.id),
+                _sum0(SchedulingMetrics.time_saved_seconds),
+                _sum0(SchedulingMetrics.time_saved_percentage),
+                _sum0(SchedulingMetrics.coverage_percentage),
+                _sum0(SchedulingMetrics.conflicts_resolved)
+            ).filter(SchedulingMetrics.organization_id == organization_id)
+            if start_date:
+                query = query.filter(SchedulingMetrics.created_at >= start_date)
+            if end_date:
+                query = query.filter(SchedulingMetrics.created_at <= end_date)
+            if tail is not True:
+                query = query.filter(tail)
+            t_count, t_saved, t_pct, t_coverage, t_conflicts = query.one()
+            count += t_count
+            time_saved += t_saved
+            pct_sum += t_pct
+            coverage_sum += t_coverage
+            conflicts += t_conflicts
         
-        if not metrics:
+        if not count:
             return {
                 "total_schedules": 0,
                 "total_time_saved_hours": 0,
                 "avg_time_saved_percentage": 0,
                 "avg_coverage_percentage": 0,
-                "total_conflicts_resolved": 0
+                "total_conflicts_resolved": 0,
+                "estimated_cost_saved_cad": 0
             }
         
-        total_time_saved = sum(m.time_saved_seconds or 0 for m in metrics)
-        avg_time_saved_pct = sum(m.time_saved_percentage or 0 for m in metrics) / len(metrics)
-        avg_coverage = sum(m.coverage_percentage or 0 for m in metrics) / len(metrics)
-        total_conflicts = sum(m.conflicts_resolved or 0 for m in metrics)
+        total_time_saved = float(time_saved)
+        avg_time_saved_pct = float(pct_sum) / count
+        avg_coverage = float(coverage_sum) / count
+        total_conflicts = int(conflicts)
         
         return {
-            "total_schedules": len(metrics),
+            "total_schedules": count,
             "total_time_saved_hours": round(total_time_saved / 3600, 1),
             "avg_time_saved_percentage": round(avg_time_saved_pct, 1),
             "avg_coverage_percentage": round(avg_coverage, 1),
@@ -238,9 +413,39 @@ class AnalyticsService:
             **kwargs
         )
         self.db.add(metrics)
+        self._bump_handover_rollup(metrics)
         self.db.commit()
         return metrics
     
+    def _bump_handover_rollup(self, metrics: HandoverMetrics) -> None:
+        """Add one metrics row to its org/period-days rollup (same transaction)."""
+        stmt = pg_insert(HandoverMetricsDaily).values(
+            organization_id=str(metrics.organization_id),
+            start_day=metrics.period_start.date(),
+            end_day=metrics.period_end.date(),
+            periods_count=1,
+            handovers_created_sum=metrics.handovers_created or 0,
+            handovers_completed_sum=metrics.handovers_completed or 0,
+            completion_rate_sum=metrics.completion_rate or 0,
+            completion_time_seconds_sum=metrics.avg_completion_time_seconds or 0,
+            updated_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                HandoverMetricsDaily.organization_id,
+                HandoverMetricsDaily.start_day,
+                HandoverMetricsDaily.end_day
+            ],
+            set_={
+                **{
+                    key: getattr(HandoverMetricsDaily, key) + stmt.excluded[key]
+                    for key in _HANDOVER_SUMS
+                },
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        self.db.execute(stmt)
+    
     def get_handover_summary(
         self,
         organization_id: UUID,
@@ -250,18 +455,46 @@ class AnalyticsService:
         """
         Get handover metrics summary for a time period.
         """
-        query = self.db.query(HandoverMetrics).filter(
-            HandoverMetrics.organization_id == organization_id
-        )
+        lo, hi = whole_days(start_date, end_date)
+        count = total_created = total_completed = rate_sum = time_sum = 0
         
-        if start_date:
-            query = query.filter(HandoverMetrics.period_start >= start_date)
-        if end_date:
-            query = query.filter(HandoverMetrics.period_end <= end_date)
+        # Periods starting and ending on whole days from the rollup
+        if lo is None or hi is None or lo < hi:
+            query = self.db.query(
+                *(func.coalesce(func.sum(getattr(HandoverMetricsDaily, key)), 0) for key in _HANDOVER_SUMS)
+            ).filter(HandoverMetricsDaily.organization_id == str(organization_id))
+            if lo is not None:
+                query = query.filter(HandoverMetricsDaily.start_day >= lo.date())
+            if hi is not None:
+                query = query.filter(HandoverMetricsDaily.end_day < hi.date())
+            count, total_created, total_completed, rate_sum, time_sum = query.one()
+            tail = _tail_filter(HandoverMetrics.period_start, lo, hi, HandoverMetrics.period_end)
+        else:
+            tail = True
         
-        metrics = query.all()
+        # Periods touching a partial day at either end from the raw rows
+        if tail is not None:
+            query = self.db.query(
+                func.count(HandoverMetrics.id),
+                _sum0(HandoverMetrics.handovers_created),
+                _sum0(HandoverMetrics.handovers_completed),
+                _sum0(HandoverMetrics.completion_rate),
+                _sum0(HandoverMetrics.avg_completion_time_seconds)
+            ).filter(HandoverMetrics.organization_id == organization_id)
+            if start_date:
+                query = query.filter(HandoverMetrics.period_start >= start_date)
+            if end_date:
+                query = query.filter(HandoverMetrics.period_end <= end_date)
+            if tail is not True:
+                query = query.filter(tail)
+            t_count, t_created, t_completed, t_rate, t_time = query.one()
+            count += t_count
+            total_created += t_created
+            total_completed += t_completed
+            rate_sum += t_rate
+            time_sum += t_time
         
-        if not metrics:
+        if not count:
             return {
                 "total_handovers_created": 0,
                 "total_handovers_completed": 0,
@@ -269,10 +502,10 @@ class AnalyticsService:
                 "avg_completion_time_minutes": 0
             }
         
-        total_created = sum(m.handovers_created for m in metrics)
-        total_completed = sum(m.handovers_completed for m in metrics)
-        avg_completion_rate = sum(m.completion_rate or 0 for m in metrics) / len(metrics)
-        avg_time = sum(m.avg_completion_time_seconds or 0 for m in metrics) / len(metrics)
+        total_created = int(total_created)
+        total_completed = int(total_completed)
+        avg_completion_rate = float(rate_sum) / count
+        avg_time = float(time_sum) / count
         
         return {
             "total_handovers_created": total_created,
@@ -281,6 +514,76 @@ class AnalyticsService:
             "avg_completion_time_minutes": round(avg_time / 60, 1)
         }
     
+    # ========== Rollup Compaction ==========
+    
+    def compact_rollups(
+        self,
+        organization_id: Optional[UUID] = None,
+        since: Optional[date] = None
+    ) -> Dict[str, int]:
+        """
+        Rebuild the daily rollups from the raw metrics rows.
+        
+        Replaces the rollup rows of the selected organization (or all) from
+        `since` onwards with one grouped INSERT ... SELECT per table. Repairs
+        drift from rows written outside record_*_metrics. Does not commit.
+        """
+        sched_day = func.date(SchedulingMetrics.created_at)
+        sched_select = select(
+            SchedulingMetrics.organization_id,
+            sched_day,
+            func.count(SchedulingMetrics.id),
+            _sum0(SchedulingMetrics.time_saved_seconds),
+            _sum0(SchedulingMetrics.time_saved_percentage),
+            _sum0(SchedulingMetrics.coverage_percentage),
+            _sum0(SchedulingMetrics.conflicts_resolved),
+            func.now()
+        ).where(SchedulingMetrics.created_at != None).group_by(
+            SchedulingMetrics.organization_id, sched_day
+        )
+        sched_delete = self.db.query(SchedulingMetricsDaily)
+        
+        start_day = func.date(HandoverMetrics.period_start)
+        end_day = func.date(HandoverMetrics.period_end)
+        handover_select = select(
+            HandoverMetrics.organization_id,
+            start_day,
+            end_day,
+            func.count(HandoverMetrics.id),
+            _sum0(HandoverMetrics.handovers_created),
+            _sum0(HandoverMetrics.handovers_completed),
+            _sum0(HandoverMetrics.completion_rate),
+            _sum0(HandoverMetrics.avg_completion_time_seconds),
+            func.now()
+        ).group_by(HandoverMetrics.organization_id, start_day, end_day)
+        handover_delete = self.db.query(HandoverMetricsDaily)
+        
+        if organization_id is not None:
+            sched_select = sched_select.where(SchedulingMetrics.organization_id == organization_id)
+            sched_delete = sched_delete.filter(SchedulingMetricsDaily.organization_id == str(organization_id))
+            handover_select = handover_select.where(HandoverMetrics.organization_id == organization_id)
+            handover_delete = handover_delete.filter(HandoverMetricsDaily.organization_id == str(organization_id))
+        if since is not None:
+            since_at = datetime.combine(since, time.min)
+            sched_select = sched_select.where(SchedulingMetrics.created_at >= since_at)
+            sched_delete = sched_delete.filter(SchedulingMetricsDaily.day >= since)
+            handover_select = handover_select.where(HandoverMetrics.period_start >= since_at)
+            handover_delete = handover_delete.filter(HandoverMetricsDaily.start_day >= since)
+        
+        sched_delete.delete(synchronize_session=False)
+        handover_delete.delete(synchronize_session=False)
+        scheduling_rows = self.db.execute(
+            pg_insert(SchedulingMetricsDaily).from_select(
+                ["organization_id", "day", *_SCHEDULING_SUMS, "updated_at"], sched_select
+            )
+        ).rowcount
+        handover_rows = self.db.execute(
+            pg_insert(HandoverMetricsDaily).from_select(
+                ["organization_id", "start_day", "end_day", *_HANDOVER_SUMS, "updated_at"], handover_select
+            )
+        ).rowcount
+        return {"scheduling_days": scheduling_rows, "handover_days": handover_rows}
+    
     # ========== Pilot Study Report Generation ==========
     
     def generate_pilot_study_report(
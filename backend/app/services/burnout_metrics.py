@@ -0,0 +1,133 @@
+"""
+Burnout metrics derived from finalized schedules.
+
+``build_org_burnout_metrics`` reads the organization's ``ShiftAssignment``
+rows for the last 30 days in one indexed query (only the active version of
+each finalized schedule is published there), lays every nurse's shifts out
+as a nurse x day matrix (app/utils/shift_matrix.py) and computes the
+workload metrics for all nurses in one pass. The result feeds
+``compute_factor_scores`` through ``run_burnout_assessments``.
+"""
+import logging
+import math
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.nurse import Nurse
+from app.models.shift_assignment import ShiftAssignment
+from app.models.time_off_request import TimeOffRequest
+from app.utils.shift_matrix import build_shift_matrix, workload_metrics
+
+logger = logging.getLogger(__name__)
+
+METRICS_WINDOW_DAYS = 30
+SICK_CALL_WINDOW_DAYS = 90
+
+
+def _collect_shifts(
+    db: Session,
+    organization_id: str,
+    nurses: List[Nurse],
+    start: date,
+    end: date,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """``{nurse_id: {iso_date: entry}}`` from the shift-assignment facts."""
+    shifts: Dict[str, Dict[str, Dict[str, Any]]] = {str(n.id): {} for n in nurses}
+    rows = (
+        db.query(
+            ShiftAssignment.nurse_id,
+            ShiftAssignment.date,
+            ShiftAssignment.paid_hours,
+            ShiftAssignment.shift_type,
+            ShiftAssignment.start_time,
+            ShiftAssignment.end_time,
+        )
+        .filter(
+            ShiftAssignment.organization_id == organization_id,
+            ShiftAssignment.date >= start.isoformat(),
+            ShiftAssignment.date <= end.isoformat(),
+            ShiftAssignment.nurse_id != None,
+        )
+        .all()
+    )
+    for row in rows:
+        nurse_shifts = shifts.get(str(row.nurse_id))
+        if nurse_shifts is None:
+            continue
+        nurse_shifts[row.date] = {
+            "hours": row.paid_hours,
+            "shiftType": row.shift_type,
+            "startTime": row.start_time,
+            "endTime": row.end_time,
+        }
+    return shifts
+
+
+def _sick_calls(db: Session, nurse_ids: List[Any], since: date) -> Dict[str, int]:
+    if not nurse_ids:
+        return {}
+    rows = (
+        db.query(TimeOffRequest.nurse_id, func.count(TimeOffRequest.id))
+        .filter(
+            TimeOffRequest.nurse_id.in_(nurse_ids),
+            TimeOffRequest.reason == "sick",
+            TimeOffRequest.status != "denied",
+            TimeOffRequest.start_date >= since.isoformat(),
+        )
+        .group_by(TimeOffRequest.nurse_id)
+        .all()
+    )
+    return {str(nurse_id): count for nurse_id, count in rows}
+
+
+def _tenure_days(nurse: Nurse, now: datetime) -> int:
+    created = nurse.created_at
+    if created is not None and created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return (now - (created or now)).days
+
+
+def build_org_burnout_metrics(
+    db: Session,
+    organization_id: str,
+    nurses: List[Nurse],
+    as_of: Optional[date] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Metrics dict per nurse id (str) for ``run_burnout_assessments``.
+
+    Metrics that cannot be measured (e.g. rest gaps for a nurse with fewer
+    than two shifts) are omitted so ``compute_factor_scores`` uses its
+    neutral defaults.
+    """
+    now = datetime.now(timezone.utc)
+    as_of = as_of or now.date()
+    window_start = as_of - timedelta(days=METRICS_WINDOW_DAYS - 1)
+
+    shifts = _collect_shifts(db, organization_id, nurses, window_start, as_of)
+    matrix = build_shift_matrix(shifts, end=as_of, days=METRICS_WINDOW_DAYS)
+
+    targets = np.array([float(n.bi_weekly_target_hours or 75.0) for n in nurses])
+    columns = workload_metrics(matrix, targets)
+    sick_calls = _sick_calls(
+        db, [n.id for n in nurses], as_of - timedelta(days=SICK_CALL_WINDOW_DAYS - 1)
+    )
+
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for row, nurse in enumerate(nurses):
+        nurse_id = str(nurse.id)
+        values: Dict[str, Any] = {}
+        for name, column in columns.items():
+            value = column[row].item()
+            if isinstance(value, float) and math.isnan(value):
+                continue
+            values[name] = round(value, 2) if isinstance(value, float) else value
+        values["sick_calls_last_90d"] = sick_calls.get(nurse_id, 0)
+        # No shift-swap records exist yet.
+        values["swap_requests_last_30d"] = 0
+        values["tenure_days"] = _tenure_days(nurse, now)
+        metrics[nurse_id] = values
+    return metrics
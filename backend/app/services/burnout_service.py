@@ -12,12 +12,15 @@ Uses a weighted multi-factor model calibrated to nursing research:
 """
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
+import uuid
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.models.burnout import BurnoutSnapshot, BurnoutAlert, BurnoutConfig
+from app.models.burnout import BurnoutSnapshot, BurnoutCurrentRisk, BurnoutAlert, BurnoutConfig
 from app.models.nurse import Nurse
+from app.services.notifications import MANAGER_ROLES, fan_out_notifications
 
 DEFAULT_WEIGHTS: Dict[str, float] = {
     "overtime": 0.25,
@@ -129,13 +132,12 @@ def compute_trend(current: float, previous: Optional[float]) -> str:
     return "stable"
 
 
-def generate_alert_if_needed(
-    db: Session,
+def build_alert(
     snapshot: BurnoutSnapshot,
     config: BurnoutConfig,
     nurse: Nurse,
 ) -> Optional[BurnoutAlert]:
-    """Create an alert if the snapshot warrants one."""
+    """Return the alert the snapshot warrants, if any (not added to a session)."""
     should_alert = False
     severity = "info"
     alert_type = "threshold_crossed"
@@ -173,7 +175,19 @@ def generate_alert_if_needed(
         message=_build_alert_message(snapshot, nurse_name),
         recommendation=recommendation,
     )
-    db.add(alert)
+    return alert
+
+
+def generate_alert_if_needed(
+    db: Session,
+    snapshot: BurnoutSnapshot,
+    config: BurnoutConfig,
+    nurse: Nurse,
+) -> Optional[BurnoutAlert]:
+    """Create an alert if the snapshot warrants one."""
+    alert = build_alert(snapshot, config, nurse)
+    if alert is not None:
+        db.add(alert)
     return alert
 
 
@@ -207,6 +221,79 @@ def _build_recommendation(snapshot: BurnoutSnapshot) -> str:
     return " ".join(recs) if recs else "Monitor and review at next scheduling cycle."
 
 
+def _snapshot_values(
+    organization_id: str,
+    nurse: Nurse,
+    metrics: Dict[str, Any],
+    config: BurnoutConfig,
+    weights: Dict[str, float],
+    previous_score: Optional[float],
+) -> Dict[str, Any]:
+    """Column values for a nurse's new BurnoutSnapshot."""
+    factor_scores = compute_factor_scores(metrics, nurse)
+    overall = compute_overall_risk(factor_scores, weights)
+
+    return {
+        "organization_id": organization_id,
+        "nurse_id": nurse.id,
+        "overall_risk_score": overall,
+        "risk_level": classify_risk(overall, config),
+        "overtime_score": factor_scores.get("overtime"),
+        "schedule_density_score": factor_scores.get("schedule_density"),
+        "night_shift_load_score": factor_scores.get("night_shift_load"),
+        "weekend_load_score": factor_scores.get("weekend_load"),
+        "short_rest_score": factor_scores.get("short_rest"),
+        "pattern_disruption_score": factor_scores.get("pattern_disruption"),
+        "tenure_risk_score": factor_scores.get("tenure_risk"),
+        "metrics": metrics,
+        "previous_risk_score": previous_score,
+        "trend": compute_trend(overall, previous_score),
+    }
+
+
+_CURRENT_RISK_COLUMNS = (
+    "organization_id",
+    "overall_risk_score",
+    "risk_level",
+    "overtime_score",
+    "schedule_density_score",
+    "night_shift_load_score",
+    "weekend_load_score",
+    "short_rest_score",
+    "pattern_disruption_score",
+    "tenure_risk_score",
+    "trend",
+    "snapshot_date",
+)
+
+
+def _upsert_current_risk(db: Session, snapshot_rows: List[Dict[str, Any]]) -> None:
+    """Point each nurse's burnout_current_risk row at its new snapshot.
+
+    One multi-row upsert; an older snapshot never replaces a newer one.
+    """
+    if not snapshot_rows:
+        return
+    rows = [
+        {
+            "nurse_id": row["nurse_id"],
+            "snapshot_id": row["id"],
+            **{key: row[key] for key in _CURRENT_RISK_COLUMNS},
+        }
+        for row in snapshot_rows
+    ]
+    stmt = pg_insert(BurnoutCurrentRisk).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[BurnoutCurrentRisk.nurse_id],
+        set_={
+            "snapshot_id": stmt.excluded.snapshot_id,
+            **{key: stmt.excluded[key] for key in _CURRENT_RISK_COLUMNS},
+        },
+        where=BurnoutCurrentRisk.snapshot_date <= stmt.excluded.snapshot_date,
+    )
+    db.execute(stmt)
+
+
 def run_burnout_assessment(
     db: Session,
     organization_id: str,
@@ -217,38 +304,122 @@ def run_burnout_assessment(
     config = _get_config(db, organization_id)
     weights = config.weights or DEFAULT_WEIGHTS
 
-    factor_scores = compute_factor_scores(metrics, nurse)
-    overall = compute_overall_risk(factor_scores, weights)
-    risk_level = classify_risk(overall, config)
-
     # Get previous snapshot for trend
     prev = db.query(BurnoutSnapshot).filter(
         BurnoutSnapshot.nurse_id == nurse.id,
         BurnoutSnapshot.organization_id == organization_id,
     ).order_by(BurnoutSnapshot.snapshot_date.desc()).first()
 
-    trend = compute_trend(overall, prev.overall_risk_score if prev else None)
-
-    snapshot = BurnoutSnapshot(
-        organization_id=organization_id,
-        nurse_id=nurse.id,
-        overall_risk_score=overall,
-        risk_level=risk_level,
-        overtime_score=factor_scores.get("overtime"),
-        schedule_density_score=factor_scores.get("schedule_density"),
-        night_shift_load_score=factor_scores.get("night_shift_load"),
-        weekend_load_score=factor_scores.get("weekend_load"),
-        short_rest_score=factor_scores.get("short_rest"),
-        pattern_disruption_score=factor_scores.get("pattern_disruption"),
-        tenure_risk_score=factor_scores.get("tenure_risk"),
-        metrics=metrics,
-        previous_risk_score=prev.overall_risk_score if prev else None,
-        trend=trend,
-    )
+    snapshot = BurnoutSnapshot(**_snapshot_values(
+        organization_id,
+        nurse,
+        metrics,
+        config,
+        weights,
+        prev.overall_risk_score if prev else None,
+    ))
     db.add(snapshot)
     db.flush()
 
+    _upsert_current_risk(db, [{
+        "id": snapshot.id,
+        "nurse_id": snapshot.nurse_id,
+        **{key: getattr(snapshot, key) for key in _CURRENT_RISK_COLUMNS},
+    }])
     generate_alert_if_needed(db, snapshot, config, nurse)
     db.commit()
     db.refresh(snapshot)
     return snapshot
+
+
+def _previous_risk_scores(
+    db: Session,
+    organization_id: str,
+    nurse_ids: List[Any],
+) -> Dict[Any, float]:
+    """Latest snapshot score per nurse, read from burnout_current_risk."""
+    if not nurse_ids:
+        return {}
+    rows = (
+        db.query(BurnoutCurrentRisk.nurse_id, BurnoutCurrentRisk.overall_risk_score)
+        .filter(
+            BurnoutCurrentRisk.organization_id == organization_id,
+            BurnoutCurrentRisk.nurse_id.in_(nurse_ids),
+        )
+        .all()
+    )
+    return {nurse_id: score for nurse_id, score in rows}
+
+
+_ALERT_INSERT_COLUMNS = (
+    "organization_id",
+    "nurse_id",
+    "snapshot_id",
+    "alert_type",
+    "severity",
+    "title",
+    "message",
+    "recommendation",
+)
+
+
+def run_burnout_assessments(
+    db: Session,
+    organization_id: str,
+    nurses: List[Nurse],
+    metrics_by_nurse: Dict[str, Dict[str, Any]],
+) -> List[BurnoutSnapshot]:
+    """Assess many nurses with a fixed number of statements.
+
+    Loads the config and every nurse's previous score once, then writes all
+    snapshots, current-risk rows and alerts with one multi-row statement
+    each, in one transaction. New alerts raise one summary notification
+    per manager.
+    The returned snapshots are detached copies of the inserted rows.
+    """
+    if not nurses:
+        return []
+    config = _get_config(db, organization_id)
+    weights = config.weights or DEFAULT_WEIGHTS
+    previous = _previous_risk_scores(db, organization_id, [n.id for n in nurses])
+
+    now = datetime.utcnow()
+    snapshot_rows: List[Dict[str, Any]] = []
+    alert_rows: List[Dict[str, Any]] = []
+    snapshots: List[BurnoutSnapshot] = []
+    for nurse in nurses:
+        values = _snapshot_values(
+            organization_id,
+            nurse,
+            metrics_by_nurse.get(str(nurse.id), {}),
+            config,
+            weights,
+            previous.get(nurse.id),
+        )
+        values.update(id=uuid.uuid4(), snapshot_date=now, created_at=now)
+        snapshot = BurnoutSnapshot(**values)
+        snapshots.append(snapshot)
+        snapshot_rows.append(values)
+
+        alert = build_alert(snapshot, config, nurse)
+        if alert is not None:
+            alert_rows.append({key: getattr(alert, key) for key in _ALERT_INSERT_COLUMNS})
+
+    try:
+        db.execute(insert(BurnoutSnapshot), snapshot_rows)
+        _upsert_current_risk(db, snapshot_rows)
+        if alert_rows:
+            db.execute(insert(BurnoutAlert), alert_rows)
+            fan_out_notifications(
+                db,
+                organization_id=organization_id,
+                roles=MANAGER_ROLES,
+                type="burnout_alert",
+                title=f"{len(alert_rows)} new burnout alert(s)",
+                link="/burnout",
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return snapshots
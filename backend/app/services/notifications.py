@@ -0,0 +1,182 @@
+"""
+Notification fan-out and per-user unread counters.
+
+Broadcasts resolve their audience with one query and write every
+notification row with one multi-row insert:
+
+    fan_out_notifications(
+        db, organization_id=org_id, team="Heme-Onc",
+        type="announcement", title="New policy", link="/announcements",
+    )
+    db.commit()
+
+Every insert and read-state change also adjusts ``notification_unread_counts``
+in the same transaction, so the unread badge is a primary-key lookup instead
+of a COUNT(*) per poll, and new notifications are pushed to connected
+clients (``app.core.event_bus``) when the transaction commits. Nothing here
+commits.
+"""
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import exists, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.event_bus import publish_event
+from app.models.notification import Notification, NotificationUnreadCount
+from app.models.nurse import Nurse
+from app.models.organization import MemberRole, OrganizationMember
+
+# Roles that receive operational alerts (e.g. burnout).
+MANAGER_ROLES = (MemberRole.ADMIN, MemberRole.MANAGER, MemberRole.ASSISTANT_MANAGER)
+
+
+def audience_user_ids(
+    db: Session,
+    organization_id: str,
+    team: Optional[str] = None,
+    roles: Optional[Sequence[MemberRole]] = None,
+    exclude_user_ids: Iterable[str] = (),
+) -> List[str]:
+    """User ids of the org's active, approved members matching the filters.
+
+    ``team`` matches the member's nurse profile team, as announcement
+    targeting does.
+    """
+    query = select(OrganizationMember.user_id).where(
+        OrganizationMember.organization_id == organization_id,
+        OrganizationMember.is_active == True,
+        OrganizationMember.is_approved == True,
+    )
+    if roles:
+        query = query.where(OrganizationMember.role.in_(list(roles)))
+    if team:
+        query = query.where(
+            exists().where(
+                Nurse.organization_id == OrganizationMember.organization_id,
+                Nurse.user_id == OrganizationMember.user_id,
+                Nurse.team == team,
+            )
+        )
+    excluded = [user_id for user_id in exclude_user_ids if user_id]
+    if excluded:
+        query = query.where(OrganizationMember.user_id.notin_(excluded))
+    return list(db.execute(query.distinct()).scalars())
+
+
+def notify_users(
+    db: Session,
+    user_ids: Iterable[str],
+    *,
+    title: str,
+    body: Optional[str] = None,
+    organization_id: Optional[str] = None,
+    type: str = "info",
+    link: Optional[str] = None,
+) -> int:
+    """Insert one notification per user id in a single statement."""
+    user_ids = list(dict.fromkeys(u for u in user_ids if u))
+    if not user_ids:
+        return 0
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "organization_id": organization_id,
+            "user_id": user_id,
+            "type": type,
+            "title": title[:200],
+            "body": body,
+            "link": link,
+            "is_read": False,
+            "created_at": now,
+        }
+        for user_id in user_ids
+    ]
+    db.execute(insert(Notification), rows)
+    increment_unread(db, Counter(user_ids))
+    publish_notification_event(db, {row["user_id"]: str(row["id"]) for row in rows}, rows[0])
+    return len(user_ids)
+
+
+def publish_notification_event(db: Session, refs: Dict[str, str], values: Dict) -> None:
+    """Push new notifications to connected clients once ``db`` commits.
+
+    ``refs`` maps each recipient to their notification id; the body is left
+    out to keep the event small.
+    """
+    publish_event(
+        db,
+        "notification",
+        {
+            "organization_id": values.get("organization_id"),
+            "type": values.get("type"),
+            "title": values.get("title"),
+            "link": values.get("link"),
+            "is_read": False,
+            "created_at": values.get("created_at"),
+        },
+        users=refs,
+    )
+
+
+def fan_out_notifications(
+    db: Session,
+    *,
+    organization_id: str,
+    title: str,
+    body: Optional[str] = None,
+    type: str = "info",
+    link: Optional[str] = None,
+    team: Optional[str] = None,
+    roles: Optional[Sequence[MemberRole]] = None,
+    exclude_user_ids: Iterable[str] = (),
+) -> int:
+    """Notify an org (optionally narrowed to a team and/or roles).
+
+    One audience query plus one multi-row insert and one counter upsert,
+    regardless of audience size. Returns the number of notifications.
+    """
+    user_ids = audience_user_ids(db, organization_id, team, roles, exclude_user_ids)
+    return notify_users(
+        db,
+        user_ids,
+        title=title,
+        body=body,
+        organization_id=organization_id,
+        type=type,
+        link=link,
+    )
+
+
+def increment_unread(db: Session, counts: Dict[str, int]) -> None:
+    """Add ``counts`` (user_id -> n) to the unread counters in one upsert."""
+    rows = [{"user_id": user_id, "unread": n} for user_id, n in counts.items() if n > 0]
+    if not rows:
+        return
+    stmt = pg_insert(NotificationUnreadCount)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NotificationUnreadCount.user_id],
+        set_={"unread": NotificationUnreadCount.unread + stmt.excluded.unread},
+    )
+    db.execute(stmt, rows)
+
+
+def decrement_unread(db: Session, user_id: str, n: int = 1) -> None:
+    """Subtract ``n`` from a user's unread counter, never going below zero."""
+    if n <= 0:
+        return
+    db.execute(
+        update(NotificationUnreadCount)
+        .where(NotificationUnreadCount.user_id == user_id)
+        .values(unread=func.greatest(NotificationUnreadCount.unread - n, 0))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def unread_count(db: Session, user_id: str) -> int:
+    row = db.get(NotificationUnreadCount, user_id)
+    return row.unread if row else 0
@@ -0,0 +1,129 @@
+"""Content-hash cache for parsed roster OCR results.
+
+Managers re-upload the same roster photo while iterating on a schedule, so
+results are keyed by the SHA-256 of the image bytes plus the requested date
+range:
+
+    result = ocr_cache.get_or_parse(image_bytes, start, end, parse)
+
+Lookups try an in-process LRU first, then the ``ocr_results`` table, and
+only call ``parse`` (Textract) on a miss. ``bypass=True`` skips both reads,
+for when a manager wants a fresh OCR, but still stores the new result.
+Results carrying an ``error`` are never cached. The cache is best-effort:
+database failures are logged and the upload falls through to Textract.
+"""
+import hashlib
+import logging
+import os
+import threading
+from collections import Counter
+from datetime import date, datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.ttl_cache import TTLCache
+from app.db.database import SessionLocal
+from app.models.ocr_result import OcrResult
+
+logger = logging.getLogger(__name__)
+
+OCR_CACHE_SIZE = int(os.getenv("OCR_CACHE_SIZE", "256"))
+OCR_CACHE_TTL = float(os.getenv("OCR_CACHE_TTL", "3600"))
+
+CacheKey = Tuple[str, date, date]
+
+
+def image_digest(image_bytes: bytes) -> str:
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+class OcrResultCache:
+    def __init__(self, maxsize: int = OCR_CACHE_SIZE, ttl: float = OCR_CACHE_TTL):
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def get_or_parse(
+        self,
+        image_bytes: bytes,
+        start_date: date,
+        end_date: date,
+        parse: Callable[[], Dict],
+        bypass: bool = False,
+    ) -> Dict:
+        key: CacheKey = (image_digest(image_bytes), start_date, end_date)
+        if bypass:
+            self._count("bypassed")
+        else:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._count("memory_hits")
+                return cached
+            cached = self._load(key)
+            if cached is not None:
+                self._count("db_hits")
+                self._memory.put(key, cached)
+                return cached
+            self._count("misses")
+
+        result = parse()
+        if not result.get("error"):
+            self._memory.put(key, result)
+            self._store(key, result)
+        return result
+
+    def _load(self, key: CacheKey) -> Optional[Dict]:
+        db = SessionLocal()
+        try:
+            return db.query(OcrResult.result).filter(
+                OcrResult.image_sha256 == key[0],
+                OcrResult.start_date == key[1],
+                OcrResult.end_date == key[2],
+            ).scalar()
+        except Exception as e:
+            logger.warning(f"OCR cache lookup failed: {e}")
+            return None
+        finally:
+            db.close()
+
+    def _store(self, key: CacheKey, result: Dict) -> None:
+        db = SessionLocal()
+        try:
+            stmt = pg_insert(OcrResult).values(
+                image_sha256=key[0],
+                start_date=key[1],
+                end_date=key[2],
+                result=result,
+                created_at=datetime.utcnow(),
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[OcrResult.image_sha256, OcrResult.start_date, OcrResult.end_date],
+                set_={"result": stmt.excluded.result, "created_at": stmt.excluded.created_at},
+            )
+            db.execute(stmt)
+            db.commit()
+            self._count("stored")
+        except Exception as e:
+            db.rollback()
+            self._count("store_failed")
+            logger.warning(f"OCR cache store failed: {e}")
+        finally:
+            db.close()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counters[key] += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = {
+                key: self._counters[key]
+                for key in ("memory_hits", "db_hits", "misses", "bypassed", "stored", "store_failed")
+            }
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["db_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+
+ocr_cache = OcrResultCache()
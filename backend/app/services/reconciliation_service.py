@@ -5,15 +5,38 @@ Handles:
 - B-Shift (balancing shift) recommendation logic
 - Vacation offset adjustments
 - Compliance scoring
+- Org-wide batch reconciliation over rolling windows
 """
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import math
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from app.models import (
     Nurse, 
     NurseHoursReconciliation, 
     TimeOffRequest, 
-    OptimizedSchedule
+    ShiftAssignment
+)
+from app.utils.hours_windows import HoursWindows, RECONCILIATION_DAYS, reconcile_windows
+
+VACATION_REASONS = ["vacation", "personal"]
+COMPLIANCE_TOLERANCE_HOURS = 5.0
+
+# Columns refreshed when a pending reconciliation is recalculated.
+_RECALCULATED_COLUMNS = (
+    "bi_weekly_target",
+    "hours_worked",
+    "hours_worked_with_vacation_offset",
+    "adjusted_target",
+    "delta",
+    "balancing_shift_needed",
+    "balancing_shift_hours",
+    "vacation_days_count",
 )
 
 
@@ -57,7 +80,7 @@ class ReconciliationService:
         requests = db.query(TimeOffRequest).filter(
             TimeOffRequest.nurse_id == nurse_id,
             TimeOffRequest.status == "approved",
-            TimeOffRequest.reason.in_(["vacation", "personal"]),
+            TimeOffRequest.reason.in_(VACATION_REASONS),
             TimeOffRequest.start_date <= end_date,
             TimeOffRequest.end_date >= start_date
         ).all()
@@ -110,7 +133,8 @@ class ReconciliationService:
         """
         Sum paid hours from all shifts in period.
         
-        Uses shift.paid_hours (total_hours - unpaid_break_hours).
+        Uses the paid_hours published to shift_assignments when a schedule
+        is finalized (shift code paid_hours, else the grid cell hours).
         
         Args:
             db: Database session
@@ -121,22 +145,16 @@ class ReconciliationService:
         Returns:
             Total paid hours worked
         """
-        # Query OptimizedSchedule records for this nurse in date range
-        schedules = db.query(OptimizedSchedule).filter(
-            OptimizedSchedule.nurse_id == nurse_id,
-            OptimizedSchedule.date >= start_date,
-            OptimizedSchedule.date <= end_date,
-            OptimizedSchedule.is_deleted == False
-        ).all()
-        
-        total_paid_hours = 0.0
-        
-        for schedule in schedules:
-            if schedule.shift_code:
-                # Use paid_hours from shift_code
-                total_paid_hours += schedule.shift_code.paid_hours or 0.0
-        
-        return total_paid_hours
+        # One indexed sum over the finalized shift-assignment facts
+        total_paid_hours = db.query(
+            func.coalesce(func.sum(ShiftAssignment.paid_hours), 0.0)
+        ).filter(
+            ShiftAssignment.nurse_id == nurse_id,
+            ShiftAssignment.date >= start_date,
+            ShiftAssignment.date <= end_date,
+        ).scalar()
+        
+        return float(total_paid_hours or 0.0)
     
     @staticmethod
     def calculate_balancing_shift(
@@ -243,6 +261,176 @@ class ReconciliationService:
         
         return reconciliation
     
+    @staticmethod
+    def load_hours_windows(
+        db: Session,
+        organization_id: str,
+        nurses: Sequence[Nurse],
+        first_end_date: str,
+        last_end_date: str
+    ) -> HoursWindows:
+        """
+        Load daily paid hours and vacation days for every 28-day window
+        ending between first_end_date and last_end_date.
+        
+        Two queries for the whole organization: paid hours grouped by nurse
+        and day, and the approved vacation ranges overlapping the span.
+        
+        Args:
+            db: Database session
+            organization_id: Org ID
+            nurses: Nurses to load, in result row order
+            first_end_date: YYYY-MM-DD end of the earliest window
+            last_end_date: YYYY-MM-DD end of the latest window
+            
+        Returns:
+            HoursWindows prefix sums (rows aligned with nurses)
+        """
+        first_day = date.fromisoformat(first_end_date) - timedelta(days=RECONCILIATION_DAYS - 1)
+        last_day = date.fromisoformat(last_end_date)
+        days = (last_day - first_day).days + 1
+        row_by_nurse = {str(n.id): i for i, n in enumerate(nurses)}
+        
+        daily_hours = np.zeros((len(nurses), days))
+        daily_vacation = np.zeros((len(nurses), days), dtype=bool)
+        
+        hours_by_day = db.query(
+            ShiftAssignment.nurse_id,
+            ShiftAssignment.date,
+            func.sum(ShiftAssignment.paid_hours)
+        ).filter(
+            ShiftAssignment.organization_id == organization_id,
+            ShiftAssignment.date >= first_day.isoformat(),
+            ShiftAssignment.date <= last_day.isoformat(),
+            ShiftAssignment.nurse_id != None
+        ).group_by(
+            ShiftAssignment.nurse_id,
+            ShiftAssignment.date
+        ).all()
+        
+        for nurse_id, day, paid_hours in hours_by_day:
+            row = row_by_nurse.get(str(nurse_id))
+            if row is None:
+                continue
+            daily_hours[row, (date.fromisoformat(day) - first_day).days] = paid_hours or 0.0
+        
+        vacations = db.query(
+            TimeOffRequest.nurse_id,
+            TimeOffRequest.start_date,
+            TimeOffRequest.end_date
+        ).filter(
+            TimeOffRequest.organization_id == organization_id,
+            TimeOffRequest.status == "approved",
+            TimeOffRequest.reason.in_(VACATION_REASONS),
+            TimeOffRequest.start_date <= last_day.isoformat(),
+            TimeOffRequest.end_date >= first_day.isoformat()
+        ).all()
+        
+        for nurse_id, start_date, end_date in vacations:
+            row = row_by_nurse.get(str(nurse_id))
+            if row is None:
+                continue
+            try:
+                first = max((date.fromisoformat(start_date) - first_day).days, 0)
+                last = min((date.fromisoformat(end_date) - first_day).days, days - 1)
+            except ValueError:
+                continue
+            # Overlapping requests count each day once
+            daily_vacation[row, first:last + 1] = True
+        
+        return HoursWindows.from_daily(
+            list(row_by_nurse), first_day, daily_hours, daily_vacation
+        )
+    
+    @staticmethod
+    def calculate_reconciliations_batch(
+        db: Session,
+        nurses: Sequence[Nurse],
+        period_end_dates: Sequence[str],
+        organization_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate reconciliations for every nurse and every window at once.
+        
+        Windows are read from shared prefix sums, so each additional
+        period_end_date costs O(nurses) instead of new queries.
+        
+        Args:
+            db: Database session
+            nurses: Nurses to reconcile
+            period_end_dates: YYYY-MM-DD window end dates
+            organization_id: Org ID
+            
+        Returns:
+            Row dicts ready for upsert_reconciliations
+        """
+        end_dates = sorted(set(period_end_dates))
+        if not nurses or not end_dates:
+            return []
+        
+        windows = ReconciliationService.load_hours_windows(
+            db, organization_id, nurses, end_dates[0], end_dates[-1]
+        )
+        targets = np.array([float(n.bi_weekly_target_hours or 0.0) for n in nurses])
+        
+        rows: List[Dict[str, Any]] = []
+        for period_end_date in end_dates:
+            period_start_date, _ = ReconciliationService.calculate_28day_window(period_end_date)
+            hours, vacation_days = windows.window(date.fromisoformat(period_end_date))
+            results = reconcile_windows(hours, vacation_days, targets)
+            
+            for i, nurse in enumerate(nurses):
+                balancing_hours = results["balancing_shift_hours"][i].item()
+                balancing_needed = not math.isnan(balancing_hours)
+                hours_worked = results["hours_worked"][i].item()
+                rows.append({
+                    "id": str(uuid4()),
+                    "organization_id": organization_id,
+                    "nurse_id": nurse.id,
+                    "period_start_date": period_start_date,
+                    "period_end_date": period_end_date,
+                    "bi_weekly_target": nurse.bi_weekly_target_hours,
+                    "hours_worked": hours_worked,
+                    "hours_worked_with_vacation_offset": hours_worked,
+                    "adjusted_target": results["adjusted_target"][i].item(),
+                    "delta": results["delta"][i].item(),
+                    "balancing_shift_needed": balancing_needed,
+                    "balancing_shift_hours": balancing_hours if balancing_needed else None,
+                    "vacation_days_count": results["vacation_days_count"][i].item(),
+                    "status": "pending",
+                })
+        
+        return rows
+    
+    @staticmethod
+    def upsert_reconciliations(
+        db: Session,
+        rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Insert or refresh reconciliation rows in one statement.
+        
+        Existing rows for the same nurse and period are only recalculated
+        while still pending; reconciled/approved rows are left as signed off.
+        Does not commit.
+        """
+        if not rows:
+            return
+        
+        stmt = pg_insert(NurseHoursReconciliation)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                NurseHoursReconciliation.nurse_id,
+                NurseHoursReconciliation.period_start_date
+            ],
+            set_={
+                **{key: stmt.excluded[key] for key in _RECALCULATED_COLUMNS},
+                "updated_at": func.now(),
+            },
+            where=NurseHoursReconciliation.status == "pending"
+        )
+        db.execute(stmt, rows)
+    
     @staticmethod
     def get_compliance_score(
         db: Session,
@@ -265,13 +453,31 @@ class ReconciliationService:
             - avg_delta: float
             - nurses_needing_bshift: int
         """
-        # Get latest reconciliation for each nurse
-        reconciliations = db.query(NurseHoursReconciliation).filter(
+        # Latest reconciliation for each nurse, aggregated in SQL
+        latest = db.query(
+            NurseHoursReconciliation.nurse_id,
+            NurseHoursReconciliation.delta,
+            NurseHoursReconciliation.balancing_shift_needed
+        ).filter(
             NurseHoursReconciliation.organization_id == organization_id,
             NurseHoursReconciliation.status.in_(["pending", "reconciled", "approved"])
-        ).all()
-        
-        if not reconciliations:
+        ).distinct(
+            NurseHoursReconciliation.nurse_id
+        ).order_by(
+            NurseHoursReconciliation.nurse_id,
+            NurseHoursReconciliation.period_start_date.desc()
+        ).subquery()
+        
+        tolerance = COMPLIANCE_TOLERANCE_HOURS  # ±5 hours tolerance
+        
+        total, compliant, avg_delta, needing_bshift = db.query(
+            func.count(),
+            func.count().filter(func.abs(latest.c.delta) <= tolerance),
+            func.avg(latest.c.delta),
+            func.count().filter(latest.c.balancing_shift_needed == True)
+        ).one()
+        
+        if not total:
             return {
                 "score": 100,
                 "total_nurses": 0,
@@ -280,15 +486,9 @@ class ReconciliationService:
                 "nurses_needing_bshift": 0
             }
         
-        tolerance = 5.0  # ±5 hours tolerance
-        
-        total = len(reconciliations)
-        compliant = sum(1 for r in reconciliations if abs(r.delta) <= tolerance)
-        avg_delta = sum(r.delta for r in reconciliations) / total if total > 0 else 0
-        needing_bshift = sum(1 for r in reconciliations if r.balancing_shift_needed)
-        
         # Score: (compliant / total) * 100
-        score = int((compliant / total) * 100) if total > 0 else 100
+        score = int((compliant / total) * 100)
+        avg_delta = float(avg_delta or 0.0)
         
         return {
             "score": score,
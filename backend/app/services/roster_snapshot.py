@@ -0,0 +1,223 @@
+"""
+Per-organization roster snapshot shared by the optimize pipeline.
+
+An /optimize request needs the same roster facts several times: leave flags
+(leave enforcement), staffing role and team (staffing profile), and contract
+targets and certifications (defaults for nurses missing from the payload).
+``load_roster_snapshot`` reads them in one query into an immutable snapshot
+indexed by normalized nurse name, and caches it per organization.
+
+The cache is keyed by a roster version that bumps whenever a ``nurses`` or
+``organizations`` invalidation arrives on the cache bus, so nurse writes in
+any worker take effect on the next optimization. The TTL bounds staleness if
+the bus is down.
+"""
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.cache_bus import register_invalidator
+from app.core.ttl_cache import TTLCache
+from app.models.nurse import Nurse
+from app.models.organization import Organization
+
+ROSTER_CACHE_TTL = 120
+ROSTER_CACHE_SIZE = 256
+
+
+def roster_name_key(name: Any) -> str:
+    """Normalize a nurse name for roster matching (accent/case/spacing safe)."""
+    text = unicodedata.normalize("NFKD", str(name or ""))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+@dataclass(frozen=True)
+class RosterNurse:
+    """Scheduling-relevant facts for one nurse on the roster."""
+    name: str
+    user_id: Optional[str]
+    staffing_role: str
+    team: Optional[str]
+    employment_type: str
+    max_weekly_hours: float
+    bi_weekly_target_hours: float
+    is_chemo_certified: bool
+    is_transplant_certified: bool
+    is_renal_certified: bool
+    is_charge_certified: bool
+    is_on_maternity_leave: bool
+    is_on_sick_leave: bool
+    is_on_sabbatical: bool
+
+    @property
+    def is_on_leave(self) -> bool:
+        return self.is_on_maternity_leave or self.is_on_sick_leave or self.is_on_sabbatical
+
+    def leave_flags(self) -> Dict[str, bool]:
+        return {
+            "isOnMaternityLeave": self.is_on_maternity_leave,
+            "isOnSickLeave": self.is_on_sick_leave,
+            "isOnSabbatical": self.is_on_sabbatical,
+        }
+
+    def defaults(self) -> Dict[str, Any]:
+        """Optimizer config for a nurse missing from the frontend payload."""
+        return {
+            "employmentType": self.employment_type,
+            "maxWeeklyHours": self.max_weekly_hours,
+            "targetBiWeeklyHours": self.bi_weekly_target_hours,
+            "isChemoCertified": self.is_chemo_certified,
+            "isTransplantCertified": self.is_transplant_certified,
+            "isRenalCertified": self.is_renal_certified,
+            "isChargeCertified": self.is_charge_certified,
+        }
+
+
+@dataclass(frozen=True)
+class RosterSnapshot:
+    """Immutable view of an organization's roster at one roster version."""
+    organization_id: str
+    version: int
+    weekend_team_rotation_enabled: bool
+    nurses: Tuple[RosterNurse, ...]
+    by_key: Mapping[str, RosterNurse] = field(repr=False)
+
+    def get(self, name: Any) -> Optional[RosterNurse]:
+        return self.by_key.get(roster_name_key(name))
+
+    def nurse_defaults(self) -> Dict[str, Dict[str, Any]]:
+        """``nurse_defaults`` for the optimizer, keyed by lowercase name."""
+        return {nurse.name.strip().lower(): nurse.defaults() for nurse in self.nurses}
+
+
+_ROSTER_COLUMNS = (
+    Nurse.name,
+    Nurse.user_id,
+    Nurse.staffing_role,
+    Nurse.team,
+    Nurse.employment_type,
+    Nurse.max_weekly_hours,
+    Nurse.bi_weekly_target_hours,
+    Nurse.is_chemo_certified,
+    Nurse.is_transplant_certified,
+    Nurse.is_renal_certified,
+    Nurse.is_charge_certified,
+    Nurse.is_on_maternity_leave,
+    Nurse.is_on_sick_leave,
+    Nurse.is_on_sabbatical,
+)
+
+_snapshots = TTLCache(maxsize=ROSTER_CACHE_SIZE, ttl=ROSTER_CACHE_TTL)
+_versions: Dict[str, int] = {}
+_global_version = 0
+_versions_lock = threading.Lock()
+
+
+def roster_version(organization_id: str) -> int:
+    # Both counters only grow, so the sum changes whenever either bumps.
+    with _versions_lock:
+        return _global_version + _versions.get(organization_id, 0)
+
+
+def bump_roster_version(organization_id: Optional[str] = None) -> None:
+    """Mark an org's roster (or every roster, when None) as changed."""
+    global _global_version
+    with _versions_lock:
+        if organization_id is None:
+            _global_version += 1
+        else:
+            _versions[organization_id] = _versions.get(organization_id, 0) + 1
+    if organization_id is None:
+        _snapshots.clear()
+    else:
+        _snapshots.pop(organization_id)
+
+
+def clear_roster_snapshots() -> None:
+    """Drop every cached snapshot (tests, or after out-of-band roster edits)."""
+    _snapshots.clear()
+
+
+register_invalidator("nurses", bump_roster_version)
+# weekend_team_rotation_enabled lives on the organization row.
+register_invalidator("organizations", bump_roster_version)
+
+
+def _build_snapshot(
+    db: Session,
+    organization_id: str,
+    version: int,
+    organization: Optional[Organization],
+) -> RosterSnapshot:
+    if organization is None:
+        organization = (
+            db.query(Organization)
+            .filter(Organization.id == organization_id)
+            .first()
+        )
+    weekend_rotation = bool(getattr(organization, "weekend_team_rotation_enabled", False))
+
+    rows = (
+        db.query(*_ROSTER_COLUMNS)
+        .filter(Nurse.organization_id == organization_id)
+        .all()
+    )
+    nurses = tuple(
+        RosterNurse(
+            name=row.name,
+            user_id=row.user_id,
+            staffing_role=row.staffing_role or "nurse",
+            team=row.team,
+            employment_type=row.employment_type or "full-time",
+            max_weekly_hours=row.max_weekly_hours or 60,
+            bi_weekly_target_hours=row.bi_weekly_target_hours or 75,
+            is_chemo_certified=bool(row.is_chemo_certified),
+            is_transplant_certified=bool(row.is_transplant_certified),
+            is_renal_certified=bool(row.is_renal_certified),
+            is_charge_certified=bool(row.is_charge_certified),
+            is_on_maternity_leave=bool(row.is_on_maternity_leave),
+            is_on_sick_leave=bool(row.is_on_sick_leave),
+            is_on_sabbatical=bool(row.is_on_sabbatical),
+        )
+        for row in rows
+    )
+    # Later rows win on duplicate keys, matching the previous dict-building loops.
+    by_key = {roster_name_key(nurse.name): nurse for nurse in nurses}
+    return RosterSnapshot(
+        organization_id=organization_id,
+        version=version,
+        weekend_team_rotation_enabled=weekend_rotation,
+        nurses=nurses,
+        by_key=MappingProxyType(by_key),
+    )
+
+
+def load_roster_snapshot(
+    db: Session,
+    organization_id: Optional[str],
+    organization: Optional[Organization] = None,
+) -> Optional[RosterSnapshot]:
+    """Return the cached roster snapshot for ``organization_id``.
+
+    ``organization`` (e.g. ``auth.organization``) saves the org lookup on a
+    miss. Returns None without an organization.
+    """
+    if not organization_id:
+        return None
+    organization_id = str(organization_id)
+    version = roster_version(organization_id)
+    cached = _snapshots.get(organization_id)
+    if cached is not None and cached.version == version:
+        return cached
+
+    snapshot = _build_snapshot(db, organization_id, version, organization)
+    # A write that landed while we were loading bumps the version again, so
+    # the stale snapshot fails the check above on the next call.
+    _snapshots.put(organization_id, snapshot)
+    return snapshot
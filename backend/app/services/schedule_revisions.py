@@ -0,0 +1,289 @@
+"""
+Delta storage for optimized-schedule revision families.
+
+Drafts and revisions of a schedule usually differ from their ``revision_of``
+parent by a handful of cells. Instead of persisting a full roster per
+revision we keep:
+
+  - periodic full snapshots (``OptimizedSchedule.result``), and
+  - JSON-Patch deltas against the parent for intermediate revisions
+    (``delta_base_id`` + ``delta``).
+
+Reads go through ``load_schedule_payload`` which walks the delta chain back to
+the nearest snapshot and caches recently materialized versions in-process.
+"""
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.optimized_schedule import OptimizedSchedule
+from app.utils.json_patch import (
+    JsonPatchError,
+    apply_patch,
+    diff_payloads,
+    escape_token,
+    resolve_pointer,
+)
+
+logger = logging.getLogger(__name__)
+
+# Every Nth revision in a chain is stored as a full snapshot so reads never
+# replay more than SNAPSHOT_INTERVAL - 1 deltas.
+SNAPSHOT_INTERVAL = 8
+# A delta larger than this fraction of the full payload is not worth it.
+MAX_DELTA_RATIO = 0.5
+MATERIALIZED_CACHE_SIZE = 64
+# Grid the scheduler editor autosaves; cell edits target it unless told otherwise.
+DEFAULT_EDIT_GRID = "/draft_state/optimizedGrid"
+
+
+class _MaterializedCache:
+    """Small thread-safe LRU of reconstructed payloads."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[str, str], value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, schedule_id: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == schedule_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_materialized_cache = _MaterializedCache(MATERIALIZED_CACHE_SIZE)
+
+
+def _cache_key(schedule: OptimizedSchedule) -> Tuple[str, str]:
+    # version bumps on every payload write, so a rewrite by another worker
+    # never serves a stale materialization.
+    return str(schedule.id), str(schedule.version or 0)
+
+
+def is_delta_stored(schedule: OptimizedSchedule) -> bool:
+    return schedule.result is None and schedule.delta_base_id is not None
+
+
+def load_schedule_payload(db: Session, schedule: OptimizedSchedule) -> Dict[str, Any]:
+    """Return the full ``result`` payload for a schedule, replaying deltas if needed.
+
+    The returned dict is shared with the cache and must be treated as read-only.
+    """
+    if not is_delta_stored(schedule):
+        return schedule.result if isinstance(schedule.result, dict) else {}
+
+    key = _cache_key(schedule)
+    cached = _materialized_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Walk back to the nearest snapshot (or cached ancestor), then replay.
+    chain: List[OptimizedSchedule] = []
+    current = schedule
+    base_payload: Optional[Dict[str, Any]] = None
+    visited = set()
+    while is_delta_stored(current):
+        current_id = str(current.id)
+        if current_id in visited:
+            raise ValueError(f"Delta chain cycle detected at schedule {current_id}")
+        visited.add(current_id)
+
+        cached_ancestor = _materialized_cache.get(_cache_key(current)) if chain else None
+        if cached_ancestor is not None:
+            base_payload = cached_ancestor
+            break
+
+        chain.append(current)
+        parent = db.get(OptimizedSchedule, current.delta_base_id)
+        if parent is None:
+            raise ValueError(
+                f"Delta base {current.delta_base_id} missing for schedule {current_id}"
+            )
+        current = parent
+
+    if base_payload is None:
+        base_payload = current.result if isinstance(current.result, dict) else {}
+
+    payload = base_payload
+    for revision in reversed(chain):
+        payload = apply_patch(payload, revision.delta or [])
+        _materialized_cache.put(_cache_key(revision), payload)
+
+    return payload
+
+
+def _encoded_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+def _detach_delta_children(db: Session, schedule: OptimizedSchedule) -> None:
+    """Turn revisions that are deltas against ``schedule`` into full snapshots.
+
+    Must run before ``schedule``'s payload is rewritten or the row is deleted,
+    otherwise the children would be replayed against the wrong base.
+    """
+    if schedule.id is None:
+        return
+    children = (
+        db.query(OptimizedSchedule)
+        .filter(OptimizedSchedule.delta_base_id == schedule.id)
+        .all()
+    )
+    if not children:
+        return
+
+    for child in children:
+        payload = copy.deepcopy(load_schedule_payload(db, child))
+        child.result = payload
+        child.delta = None
+        child.delta_base_id = None
+        child.delta_depth = 0
+    logger.info(
+        f"Materialized {len(children)} delta revision(s) of schedule {schedule.id}"
+    )
+
+
+def store_schedule_payload(
+    db: Session,
+    schedule: OptimizedSchedule,
+    payload: Dict[str, Any],
+    base: Optional[OptimizedSchedule] = None,
+) -> None:
+    """Persist ``payload`` on ``schedule`` as a snapshot or as a delta against ``base``.
+
+    ``base`` should be the schedule's ``revision_of`` parent. A full snapshot is
+    written when there is no usable base, when the chain has reached
+    SNAPSHOT_INTERVAL, or when the delta would not be meaningfully smaller.
+    The caller commits.
+    """
+    _detach_delta_children(db, schedule)
+    if schedule.id is not None:
+        _materialized_cache.evict(str(schedule.id))
+    schedule.version = (schedule.version or 0) + 1
+
+    if base is not None and (
+        base.id is None
+        or str(base.id) == str(schedule.id)
+        or base.organization_id != schedule.organization_id
+    ):
+        base = None
+
+    depth = (base.delta_depth or 0) + 1 if base is not None else 0
+    if base is not None and depth < SNAPSHOT_INTERVAL:
+        ops = diff_payloads(load_schedule_payload(db, base), payload)
+        if _encoded_size(ops) <= MAX_DELTA_RATIO * _encoded_size(payload):
+            schedule.result = None
+            schedule.delta = ops
+            schedule.delta_base_id = base.id
+            schedule.delta_depth = depth
+            return
+
+    schedule.result = payload
+    schedule.delta = None
+    schedule.delta_base_id = None
+    schedule.delta_depth = 0
+
+
+def apply_cell_edits(payload: Dict[str, Any], edits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply cell-level edits to a copy of ``payload`` and return it.
+
+    Each edit is ``{"nurse", "date", "changes", "grid"}``: ``nurse`` matches a
+    grid row by id or name, ``changes`` is merged into that row's shift entry
+    for ``date`` (created if missing) and ``changes=None`` clears the cell.
+    ``grid`` is a JSON Pointer to the row list (DEFAULT_EDIT_GRID by default).
+
+    Raises JsonPatchError when the grid, row or cell cannot be found.
+    """
+    result = payload
+    for edit in edits or []:
+        grid_path = edit.get("grid") or DEFAULT_EDIT_GRID
+        rows = resolve_pointer(result, grid_path)
+        if not isinstance(rows, list):
+            raise JsonPatchError(f"'{grid_path}' is not a grid")
+
+        nurse = str(edit.get("nurse") or "")
+        row_index = next(
+            (
+                i for i, row in enumerate(rows)
+                if isinstance(row, dict) and nurse in (str(row.get("id") or ""), str(row.get("nurse") or ""))
+            ),
+            None,
+        )
+        if row_index is None:
+            raise JsonPatchError(f"No grid row for nurse '{nurse}'")
+
+        shifts_path = f"{grid_path}/{row_index}/shifts"
+        shifts = rows[row_index].get("shifts")
+        if not isinstance(shifts, list):
+            raise JsonPatchError(f"Grid row '{nurse}' has no shifts")
+        date = edit.get("date")
+        shift_index = next(
+            (i for i, shift in enumerate(shifts) if isinstance(shift, dict) and shift.get("date") == date),
+            None,
+        )
+
+        changes = edit.get("changes")
+        if changes is None:
+            if shift_index is None:
+                continue
+            ops = [{"op": "remove", "path": f"{shifts_path}/{shift_index}"}]
+        elif shift_index is None:
+            ops = [{"op": "add", "path": f"{shifts_path}/-", "value": {"date": date, **changes}}]
+        else:
+            ops = [
+                {"op": "add", "path": f"{shifts_path}/{shift_index}/{escape_token(key)}", "value": value}
+                for key, value in changes.items()
+            ]
+        result = apply_patch(result, ops)
+    return result
+
+
+def prepare_schedule_delete(db: Session, schedule: OptimizedSchedule) -> None:
+    """Detach dependent delta revisions so ``schedule`` can be deleted safely."""
+    _detach_delta_children(db, schedule)
+    # Flush the detached children before the DELETE so the FK never dangles.
+    db.flush()
+    _materialized_cache.evict(str(schedule.id))
+
+
+def diff_schedules(
+    db: Session,
+    source: OptimizedSchedule,
+    target: OptimizedSchedule,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Return (ops turning ``source`` into ``target``, "stored" | "computed")."""
+    if (
+        is_delta_stored(target)
+        and source.id is not None
+        and str(target.delta_base_id) == str(source.id)
+    ):
+        return list(target.delta or []), "stored"
+
+    ops = diff_payloads(
+        load_schedule_payload(db, source),
+        load_schedule_payload(db, target),
+    )
+    return ops, "computed"
@@ -0,0 +1,256 @@
+"""
+Shift-assignment facts for finalized schedules.
+
+A finalized roster is exploded into one ``ShiftAssignment`` row per worked
+cell. Each revision family contributes the rows of its active version only:
+
+    schedule.finalized = True
+    publish_shift_assignments(db, schedule, payload)
+    db.commit()
+
+``publish_shift_assignments`` deletes the family's previous rows and bulk
+inserts the new ones in the caller's transaction, so readers see either the
+old version or the new one. ``retract_shift_assignments`` handles a schedule
+going back to draft.
+
+Rosters of different families can cover the same dates (a re-planned
+period saved as a new roster). Only one family owns a date: publishing a
+roster clears every other family's rows inside its period, and dates a
+roster gives up (retracted, or a narrower new version) go back to the
+newest other finalized roster covering them.
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, insert, or_
+from sqlalchemy.orm import Session, defer
+
+from app.models.nurse import Nurse
+from app.models.optimized_schedule import OptimizedSchedule
+from app.models.shift_assignment import ShiftAssignment
+from app.models.shift_code import ShiftCode
+from app.services.roster_snapshot import roster_name_key
+from app.services.schedule_revisions import load_schedule_payload
+from app.utils.date_ranges import DateRange, covering_range, restore_plan, subtract
+
+logger = logging.getLogger(__name__)
+
+OFF_SHIFT_TYPES = ("off", None)
+
+
+def iter_schedule_rows(payload: Dict[str, Any]) -> Iterable[Tuple[str, str, List[Any]]]:
+    """Yield ``(row_id, nurse_name, shifts)`` from any stored schedule shape.
+
+    The manager's edited grid (draft_state.optimizedGrid) wins over the
+    optimizer output when both are present.
+    """
+    schedule_data = payload.get("schedule_data")
+    draft_state = payload.get("draft_state")
+    candidates = [
+        draft_state.get("optimizedGrid") if isinstance(draft_state, dict) else None,
+        schedule_data.get("grid") if isinstance(schedule_data, dict) else None,
+        schedule_data.get("schedule") if isinstance(schedule_data, dict) else None,
+        payload.get("optimized_schedule"),
+        schedule_data if isinstance(schedule_data, dict) else payload,
+    ]
+    for grid in candidates:
+        if isinstance(grid, list) and grid:
+            for row in grid:
+                if isinstance(row, dict) and isinstance(row.get("shifts"), list):
+                    yield str(row.get("id") or ""), str(row.get("nurse") or row.get("name") or ""), row["shifts"]
+            return
+        if isinstance(grid, dict) and any(isinstance(v, list) for v in grid.values()):
+            # Legacy nurse-name -> shifts mapping.
+            for name, shifts in grid.items():
+                if isinstance(shifts, list):
+                    yield "", str(name), shifts
+            return
+
+
+def _family_id(schedule: OptimizedSchedule):
+    return schedule.family_root_id or schedule.id
+
+
+def _assignment_rows(
+    db: Session,
+    schedule: OptimizedSchedule,
+    payload: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    org_id = schedule.organization_id
+    nurses = db.query(Nurse.id, Nurse.name).filter(Nurse.organization_id == org_id).all()
+    by_id = {str(n.id): n.id for n in nurses}
+    by_name = {roster_name_key(n.name): n.id for n in nurses}
+
+    # Org codes override the system defaults (organization_id NULL).
+    codes: Dict[str, ShiftCode] = {}
+    for code in (
+        db.query(ShiftCode)
+        .filter(or_(ShiftCode.organization_id == org_id, ShiftCode.organization_id == None))
+        .order_by(ShiftCode.organization_id.nullsfirst())
+    ):
+        codes[code.code.upper()] = code
+
+    family_id = _family_id(schedule)
+    rows: List[Dict[str, Any]] = []
+    for row_id, name, entries in iter_schedule_rows(payload):
+        nurse_id = by_id.get(row_id) or by_name.get(roster_name_key(name))
+        # Later entries for the same date replace earlier ones.
+        cells: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            if isinstance(entry, dict) and entry.get("date"):
+                cells[str(entry["date"])[:10]] = entry
+
+        for iso_date, entry in cells.items():
+            shift_type = entry.get("shiftType")
+            raw_code = str(entry.get("shift") or entry.get("code") or "").strip()
+            try:
+                hours = float(entry.get("hours") or 0)
+            except (TypeError, ValueError):
+                hours = 0.0
+            if hours <= 0 or shift_type in OFF_SHIFT_TYPES:
+                continue
+
+            code = codes.get(raw_code.upper()) if raw_code else None
+            rows.append({
+                "organization_id": org_id,
+                "nurse_id": nurse_id,
+                "nurse_name": name or row_id,
+                "date": iso_date,
+                "shift_code": raw_code[:20] or None,
+                "shift_code_id": code.id if code else None,
+                "shift_type": str(shift_type)[:20],
+                "start_time": (entry.get("startTime") or (code.start_time if code else None) or None),
+                "end_time": (entry.get("endTime") or (code.end_time if code else None) or None),
+                "paid_hours": float(code.paid_hours) if code and code.paid_hours else hours,
+                "schedule_id": schedule.id,
+                "family_id": family_id,
+            })
+    return rows
+
+
+def _assigned_range(db: Session, organization_id: str, *criteria) -> Optional[DateRange]:
+    first, last = db.query(
+        func.min(ShiftAssignment.date), func.max(ShiftAssignment.date)
+    ).filter(ShiftAssignment.organization_id == organization_id, *criteria).one()
+    return (first, last) if first else None
+
+
+def _clear_range(db: Session, organization_id: str, date_range: DateRange) -> None:
+    db.query(ShiftAssignment).filter(
+        ShiftAssignment.organization_id == organization_id,
+        ShiftAssignment.date.between(*date_range),
+    ).delete(synchronize_session=False)
+
+
+def _restore_gaps(
+    db: Session,
+    organization_id: str,
+    gaps: List[DateRange],
+    exclude_family: Any,
+) -> None:
+    """Give ``gaps`` back to the newest other finalized roster covering them."""
+    if not gaps:
+        return
+    family = func.coalesce(OptimizedSchedule.family_root_id, OptimizedSchedule.id)
+    candidates = (
+        db.query(OptimizedSchedule)
+        .options(defer(OptimizedSchedule.result), defer(OptimizedSchedule.delta))
+        .filter(
+            OptimizedSchedule.organization_id == organization_id,
+            OptimizedSchedule.finalized == True,
+            family != exclude_family,
+            or_(*(
+                and_(OptimizedSchedule.period_start <= last, OptimizedSchedule.period_end >= first)
+                for first, last in gaps
+            )),
+        )
+        .order_by(OptimizedSchedule.created_at.asc())
+        .all()
+    )
+    # Newest finalized version per family is the active one.
+    active: Dict[Any, OptimizedSchedule] = {}
+    for candidate in candidates:
+        active[_family_id(candidate)] = candidate
+
+    rows_by_schedule: Dict[Any, List[Dict[str, Any]]] = {}
+    for candidate, (first, last) in restore_plan(gaps, [
+        (c, c.created_at, covering_range(c.period_start, c.period_end))
+        for c in active.values()
+    ]):
+        if candidate.id not in rows_by_schedule:
+            payload = load_schedule_payload(db, candidate)
+            rows_by_schedule[candidate.id] = _assignment_rows(
+                db, candidate, payload if isinstance(payload, dict) else {}
+            )
+        _clear_range(db, organization_id, (first, last))
+        rows = [row for row in rows_by_schedule[candidate.id] if first <= row["date"] <= last]
+        if rows:
+            db.execute(insert(ShiftAssignment), rows)
+
+
+def publish_shift_assignments(
+    db: Session,
+    schedule: OptimizedSchedule,
+    payload: Optional[Dict[str, Any]] = None,
+    superseded_ids: Sequence[Any] = (),
+) -> int:
+    """Make ``schedule`` the source of its family's shift assignments.
+
+    Replaces the rows of the schedule's family (and of ``superseded_ids``,
+    e.g. un-finalized siblings without a family id) with one bulk insert,
+    and supersedes other families' rows inside the schedule's period.
+    Does not commit. Returns the number of rows written.
+    """
+    if payload is None:
+        payload = load_schedule_payload(db, schedule)
+    org_id = schedule.organization_id
+    family_id = _family_id(schedule)
+    stale = or_(
+        ShiftAssignment.family_id == family_id,
+        ShiftAssignment.schedule_id.in_([schedule.id, *superseded_ids]),
+    )
+    previous = _assigned_range(db, org_id, stale)
+    db.query(ShiftAssignment).filter(stale).delete(synchronize_session=False)
+
+    rows = _assignment_rows(db, schedule, payload if isinstance(payload, dict) else {})
+    covered = covering_range(schedule.period_start, schedule.period_end, [row["date"] for row in rows])
+    if covered is not None:
+        # This roster owns its period: other families' rows there are superseded.
+        _clear_range(db, org_id, covered)
+    if rows:
+        db.execute(insert(ShiftAssignment), rows)
+    if previous is not None:
+        _restore_gaps(db, org_id, subtract(previous, covered), family_id)
+    logger.info(f"Published {len(rows)} shift assignments for schedule {schedule.id}")
+    return len(rows)
+
+
+def retract_shift_assignments(db: Session, schedule: OptimizedSchedule) -> None:
+    """Drop a schedule's rows when it leaves the finalized state.
+
+    Its dates go back to the newest other finalized roster covering them;
+    if another finalized version of the same family remains, it becomes the
+    family's source again. Does not commit.
+    """
+    org_id = schedule.organization_id
+    released = _assigned_range(db, org_id, ShiftAssignment.schedule_id == schedule.id)
+    db.query(ShiftAssignment).filter(
+        ShiftAssignment.schedule_id == schedule.id
+    ).delete(synchronize_session=False)
+    if released is not None:
+        _restore_gaps(db, org_id, [released], _family_id(schedule))
+
+    if schedule.family_root_id is None:
+        return
+    fallback = (
+        db.query(OptimizedSchedule)
+        .filter(
+            OptimizedSchedule.family_root_id == schedule.family_root_id,
+            OptimizedSchedule.finalized == True,
+            OptimizedSchedule.id != schedule.id,
+        )
+        .order_by(OptimizedSchedule.created_at.desc())
+        .first()
+    )
+    if fallback is not None:
+        publish_shift_assignments(db, fallback)
@@ -0,0 +1,52 @@
+"""Cached user -> team lookup used to target announcements and learning.
+
+Listing routes need the caller's team (from their nurse profile) on every
+request. The mapping changes only when a nurse is created, edited, linked
+or deleted, all of which publish a ``nurses`` invalidation, so it is cached
+per ``(organization_id, user_id)`` and evicted by org through the cache bus.
+"""
+import os
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.cache_bus import register_invalidator
+from app.core.ttl_cache import TTLCache
+from app.models.nurse import Nurse
+
+VIEWER_TEAM_CACHE_SIZE = int(os.getenv("VIEWER_TEAM_CACHE_SIZE", "4096"))
+VIEWER_TEAM_CACHE_TTL = float(os.getenv("VIEWER_TEAM_CACHE_TTL", "300"))
+
+# Values are 1-tuples so "no team" can be cached too.
+_teams = TTLCache(maxsize=VIEWER_TEAM_CACHE_SIZE, ttl=VIEWER_TEAM_CACHE_TTL)
+
+
+def viewer_team(db: Session, organization_id: Optional[str], user_id: Optional[str]) -> Optional[str]:
+    """The user's team in the organization, or None without a nurse profile."""
+    if not organization_id or not user_id:
+        return None
+    key = (str(organization_id), str(user_id))
+    cached = _teams.get(key)
+    if cached is not None:
+        return cached[0]
+    team = (
+        db.query(Nurse.team)
+        .filter(
+            Nurse.organization_id == organization_id,
+            Nurse.user_id == user_id,
+        )
+        .limit(1)
+        .scalar()
+    )
+    _teams.put(key, (team,))
+    return team
+
+
+def invalidate_viewer_teams(organization_id: Optional[str] = None) -> None:
+    if organization_id is None:
+        _teams.clear()
+    else:
+        _teams.evict_where(lambda key: key[0] == str(organization_id))
+
+
+register_invalidator("nurses", invalidate_viewer_teams)
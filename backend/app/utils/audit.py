@@ -5,12 +5,91 @@ Usage in routes:
     log_audit(db, request, user_id="clerk_123", action="view",
               resource_type="handover", resource_id="abc-def",
               detail="Viewed handover for Room 301")
+
+Entries are appended to a local write-ahead log (app/utils/audit_wal.py)
+and bulk-inserted into audit_log by a background shipper, so a read pays a
+local append instead of a database insert. Each entry carries an entry_id;
+the shipper inserts with ON CONFLICT DO NOTHING on it, which makes re-shipping
+after a crash harmless. If the WAL is disabled or cannot be written, the
+entry is added to the caller's session as before.
+
+Only read-only entries ("view") are appended immediately. Entries for writes
+are held on the session and appended once it commits, and dropped if it
+rolls back, so audit_log never records a change that did not happen. Such
+calls must be followed by the caller's ``db.commit()``.
+
+Run verify_audit_wal.py to check that every shipped entry reached audit_log
+and to list entries the database rejected (quarantined in failed/).
 """
 import json
-from typing import Optional
+import logging
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import Request
+from app.db.database import SessionLocal
 from app.models.audit_log import AuditLog
+from app.utils.audit_wal import AuditWAL
+
+logger = logging.getLogger(__name__)
+
+AUDIT_WAL_ENABLED = os.getenv("AUDIT_WAL_ENABLED", "1") not in ("0", "false", "False")
+# Must survive restarts (a persistent volume in containers).
+AUDIT_WAL_DIR = os.getenv(
+    "AUDIT_WAL_DIR", str(Path(__file__).resolve().parents[2] / "var" / "audit-wal")
+)
+
+audit_wal = AuditWAL(
+    AUDIT_WAL_DIR,
+    batch_size=int(os.getenv("AUDIT_WAL_BATCH_SIZE", "500")),
+    flush_interval=float(os.getenv("AUDIT_WAL_FLUSH_SECONDS", "1.0")),
+    fsync=os.getenv("AUDIT_WAL_FSYNC", "1") not in ("0", "false", "False"),
+    retain_days=float(os.getenv("AUDIT_WAL_RETAIN_DAYS", "7")),
+    # Rows the database refuses (or that cannot be built) go to failed/.
+    permanent_errors=(ValueError, KeyError, TypeError, DataError, IntegrityError),
+)
+
+
+# Actions that describe no write and so need no commit to be true.
+READ_ONLY_ACTIONS = frozenset({"view"})
+
+_PENDING_KEY = "pending_audit_entries"
+
+
+def insert_audit_rows(entries: List[Dict[str, Any]]) -> None:
+    """Bulk insert WAL entries into audit_log, skipping entry_ids already there."""
+    rows = [
+        {**entry, "created_at": datetime.fromisoformat(entry["created_at"])}
+        for entry in entries
+    ]
+    db = SessionLocal()
+    try:
+        db.execute(
+            pg_insert(AuditLog).on_conflict_do_nothing(index_elements=[AuditLog.entry_id]),
+            rows,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def start_audit_writer() -> None:
+    if AUDIT_WAL_ENABLED:
+        audit_wal.start(writer=insert_audit_rows)
+
+
+def stop_audit_writer() -> None:
+    if AUDIT_WAL_ENABLED:
+        audit_wal.stop()
 
 
 def log_audit(
@@ -25,11 +104,12 @@ def log_audit(
     resource_id: Optional[str] = None,
     detail: Optional[str] = None,
     changed_fields: Optional[list[str]] = None,
-) -> AuditLog:
-    """Write an immutable audit log entry.
+) -> str:
+    """Record an immutable audit log entry and return its entry_id.
 
     Args:
-        db: SQLAlchemy session
+        db: SQLAlchemy session; write entries are appended when it commits
+            (or added to it directly when the WAL is unavailable)
         request: FastAPI Request (for IP / User-Agent extraction)
         user_id: Clerk user ID or system identifier
         user_name: Optional display name
@@ -44,24 +124,68 @@ def log_audit(
     ua = None
     if request:
         ip = request.headers.get("x-forwarded-for", request.client.host if request.client else None)
+        ip = ip[:45] if ip else ip
         ua = request.headers.get("user-agent", "")[:500]
 
-    entry = AuditLog(
-        organization_id=organization_id,
-        user_id=user_id,
-        user_name=user_name,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        detail=detail,
-        changed_fields=json.dumps(changed_fields) if changed_fields else None,
-        ip_address=ip,
-        user_agent=ua,
-    )
-    db.add(entry)
+    entry = {
+        "entry_id": str(uuid.uuid4()),
+        "organization_id": organization_id,
+        "user_id": user_id,
+        "user_name": user_name[:200] if user_name else user_name,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": str(resource_id) if resource_id is not None else None,
+        "detail": detail,
+        "changed_fields": json.dumps(changed_fields) if changed_fields else None,
+        "ip_address": ip,
+        "user_agent": ua,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    if AUDIT_WAL_ENABLED:
+        if action not in READ_ONLY_ACTIONS:
+            db.info.setdefault(_PENDING_KEY, []).append(entry)
+            return entry["entry_id"]
+        try:
+            audit_wal.append(entry)
+            return entry["entry_id"]
+        except OSError as e:
+            logger.error(f"Audit WAL append failed, writing inline: {e}")
+
+    # Fallback: persist with the caller's transaction.
+    db.add(AuditLog(**{**entry, "created_at": datetime.fromisoformat(entry["created_at"])}))
     # Flush so the entry is persisted even if the caller doesn't commit separately
     db.flush()
-    return entry
+    return entry["entry_id"]
+
+
+@event.listens_for(Session, "after_commit")
+def _append_committed_entries(session: Session) -> None:
+    entries = session.info.pop(_PENDING_KEY, None)
+    if not entries:
+        return
+    for index, entry in enumerate(entries):
+        try:
+            audit_wal.append(entry)
+        except OSError as e:
+            # The write already committed; its entries must still land.
+            logger.error(f"Audit WAL append failed, inserting directly: {e}")
+            try:
+                insert_audit_rows(entries[index:])
+            except Exception as insert_error:
+                logger.critical(
+                    f"Lost {len(entries) - index} audit entries for a committed write: {insert_error}",
+                    exc_info=True,
+                )
+            return
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_uncommitted_entries(session: Session, transaction) -> None:
+    # Runs after after_commit, so anything left here was rolled back or the
+    # session was closed without committing.
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
 
 
 def diff_fields(old: dict, new: dict, ignore: set[str] | None = None) -> tuple[list[str], str]:
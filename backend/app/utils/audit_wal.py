@@ -0,0 +1,274 @@
+"""Local write-ahead log for audit entries, shipped to the database in batches.
+
+``log_audit`` appends each entry as one JSON line to a segment file owned by
+this worker (flushed, and fsynced by default) and returns; a daemon thread
+seals the segment every ``flush_interval`` seconds (or once ``batch_size``
+entries are waiting) and hands its entries to ``writer`` in bulk:
+
+    wal = AuditWAL("/var/lib/chronofy/audit-wal")
+    wal.start(writer=insert_rows)      # writer must be idempotent on entry_id
+    wal.append({"entry_id": ..., ...})
+    wal.stop()                         # seal + ship what is left
+
+Segment lifecycle, all in ``directory``:
+
+    audit-<worker>-<seq>.open   being appended; the owner holds an flock
+    audit-<worker>-<seq>.wal    sealed, waiting to be shipped
+    shipped/audit-...wal        written to the database, kept
+                                ``retain_days`` for verify_audit_wal.py
+    failed/audit-...wal         entries the writer rejected for good, kept
+                                until someone looks at them
+
+Delivery is at-least-once: a segment is moved to ``shipped/`` only after
+``writer`` returned, so a crash in between re-ships it on the next pass and
+the writer's dedup on ``entry_id`` drops the duplicates. An ``.open`` segment
+whose flock can be taken belongs to a dead process and is shipped as is; a
+torn last line from the crash is skipped and logged.
+
+A segment that fails stays queued without holding up the others. When a
+batch fails with one of ``permanent_errors`` (bad data rather than an
+unavailable database), its entries are retried one by one and those still
+rejected are moved to ``failed/``, so one poison entry cannot block the log.
+"""
+import fcntl
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+OPEN_SUFFIX = ".open"
+SEALED_SUFFIX = ".wal"
+SHIPPED_DIR = "shipped"
+FAILED_DIR = "failed"
+
+Writer = Callable[[List[Dict[str, Any]]], None]
+
+
+def read_segment(path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """Entries of a segment file and the number of unreadable lines."""
+    entries: List[Dict[str, Any]] = []
+    bad = 0
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                bad += 1
+                continue
+            if isinstance(entry, dict) and entry.get("entry_id"):
+                entries.append(entry)
+            else:
+                bad += 1
+    return entries, bad
+
+
+class AuditWAL:
+    def __init__(
+        self,
+        directory: os.PathLike,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        fsync: bool = True,
+        retain_days: float = 7.0,
+        permanent_errors: Tuple[Type[BaseException], ...] = (ValueError, KeyError, TypeError),
+    ):
+        self.directory = Path(directory)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.retain_days = retain_days
+        self.permanent_errors = permanent_errors
+        self._worker = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._seq = 0
+        self._file = None
+        self._path: Optional[Path] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._ship_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._writer: Optional[Writer] = None
+
+    @property
+    def shipped_directory(self) -> Path:
+        return self.directory / SHIPPED_DIR
+
+    @property
+    def failed_directory(self) -> Path:
+        return self.directory / FAILED_DIR
+
+    # ---- appending ----
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Durably queue one entry. Raises OSError if the WAL is unusable."""
+        line = json.dumps(entry, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self._wake.set()
+
+    def _open_segment(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._seq += 1
+        path = self.directory / f"audit-{self._worker}-{self._seq:08d}{OPEN_SUFFIX}"
+        f = open(path, "a", encoding="utf-8")
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        self._file, self._path, self._pending = f, path, 0
+
+    def seal(self) -> None:
+        """Close the active segment so the next ship() picks it up."""
+        with self._lock:
+            if self._file is None:
+                return
+            f, path = self._file, self._path
+            self._file, self._path, self._pending = None, None, 0
+            # Renamed while still locked, so no shipper sees a half-sealed file.
+            os.rename(path, path.with_suffix(SEALED_SUFFIX))
+            f.close()
+
+    # ---- shipping ----
+
+    def segments(self) -> Iterator[Path]:
+        if not self.directory.is_dir():
+            return iter(())
+        return iter(sorted(
+            p for p in self.directory.iterdir()
+            if p.name.startswith("audit-") and p.suffix in (SEALED_SUFFIX, OPEN_SUFFIX)
+        ))
+
+    def ship(self, writer: Writer) -> int:
+        """Write every shippable segment; returns the number of entries written.
+
+        A failed segment stays queued and the rest are still shipped; the
+        first error is raised once the pass is done.
+        """
+        with self._ship_lock:
+            shipped = 0
+            error: Optional[Exception] = None
+            for path in self.segments():
+                try:
+                    shipped += self._ship_segment(path, writer)
+                except Exception as e:
+                    logger.error(f"Audit WAL segment {path.name} not shipped, will retry: {e}")
+                    error = error or e
+            self._prune_shipped()
+            if error is not None:
+                raise error
+            return shipped
+
+    def _ship_segment(self, path: Path, writer: Writer) -> int:
+        try:
+            f = open(path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return 0
+        with f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0  # a live worker's active segment, or another shipper
+            if not path.exists():
+                return 0  # shipped by someone else after we opened it
+
+            entries, bad = read_segment(path)
+            if bad:
+                logger.warning(f"Skipped {bad} unreadable audit WAL line(s) in {path.name}")
+            rejected: List[Dict[str, Any]] = []
+            for start in range(0, len(entries), self.batch_size):
+                rejected.extend(self._write_batch(entries[start:start + self.batch_size], writer))
+            if rejected:
+                self._quarantine(path, rejected)
+
+            self.shipped_directory.mkdir(parents=True, exist_ok=True)
+            target = self.shipped_directory / path.with_suffix(SEALED_SUFFIX).name
+            os.rename(path, target)
+            os.utime(target)  # retention counts from shipping time
+        return len(entries) - len(rejected)
+
+    def _write_batch(self, batch: List[Dict[str, Any]], writer: Writer) -> List[Dict[str, Any]]:
+        """Write a batch; returns the entries the writer rejects for good."""
+        try:
+            writer(batch)
+            return []
+        except self.permanent_errors:
+            pass
+        # Find the poison entries; any other error leaves the segment queued.
+        rejected = []
+        for entry in batch:
+            try:
+                writer([entry])
+            except self.permanent_errors as e:
+                logger.error(f"Audit entry {entry['entry_id']} rejected, moving to {FAILED_DIR}/: {e}")
+                rejected.append(entry)
+        return rejected
+
+    def _quarantine(self, path: Path, entries: List[Dict[str, Any]]) -> None:
+        self.failed_directory.mkdir(parents=True, exist_ok=True)
+        target = self.failed_directory / path.with_suffix(SEALED_SUFFIX).name
+        with open(target, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _prune_shipped(self) -> None:
+        if self.retain_days is None or not self.shipped_directory.is_dir():
+            return
+        cutoff = time.time() - self.retain_days * 86400
+        for path in self.shipped_directory.glob(f"audit-*{SEALED_SUFFIX}"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def flush(self) -> int:
+        """Seal the active segment and ship everything; never raises."""
+        if self._writer is None:
+            return 0
+        try:
+            self.seal()
+            return self.ship(self._writer)
+        except Exception as e:
+            logger.error(f"Audit WAL flush failed, will retry: {e}", exc_info=True)
+            return 0
+
+    # ---- background thread ----
+
+    def start(self, writer: Writer) -> None:
+        self._writer = writer
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-wal-shipper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        # The first pass also recovers segments left by crashed workers.
+        while not self._stop.is_set():
+            self.flush()
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
@@ -0,0 +1,71 @@
+"""Inclusive ISO date ranges used to keep one roster per date in shift_assignments.
+
+Ranges are ``(first, last)`` tuples of ``"YYYY-MM-DD"`` strings, which
+compare in date order, so they can go straight into SQL ``BETWEEN`` filters
+on ``ShiftAssignment.date``.
+
+Usage:
+    span = covering_range(schedule.period_start, schedule.period_end, row_dates)
+    gaps = subtract(previous_span, span)
+    for roster, clipped in restore_plan(gaps, candidates):
+        ...  # oldest first, so newer rosters overwrite older ones
+"""
+from datetime import date, timedelta
+from typing import Any, Iterable, List, Optional, Tuple
+
+DateRange = Tuple[str, str]
+
+
+def covering_range(
+    period_start: Optional[str],
+    period_end: Optional[str],
+    dates: Iterable[str] = (),
+) -> Optional[DateRange]:
+    """Smallest range holding the stored period and every date given."""
+    values = [value[:10] for value in (period_start, period_end, *dates) if value]
+    return (min(values), max(values)) if values else None
+
+
+def overlap(a: DateRange, b: DateRange) -> Optional[DateRange]:
+    first, last = max(a[0], b[0]), min(a[1], b[1])
+    return (first, last) if first <= last else None
+
+
+def _shift(day: str, days: int) -> str:
+    return (date.fromisoformat(day) + timedelta(days=days)).isoformat()
+
+
+def subtract(a: DateRange, b: Optional[DateRange]) -> List[DateRange]:
+    """The parts of ``a`` outside ``b`` (zero, one or two ranges)."""
+    if b is None or overlap(a, b) is None:
+        return [a]
+    parts = []
+    if a[0] < b[0]:
+        parts.append((a[0], _shift(b[0], -1)))
+    if b[1] < a[1]:
+        parts.append((_shift(b[1], 1), a[1]))
+    return parts
+
+
+def restore_plan(
+    gaps: Iterable[DateRange],
+    rosters: Iterable[Tuple[Any, Any, Optional[DateRange]]],
+) -> List[Tuple[Any, DateRange]]:
+    """Which ``(roster, range)`` pieces to republish into ``gaps``.
+
+    ``rosters`` are ``(roster, created_at, span)`` triples. Pieces come back
+    oldest roster first: writing them in order, each replacing whatever is
+    already in its range, leaves the newest roster on every date.
+    """
+    gaps = list(gaps)
+    ordered = sorted(
+        (roster for roster in rosters if roster[2] is not None),
+        key=lambda roster: roster[1],
+    )
+    plan = []
+    for roster, _, span in ordered:
+        for gap in gaps:
+            clipped = overlap(span, gap)
+            if clipped is not None:
+                plan.append((roster, clipped))
+    return plan
@@ -0,0 +1,43 @@
+"""Split reporting windows into whole days (read from rollups) and tails.
+
+Usage:
+    lo, hi = whole_days(start_date, end_date)
+    conditions = tail_conditions(Metrics.created_at, lo, hi)
+    tail = or_(*conditions) if conditions else None
+
+``tail_conditions`` only compares, so it builds SQL conditions from
+columns and plain booleans from datetimes alike.
+"""
+from datetime import datetime, time, timedelta
+from typing import Any, List, Optional, Tuple
+
+
+def whole_days(
+    start_date: Optional[datetime],
+    end_date: Optional[datetime]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Split a window into its whole-day span [lo, hi) and partial-day tails.
+    
+    lo is the first midnight at or after start_date, hi the midnight that
+    starts end_date's day; None means unbounded on that side.
+    """
+    lo = None
+    if start_date is not None:
+        lo = datetime.combine(start_date.date(), time.min, tzinfo=start_date.tzinfo)
+        if lo < start_date:
+            lo += timedelta(days=1)
+    hi = None
+    if end_date is not None:
+        hi = datetime.combine(end_date.date(), time.min, tzinfo=end_date.tzinfo)
+    return lo, hi
+
+
+def tail_conditions(column: Any, lo: Optional[datetime], hi: Optional[datetime], end_column: Any = None) -> List[Any]:
+    """Conditions (any one suffices) for rows outside the whole-day span."""
+    conditions = []
+    if lo is not None:
+        conditions.append(column < lo)
+    if hi is not None:
+        conditions.append((end_column if end_column is not None else column) >= hi)
+    return conditions
@@ -0,0 +1,89 @@
+"""Rolling 28-day reconciliation windows over per-nurse prefix sums.
+
+Usage:
+    windows = HoursWindows.from_daily(keys, first_day, daily_hours, daily_vacation)
+    hours, vacation_days = windows.window(end=date(2026, 3, 28))
+    results = reconcile_windows(hours, vacation_days, bi_weekly_targets)
+
+``daily_hours`` and ``daily_vacation`` are ``len(keys) x days`` arrays whose
+first column is ``first_day``. Cumulative sums are taken once, so any window
+inside the range costs two column lookups per nurse, however far it slides.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+RECONCILIATION_DAYS = 28
+# 7+ vacation days in the window halve the target.
+VACATION_OFFSET_DAYS = 7
+VACATION_OFFSET = 0.5
+
+
+@dataclass
+class HoursWindows:
+    """Prefix sums of daily paid hours and vacation days per key."""
+    keys: List[str]
+    first_day: date
+    hours_cumsum: np.ndarray     # len(keys) x (days + 1), first column 0
+    vacation_cumsum: np.ndarray  # same shape, counts of vacation days
+
+    @classmethod
+    def from_daily(
+        cls,
+        keys: Sequence[str],
+        first_day: date,
+        daily_hours: np.ndarray,
+        daily_vacation: np.ndarray,
+    ) -> "HoursWindows":
+        pad = np.zeros((len(keys), 1))
+        return cls(
+            list(keys),
+            first_day,
+            np.concatenate([pad, np.cumsum(daily_hours, axis=1)], axis=1),
+            np.concatenate([pad, np.cumsum(daily_vacation, axis=1)], axis=1),
+        )
+
+    @property
+    def days(self) -> int:
+        return self.hours_cumsum.shape[1] - 1
+
+    def window(
+        self, end: date, days: int = RECONCILIATION_DAYS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Hours and vacation days per key for the ``days`` ending on ``end``."""
+        stop = (end - self.first_day).days + 1
+        start = stop - days
+        if start < 0 or stop > self.days:
+            raise ValueError(f"Window ending {end} is outside the loaded range")
+        hours = self.hours_cumsum[:, stop] - self.hours_cumsum[:, start]
+        vacation = self.vacation_cumsum[:, stop] - self.vacation_cumsum[:, start]
+        return hours, vacation.astype(int)
+
+
+def reconcile_windows(
+    hours_worked: np.ndarray,
+    vacation_days: np.ndarray,
+    bi_weekly_targets: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Vectorized ``ReconciliationService.calculate_reconciliation`` maths.
+
+    ``balancing_shift_hours`` is nan where no B-Shift is needed.
+    """
+    offset = np.where(vacation_days >= VACATION_OFFSET_DAYS, VACATION_OFFSET, 1.0)
+    adjusted_target = bi_weekly_targets * 2 * offset  # 28 days = 2x bi-weekly
+    delta = hours_worked - adjusted_target
+    gap = -delta
+    balancing = np.select(
+        [gap <= 0, gap <= 4, gap <= 8],
+        [np.nan, 4.0, 8.0],
+        default=12.0,
+    )
+    return {
+        "hours_worked": hours_worked,
+        "adjusted_target": adjusted_target,
+        "delta": delta,
+        "balancing_shift_hours": balancing,
+        "vacation_days_count": vacation_days,
+    }
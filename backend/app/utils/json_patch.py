@@ -0,0 +1,189 @@
+"""Minimal RFC 6902 JSON-Patch helpers for schedule payloads.
+
+Schedule revisions usually differ by a handful of cells, so we store and ship
+them as patch operations instead of full rosters:
+
+    ops = diff_payloads(old_payload, new_payload)
+    rebuilt = apply_patch(old_payload, ops)   # == new_payload
+
+Paths are JSON Pointers (RFC 6901), e.g. ``/schedule_data/grid/3/shifts/5/shift``.
+"""
+import copy
+from typing import Any, Dict, List
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch operation cannot be applied to a document."""
+
+
+def escape_token(token: Any) -> str:
+    """Escape one reference token for use in a JSON Pointer."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def split_pointer(pointer: str) -> List[str]:
+    """Split a JSON Pointer into unescaped reference tokens."""
+    if pointer == "":
+        return []
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+def diff_payloads(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Return the patch operations that turn ``old`` into ``new``.
+
+    Dicts are compared key by key and lists index by index, so a single
+    changed cell in a roster grid yields a single ``replace`` operation.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{escape_token(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{escape_token(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_payloads(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            ops.extend(diff_payloads(old[index], new[index], f"{path}/{index}"))
+        for index in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        # Remove from the tail so earlier indices stay valid while applying.
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        return ops
+
+    if type(old) is not type(new) or old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def _resolve_parent(document: Any, tokens: List[str]):
+    target = document
+    for token in tokens[:-1]:
+        if isinstance(target, dict):
+            if token not in target:
+                raise JsonPatchError(f"Path segment '{token}' not found")
+            target = target[token]
+        elif isinstance(target, list):
+            try:
+                target = target[int(token)]
+            except (ValueError, IndexError):
+                raise JsonPatchError(f"Invalid list index '{token}'")
+        else:
+            raise JsonPatchError(f"Cannot traverse into scalar at '{token}'")
+    return target
+
+
+def resolve_pointer(document: Any, pointer: str) -> Any:
+    """Return the value a JSON Pointer references inside ``document``."""
+    return _get_value(document, split_pointer(pointer))
+
+
+def _get_value(document: Any, tokens: List[str]) -> Any:
+    if not tokens:
+        return document
+    parent = _resolve_parent(document, tokens)
+    last = tokens[-1]
+    if isinstance(parent, list):
+        return parent[_list_index(parent, last, allow_end=False)]
+    if isinstance(parent, dict):
+        if last not in parent:
+            raise JsonPatchError(f"Path segment '{last}' not found")
+        return parent[last]
+    raise JsonPatchError("Cannot read inside a scalar value")
+
+
+def _list_index(container: list, token: str, allow_end: bool) -> int:
+    if token == "-" and allow_end:
+        return len(container)
+    try:
+        index = int(token)
+    except ValueError:
+        raise JsonPatchError(f"Invalid list index '{token}'")
+    upper = len(container) if allow_end else len(container) - 1
+    if index < 0 or index > upper:
+        raise JsonPatchError(f"List index {index} out of range")
+    return index
+
+
+def _apply_one(document: Any, op: Dict[str, Any]) -> Any:
+    kind = op.get("op")
+    tokens = split_pointer(op.get("path", ""))
+
+    if not tokens:
+        if kind in ("add", "replace"):
+            return copy.deepcopy(op.get("value"))
+        if kind == "remove":
+            return None
+        raise JsonPatchError(f"Unsupported operation on document root: {kind!r}")
+
+    parent = _resolve_parent(document, tokens)
+    last = tokens[-1]
+
+    if kind == "add":
+        value = copy.deepcopy(op.get("value"))
+        if isinstance(parent, list):
+            parent.insert(_list_index(parent, last, allow_end=True), value)
+        elif isinstance(parent, dict):
+            parent[last] = value
+        else:
+            raise JsonPatchError("Cannot add into a scalar value")
+    elif kind == "replace":
+        value = copy.deepcopy(op.get("value"))
+        if isinstance(parent, list):
+            parent[_list_index(parent, last, allow_end=False)] = value
+        elif isinstance(parent, dict):
+            if last not in parent:
+                raise JsonPatchError(f"Cannot replace missing key '{last}'")
+            parent[last] = value
+        else:
+            raise JsonPatchError("Cannot replace inside a scalar value")
+    elif kind == "remove":
+        if isinstance(parent, list):
+            parent.pop(_list_index(parent, last, allow_end=False))
+        elif isinstance(parent, dict):
+            if last not in parent:
+                raise JsonPatchError(f"Cannot remove missing key '{last}'")
+            del parent[last]
+        else:
+            raise JsonPatchError("Cannot remove from a scalar value")
+    elif kind == "test":
+        if _get_value(document, tokens) != op.get("value"):
+            raise JsonPatchError(f"Test failed at '{op.get('path')}'")
+    elif kind in ("move", "copy"):
+        from_tokens = split_pointer(op.get("from", ""))
+        if kind == "move" and tokens == from_tokens:
+            return document
+        if kind == "move" and tokens[: len(from_tokens)] == from_tokens:
+            raise JsonPatchError("Cannot move a value into one of its children")
+        value = copy.deepcopy(_get_value(document, from_tokens))
+        if kind == "move":
+            document = _apply_one(document, {"op": "remove", "path": op.get("from")})
+        document = _apply_one(document, {"op": "add", "path": op.get("path"), "value": value})
+    else:
+        raise JsonPatchError(f"Unsupported patch operation: {kind!r}")
+
+    return document
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply patch operations to a deep copy of ``document`` and return it."""
+    result = copy.deepcopy(document)
+    for op in ops or []:
+        if not isinstance(op, dict):
+            raise JsonPatchError("Patch operations must be objects")
+        result = _apply_one(result, op)
+    return result
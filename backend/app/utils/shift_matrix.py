@@ -0,0 +1,173 @@
+"""Nurse x day shift matrix and the workload metrics derived from it.
+
+Usage:
+    matrix = build_shift_matrix(shifts_by_nurse, end=date.today(), days=30)
+    metrics = workload_metrics(matrix, targets_14d)
+
+``shifts_by_nurse`` maps a row key (e.g. nurse id) to ``{iso_date: entry}``
+where entries use the schedule grid shape (``hours``, ``shiftType``,
+``startTime``, ``endTime``). The last column of the matrix is ``end``; every
+metric is computed for all rows at once with column-wise array operations.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+OFF_SHIFT_TYPES = ("off", None)
+# Typical start hours when an entry has no startTime.
+DEFAULT_START_HOUR = {"day": 7.0, "night": 19.0}
+
+
+@dataclass
+class ShiftMatrix:
+    """Hours and shift attributes for ``len(keys)`` rows x ``days`` columns."""
+    keys: List[str]
+    end: date
+    hours: np.ndarray        # worked hours, 0 when off
+    night: np.ndarray        # bool, night shift
+    start_hour: np.ndarray   # hour of day the shift starts, nan when off
+    duration: np.ndarray     # shift length in hours, 0 when off
+
+    @property
+    def days(self) -> int:
+        return self.hours.shape[1]
+
+    @property
+    def dates(self) -> List[date]:
+        first = self.end - timedelta(days=self.days - 1)
+        return [first + timedelta(days=i) for i in range(self.days)]
+
+
+def _parse_hour(value: Any) -> Optional[float]:
+    if not isinstance(value, str) or ":" not in value:
+        return None
+    try:
+        hours, minutes = value.strip().split(":")[:2]
+        return (int(hours) % 24) + int(minutes[:2]) / 60
+    except ValueError:
+        return None
+
+
+def build_shift_matrix(
+    shifts_by_key: Mapping[str, Mapping[str, Mapping[str, Any]]],
+    end: date,
+    days: int,
+) -> ShiftMatrix:
+    """Lay out ``{key: {iso_date: entry}}`` as a matrix ending on ``end``."""
+    keys = list(shifts_by_key)
+    shape = (len(keys), days)
+    hours = np.zeros(shape)
+    night = np.zeros(shape, dtype=bool)
+    start_hour = np.full(shape, np.nan)
+    duration = np.zeros(shape)
+
+    first = end - timedelta(days=days - 1)
+    column = {(first + timedelta(days=i)).isoformat(): i for i in range(days)}
+
+    for row, key in enumerate(keys):
+        for iso_date, entry in shifts_by_key[key].items():
+            col = column.get(str(iso_date)[:10])
+            if col is None or not isinstance(entry, Mapping):
+                continue
+            try:
+                worked_hours = float(entry.get("hours") or 0)
+            except (TypeError, ValueError):
+                continue
+            shift_type = entry.get("shiftType")
+            if worked_hours <= 0 or shift_type in OFF_SHIFT_TYPES:
+                continue
+
+            start = _parse_hour(entry.get("startTime"))
+            if start is None:
+                start = DEFAULT_START_HOUR.get(shift_type, DEFAULT_START_HOUR["day"])
+            finish = _parse_hour(entry.get("endTime"))
+            length = (finish - start) % 24 if finish is not None else 0.0
+
+            hours[row, col] = worked_hours
+            night[row, col] = shift_type == "night"
+            start_hour[row, col] = start
+            duration[row, col] = length or worked_hours
+
+    return ShiftMatrix(keys, end, hours, night, start_hour, duration)
+
+
+def _longest_runs(worked: np.ndarray) -> Sequence[np.ndarray]:
+    """Per row: longest run of worked days, and the run ending on the last day."""
+    current = np.zeros(worked.shape[0], dtype=int)
+    longest = np.zeros(worked.shape[0], dtype=int)
+    for col in range(worked.shape[1]):
+        current = np.where(worked[:, col], current + 1, 0)
+        longest = np.maximum(longest, current)
+    return longest, current
+
+
+def workload_metrics(
+    matrix: ShiftMatrix,
+    targets_14d: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """Burnout workload metrics for every row of ``matrix``.
+
+    Returns one array per metric, aligned with ``matrix.keys``. Rest and
+    variance metrics are nan for rows without enough shifts to measure them.
+    """
+    worked = matrix.hours > 0
+    hours = matrix.hours
+    last7 = slice(-7, None)
+    last14 = slice(-14, None)
+
+    weekend = np.array([d.weekday() >= 5 for d in matrix.dates], dtype=bool)
+    hours_14d = hours[:, last14].sum(axis=1)
+    if targets_14d is None:
+        targets_14d = np.zeros(len(matrix.keys))
+
+    longest_14d, _ = _longest_runs(worked[:, last14])
+    _, trailing = _longest_runs(worked)
+
+    # Rest gaps: shift start minus the end of the previous worked shift.
+    offsets = np.arange(matrix.days) * 24.0
+    start_abs = offsets + matrix.start_hour
+    end_abs = np.where(worked, start_abs + matrix.duration, -np.inf)
+    previous_end = np.maximum.accumulate(end_abs, axis=1)
+    previous_end = np.concatenate(
+        [np.full((len(matrix.keys), 1), -np.inf), previous_end[:, :-1]], axis=1
+    )
+    rest = np.where(worked & np.isfinite(previous_end), start_abs - previous_end, np.nan)
+
+    # Pattern disruption: coefficient of variation of start hours (14 days).
+    starts_14d = np.where(worked[:, last14], matrix.start_hour[:, last14], np.nan)
+    shift_counts_14d = worked[:, last14].sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_rest = _nan_reduce(np.nanmean, rest)
+        min_rest_7d = _nan_reduce(np.nanmin, rest[:, last7])
+        start_mean = _nan_reduce(np.nanmean, starts_14d)
+        start_std = _nan_reduce(np.nanstd, starts_14d)
+        variance = np.where(
+            (shift_counts_14d >= 2) & (start_mean > 0), start_std / start_mean, 0.0
+        )
+
+    return {
+        "hours_last_7d": hours[:, last7].sum(axis=1),
+        "hours_last_14d": hours_14d,
+        "hours_last_30d": hours[:, -30:].sum(axis=1),
+        "overtime_hours_last_14d": np.maximum(hours_14d - targets_14d, 0.0),
+        "consecutive_days_worked": longest_14d,
+        "days_since_last_day_off": trailing,
+        "night_shifts_last_14d": (worked & matrix.night)[:, last14].sum(axis=1),
+        "total_shifts_last_14d": shift_counts_14d,
+        "weekend_shifts_last_14d": (worked & weekend)[:, last14].sum(axis=1),
+        "avg_rest_hours_between_shifts": avg_rest,
+        "min_rest_hours_last_7d": min_rest_7d,
+        "schedule_variance_coefficient": variance,
+    }
+
+
+def _nan_reduce(reducer, values: np.ndarray) -> np.ndarray:
+    """Row-wise nan-aware reduction that yields nan (not a warning) for empty rows."""
+    has_value = ~np.isnan(values).all(axis=1)
+    out = np.full(values.shape[0], np.nan)
+    if has_value.any():
+        out[has_value] = reducer(values[has_value], axis=1)
+    return out
@@ -0,0 +1,185 @@
+"""Turn Textract TABLES output into a roster grid, and merge multi-page grids.
+
+Usage:
+    page = parse_table_blocks(response["Blocks"], start_date, end_date)
+    roster = merge_page_grids([page_1, page_2])
+
+Blocks are indexed by ``Id`` once, so parsing is linear in the number of
+blocks however dense the roster is. Kept free of boto3 so it can be tested
+against stub responses.
+"""
+import re
+from datetime import date, timedelta
+from difflib import get_close_matches
+from typing import Any, Dict, List
+
+NO_TABLE_ERROR = (
+    "No table detected in image. Please upload a clearer schedule image "
+    "with visible table structure."
+)
+
+
+def clean_nurse_name(raw_name: str) -> str:
+    """
+    Clean OCR-extracted nurse names by removing employee IDs, suffixes, and noise.
+    Examples:
+      "Alexandra Zatylny 42564 7Y-339.27D" -> "Alexandra Zatylny"
+      "Trong Khoi\nTran" -> "Trong Khoi Tran"
+      "Khady Gueye 7580 197.40D 33:45" -> "Khady Gueye"
+    """
+    if not raw_name:
+        return raw_name
+    
+    # Step 0: Replace newlines and multiple spaces with single space (handles multi-line names)
+    cleaned = raw_name.replace('\n', ' ').replace('\r', ' ')
+    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    
+    # Step 1: Remove common OCR suffixes (employee IDs, time codes, etc.)
+    # Pattern: numbers followed by Y-xxx.xxD or just numbers at end
+    patterns_to_remove = [
+        r'\s+\d+\s+\d*Y?-?\d*\.?\d*D?$',  # "42564 7Y-339.27D"
+        r'\s+\d+\s+\d+\.\d+D?$',           # "783 8.40D"
+        r'\s+\d+\.\d+D\s*\d*:?\d*$',       # "197.40D 33:45"
+        r'\s+\d{4,}\s+',                    # 4+ digit employee IDs in middle
+        r'\s+\d+:?\d*$',                    # Trailing time like "45:00" or "52:30"
+        r'\s+\d+\s*$',                      # Trailing numbers
+    ]
+    for pattern in patterns_to_remove:
+        cleaned = re.sub(pattern, '', cleaned)
+    
+    # Step 2: Remove any remaining standalone numbers at end
+    cleaned = re.sub(r'\s+\d+\s*$', '', cleaned)
+    
+    # Step 3: Remove shift code suffixes that may have been captured
+    cleaned = re.sub(r'\s+[A-Z]{1,2}\d?-?\d*\.?\d*[A-Z]?\s*$', '', cleaned)
+    
+    # Step 4: Remove trailing character + dash patterns (common OCR errors like "Glodovizay-")
+    # This catches cases where OCR adds an extra letter before a trailing dash
+    cleaned = re.sub(r'[a-z][-–—]+$', '', cleaned)
+    
+    # Step 5: Remove any remaining trailing dashes and hyphens
+    cleaned = re.sub(r'[-–—]+$', '', cleaned)
+    
+    # Step 6: Clean up whitespace
+    cleaned = ' '.join(cleaned.split())
+    
+    # Step 7: Capitalize first letter of each word (proper name formatting)
+    cleaned = ' '.join(word.capitalize() for word in cleaned.split())
+    
+    return cleaned.strip()
+
+
+def _expected_labels(start: date, end: date) -> Dict[str, date]:
+    """Header labels like "Mon 2" for every day in the range."""
+    date_labels = {}
+    current = start
+    while current <= end:
+        label = current.strftime("%a %d").lstrip("0")
+        date_labels[label] = current
+        current += timedelta(days=1)
+    return date_labels
+
+
+def parse_table_blocks(blocks: List[Dict[str, Any]], start_date: date, end_date: date) -> Dict:
+    """Roster grid from the blocks of one ``analyze_document`` response.
+
+    Row 1/2 hold the weekday/day headers, column 1 the nurse names.
+    """
+    blocks_by_id = {block["Id"]: block for block in blocks}
+    cell_map = {
+        (block["RowIndex"], block["ColumnIndex"]): block
+        for block in blocks if block["BlockType"] == "CELL"
+    }
+
+    # If no table cells found, return empty result
+    if not cell_map:
+        return {"dates": [], "grid": [], "error": NO_TABLE_ERROR}
+
+    def get_text(cell):
+        if not cell or "Relationships" not in cell:
+            return ""
+        text = []
+        for rel in cell["Relationships"]:
+            if rel["Type"] == "CHILD":
+                for child_id in rel["Ids"]:
+                    word = blocks_by_id.get(child_id)
+                    if word and word["BlockType"] == "WORD":
+                        text.append(word["Text"])
+        return " ".join(text)
+
+    max_row = max(row for row, _ in cell_map)
+    max_col = max(col for _, col in cell_map)
+
+    # Match OCR headers to real dates with confidence
+    expected_labels = _expected_labels(start_date, end_date)
+    col_date_map = {}
+    for col in range(2, max_col + 1):
+        weekday = get_text(cell_map.get((1, col))).strip()
+        day = get_text(cell_map.get((2, col))).strip()
+        ocr_label = re.sub(r"\s+", " ", f"{weekday} {day}".strip())
+
+        match = get_close_matches(ocr_label, expected_labels.keys(), n=1, cutoff=0.6)
+        if match:
+            col_date_map[col] = expected_labels[match[0]]
+
+    # Sort columns by matched date: [(col_idx, date), ...]
+    sorted_cols = sorted(col_date_map.items(), key=lambda x: x[1])
+
+    # Extract grid with cleaned nurse names
+    grid = []
+    for row in range(3, max_row + 1):
+        nurse_info_raw = get_text(cell_map.get((row, 1))).strip()
+        if not nurse_info_raw:
+            continue
+
+        # Clean the nurse name to remove employee IDs and suffixes
+        nurse_info = clean_nurse_name(nurse_info_raw)
+        if not nurse_info:
+            continue
+
+        shifts = [get_text(cell_map.get((row, col))).strip() for col, _ in sorted_cols]
+        grid.append({"nurse": nurse_info, "shifts": shifts})
+
+    return {
+        "dates": [dt.isoformat() for _, dt in sorted_cols],
+        "grid": grid,
+    }
+
+
+def merge_page_grids(pages: List[Dict]) -> Dict:
+    """Combine per-image grids into one roster.
+
+    Pages may split the roster by date range (one week per image), by
+    nurses, or both. Dates are unioned and sorted, nurses keep their first
+    appearance order, and where pages overlap the first non-empty shift
+    wins. Pages that failed are reported under ``errors`` by index.
+    """
+    if len(pages) == 1:
+        return pages[0]
+
+    errors = [
+        {"page": index, "error": page["error"]}
+        for index, page in enumerate(pages) if page.get("error")
+    ]
+    dates = sorted({d for page in pages for d in page.get("dates", [])})
+    column = {d: i for i, d in enumerate(dates)}
+
+    rows: Dict[str, List[str]] = {}
+    for page in pages:
+        page_columns = [column[d] for d in page.get("dates", [])]
+        for entry in page.get("grid", []):
+            shifts = rows.setdefault(entry["nurse"], [""] * len(dates))
+            for col, shift in zip(page_columns, entry["shifts"]):
+                if shift and not shifts[col]:
+                    shifts[col] = shift
+
+    merged: Dict[str, Any] = {
+        "dates": dates,
+        "grid": [{"nurse": nurse, "shifts": shifts} for nurse, shifts in rows.items()],
+        "pages": len(pages),
+    }
+    if errors:
+        merged["errors"] = errors
+        if not dates:
+            merged["error"] = errors[0]["error"]
+    return merged
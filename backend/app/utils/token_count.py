@@ -0,0 +1,43 @@
+"""Token counting for prompts sent to OpenAI.
+
+Usage:
+    from app.utils.token_count import count_tokens
+    if count_tokens(prompt) > budget: ...
+
+Uses ``tiktoken`` when it is installed. Without it the count is a deliberate
+over-estimate (one token per three characters), which is the safe direction
+for a budget check.
+"""
+import logging
+from functools import lru_cache
+
+try:  # Optional dependency: exact counts when available.
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on the environment
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "o200k_base"  # gpt-4o / gpt-4.1 family
+_CHARS_PER_TOKEN_ESTIMATE = 3
+
+
+@lru_cache(maxsize=4)
+def _encoding(name: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:  # pragma: no cover - e.g. encoding files unavailable offline
+        logger.warning(f"tiktoken encoding {name} unavailable, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str, encoding: str = DEFAULT_ENCODING) -> int:
+    """Return the number of tokens in ``text`` (estimated without tiktoken)."""
+    if not text:
+        return 0
+    enc = _encoding(encoding)
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    return -(-len(text) // _CHARS_PER_TOKEN_ESTIMATE)
@@ -0,0 +1,83 @@
+"""Backfill optimized_schedules summary columns for legacy rows.
+
+Usage:
+  cd backend
+  ../.venv/bin/python backfill_schedule_summaries.py
+  ../.venv/bin/python backfill_schedule_summaries.py --apply
+  ../.venv/bin/python backfill_schedule_summaries.py --apply --org-id <ORG_ID>
+
+Behavior:
+- Dry-run by default (no writes).
+- Stamps period, actor and family_root_id from the stored payload on every
+  row whose family_root_id is still NULL (rows saved before the columns
+  existed), exactly as saving the schedule would have.
+- Safe to re-run: stamped rows are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Optional
+
+from app.api.routes.optimized_schedule import _stamp_schedule_summary
+from app.db.database import SessionLocal
+from app.models.optimized_schedule import OptimizedSchedule
+from app.services.schedule_revisions import load_schedule_payload
+
+
+def run(org_id: Optional[str], apply: bool) -> int:
+    db = SessionLocal()
+    try:
+        query = db.query(OptimizedSchedule).filter(OptimizedSchedule.family_root_id.is_(None))
+        if org_id:
+            query = query.filter(OptimizedSchedule.organization_id == org_id)
+        # Oldest first, so a revision's parent is stamped before it.
+        schedules = query.order_by(OptimizedSchedule.created_at.asc()).all()
+
+        if not schedules:
+            print("No legacy schedules found for selection.")
+            return 0
+
+        print(f"Found {len(schedules)} legacy schedule(s).")
+        for schedule in schedules:
+            _stamp_schedule_summary(db, schedule, load_schedule_payload(db, schedule), None)
+            print(
+                f"- {schedule.id} ({schedule.organization_id}): "
+                f"{schedule.period_start or '?'}..{schedule.period_end or '?'}, "
+                f"family {schedule.family_root_id}"
+            )
+
+        if apply:
+            db.commit()
+            print(f"Stamped {len(schedules)} schedule(s).")
+        else:
+            db.rollback()
+            print("Dry-run complete. Re-run with --apply to persist changes.")
+        return 0
+    except Exception as exc:
+        db.rollback()
+        print(f"Failed: {exc}")
+        return 1
+    finally:
+        db.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Backfill optimized_schedules summary columns for legacy rows",
+    )
+    parser.add_argument(
+        "--org-id",
+        help="Only process a specific organization ID",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Persist updates (default is dry-run)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    raise SystemExit(run(org_id=args.org_id, apply=args.apply))
@@ -0,0 +1,86 @@
+"""Backfill shift_assignments from existing finalized schedules.
+
+Usage:
+  cd backend
+  ../.venv/bin/python backfill_shift_assignments.py
+  ../.venv/bin/python backfill_shift_assignments.py --apply
+  ../.venv/bin/python backfill_shift_assignments.py --apply --org-id <ORG_ID>
+
+Behavior:
+- Dry-run by default (no writes).
+- For every revision family, publishes the newest finalized version, the
+  same rows finalize/promote would have written. Families are published
+  oldest first, so where rosters overlap the newest one owns the dates.
+- Safe to re-run: each family's rows are replaced, never duplicated.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Dict, Optional
+
+from app.db.database import SessionLocal
+from app.models.optimized_schedule import OptimizedSchedule
+from app.services.shift_assignments import publish_shift_assignments
+
+
+def run(org_id: Optional[str], apply: bool) -> int:
+    db = SessionLocal()
+    try:
+        query = db.query(OptimizedSchedule).filter(OptimizedSchedule.finalized == True)
+        if org_id:
+            query = query.filter(OptimizedSchedule.organization_id == org_id)
+        schedules = query.order_by(OptimizedSchedule.created_at.asc()).all()
+
+        # Newest finalized version per family wins.
+        active: Dict[str, OptimizedSchedule] = {}
+        for schedule in schedules:
+            if not schedule.organization_id:
+                continue
+            active[str(schedule.family_root_id or schedule.id)] = schedule
+
+        if not active:
+            print("No finalized schedules found for selection.")
+            return 0
+
+        print(f"Found {len(active)} active finalized schedule(s).")
+        total_rows = 0
+        for schedule in active.values():
+            rows = publish_shift_assignments(db, schedule)
+            total_rows += rows
+            print(f"- {schedule.id} ({schedule.organization_id}): {rows} assignment(s)")
+
+        if apply:
+            db.commit()
+            print(f"Wrote {total_rows} shift assignment(s).")
+        else:
+            db.rollback()
+            print("Dry-run complete. Re-run with --apply to persist changes.")
+        return 0
+    except Exception as exc:
+        db.rollback()
+        print(f"Failed: {exc}")
+        return 1
+    finally:
+        db.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Backfill shift_assignments from finalized schedules",
+    )
+    parser.add_argument(
+        "--org-id",
+        help="Only process a specific organization ID",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Persist updates (default is dry-run)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    raise SystemExit(run(org_id=args.org_id, apply=args.apply))
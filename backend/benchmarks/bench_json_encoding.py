@@ -0,0 +1,85 @@
+"""Compare response encoding for a realistic optimized-schedule payload.
+
+Run from backend/:
+    python -m benchmarks.bench_json_encoding
+
+Reports encode time for FastAPI's previous path (jsonable_encoder + json.dumps)
+against orjson, and the wire size raw / gzip / brotli.
+"""
+import gzip
+import json
+import random
+import time
+from datetime import date, timedelta
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+NURSES = 90
+DAYS = 42
+ROUNDS = 50
+SHIFT_CODES = ["Z07", "Z19", "07", "23", "Z11", ""]
+
+
+def build_payload(nurses: int = NURSES, days: int = DAYS) -> dict:
+    rng = random.Random(42)
+    start = date(2026, 3, 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(days)]
+    grid = []
+    for n in range(nurses):
+        shifts = []
+        for d in dates:
+            code = rng.choice(SHIFT_CODES)
+            shifts.append({
+                "date": d,
+                "shift": code,
+                "shiftType": "night" if code in ("Z19", "23") else "day",
+                "hours": 11.25 if code.startswith("Z") else (7.5 if code else 0),
+                "startTime": "07:00" if code else "",
+                "endTime": "19:25" if code else "",
+            })
+        grid.append({"id": f"nurse-{n}", "nurse": f"Nurse {n:03d}", "shifts": shifts})
+    return {
+        "schedule_data": {"grid": grid, "dates": dates, "dateRange": {"start": dates[0], "end": dates[-1]}},
+        "draft_state": {"optimizedGrid": grid},
+        "statistics": {"coverage": 0.97, "violations": []},
+    }
+
+
+def _time(fn, rounds: int = ROUNDS) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def run():
+    payload = build_payload()
+
+    def stdlib():
+        return json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode("utf-8")
+
+    def fast():
+        return orjson.dumps(payload)
+
+    body = fast()
+    assert json.loads(body) == json.loads(stdlib())
+
+    print(f"payload: {NURSES} nurses x {DAYS} days")
+    print(f"  jsonable_encoder + json.dumps: {_time(stdlib):8.2f} ms")
+    print(f"  orjson.dumps:                  {_time(fast):8.2f} ms")
+    print(f"  raw size:    {len(body):>9,} bytes")
+    print(f"  gzip -6:     {len(gzip.compress(body, compresslevel=6)):>9,} bytes")
+    if brotli is not None:
+        print(f"  brotli q4:   {len(brotli.compress(body, quality=4)):>9,} bytes")
+    else:
+        print("  brotli:      not installed")
+
+
+if __name__ == "__main__":
+    run()
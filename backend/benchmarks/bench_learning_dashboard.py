@@ -0,0 +1,115 @@
+"""Learning dashboard: per-nurse progress queries vs one grouped aggregate.
+
+Run from backend/ against a migrated Postgres database:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_learning_dashboard
+
+Seeds 500 nurses x 50 modules of progress inside a transaction that is rolled
+back at the end, then reports wall time and statement count for the previous
+per-nurse loop and for ``build_learning_dashboard``.
+"""
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.api.routes.learning import build_learning_dashboard
+from app.db.database import engine
+from app.models.learning import LearningModule, LearningProgress
+from app.models.nurse import Nurse
+
+NURSES = 500
+MODULES = 50
+ROUNDS = 5
+STATUSES = ["completed", "completed", "in_progress", "not_started", "failed"]
+
+
+def seed(db: Session, org_id: str) -> None:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    module_ids = [uuid.uuid4() for _ in range(MODULES)]
+    nurse_ids = [uuid.uuid4() for _ in range(NURSES)]
+    db.execute(insert(LearningModule), [
+        {
+            "id": module_id,
+            "organization_id": org_id,
+            "title": f"Module {i}",
+            "category": "orientation",
+            "content_type": "interactive",
+            "content": {"steps": []},
+            "is_published": True,
+            "is_mandatory": i < 10,
+        }
+        for i, module_id in enumerate(module_ids)
+    ])
+    db.execute(insert(Nurse), [
+        {"id": nurse_id, "organization_id": org_id, "name": f"Nurse {i:03d}"}
+        for i, nurse_id in enumerate(nurse_ids)
+    ])
+    db.execute(insert(LearningProgress), [
+        {
+            "nurse_id": nurse_id,
+            "module_id": module_id,
+            "organization_id": org_id,
+            "status": rng.choice(STATUSES),
+            "last_accessed_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+        }
+        for nurse_id in nurse_ids
+        for module_id in module_ids
+    ])
+    db.flush()
+
+
+def legacy_dashboard(db: Session, org_id: str) -> int:
+    """The previous shape: one progress query per nurse."""
+    nurses = db.query(Nurse).filter(Nurse.organization_id == org_id).all()
+    for nurse in nurses:
+        db.query(LearningProgress).filter(LearningProgress.nurse_id == nurse.id).all()
+    return len(nurses)
+
+
+def _measure(conn, fn, rounds: int = ROUNDS):
+    statements = 0
+
+    def count(*_args):
+        nonlocal statements
+        statements += 1
+
+    event.listen(conn, "before_cursor_execute", count)
+    try:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        elapsed = (time.perf_counter() - start) / rounds * 1000
+    finally:
+        event.remove(conn, "before_cursor_execute", count)
+    return elapsed, statements // rounds
+
+
+def run():
+    org_id = f"bench-{uuid.uuid4().hex[:8]}"
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            db = Session(bind=conn)
+            seed(db, org_id)
+
+            result = build_learning_dashboard(db, org_id)
+            assert result.total_nurses == NURSES
+            assert result.modules_available == MODULES
+
+            legacy_ms, legacy_statements = _measure(conn, lambda: legacy_dashboard(db, org_id))
+            db.expunge_all()
+            new_ms, new_statements = _measure(conn, lambda: build_learning_dashboard(db, org_id))
+
+            print(f"org: {NURSES} nurses x {MODULES} modules")
+            print(f"  per-nurse queries:   {legacy_ms:8.1f} ms  {legacy_statements:>4} statements")
+            print(f"  grouped aggregate:   {new_ms:8.1f} ms  {new_statements:>4} statements")
+        finally:
+            trans.rollback()
+
+
+if __name__ == "__main__":
+    run()
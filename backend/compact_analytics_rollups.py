@@ -0,0 +1,79 @@
+"""Rebuild the analytics daily rollups from the raw metrics rows.
+
+Usage:
+  cd backend
+  ../.venv/bin/python compact_analytics_rollups.py
+  ../.venv/bin/python compact_analytics_rollups.py --apply --since-days 7
+  ../.venv/bin/python compact_analytics_rollups.py --apply --org-id <ORG_ID>
+
+Behavior:
+- Dry-run by default (no writes).
+- Rollups are kept current as metrics are recorded; run this periodically
+  (e.g. nightly with --since-days 7) to repair drift from rows written
+  elsewhere, or without --since-days for a full rebuild.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, timedelta
+from typing import Optional
+from uuid import UUID
+
+from app.db.database import SessionLocal
+from app.services.analytics_service import AnalyticsService
+
+
+def run(org_id: Optional[str], since_days: Optional[int], apply: bool) -> int:
+    db = SessionLocal()
+    try:
+        since = date.today() - timedelta(days=since_days) if since_days is not None else None
+        counts = AnalyticsService(db).compact_rollups(
+            organization_id=UUID(org_id) if org_id else None,
+            since=since,
+        )
+        scope = f"since {since.isoformat()}" if since else "all days"
+        print(
+            f"Rebuilt {counts['scheduling_days']} scheduling and "
+            f"{counts['handover_days']} handover rollup row(s) ({scope})."
+        )
+
+        if apply:
+            db.commit()
+            print("Rollups updated.")
+        else:
+            db.rollback()
+            print("Dry-run complete. Re-run with --apply to persist changes.")
+        return 0
+    except Exception as exc:
+        db.rollback()
+        print(f"Failed: {exc}")
+        return 1
+    finally:
+        db.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild analytics daily rollups from raw metrics",
+    )
+    parser.add_argument(
+        "--org-id",
+        help="Only process a specific organization ID",
+    )
+    parser.add_argument(
+        "--since-days",
+        type=int,
+        help="Only rebuild the last N days (default: everything)",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Persist updates (default is dry-run)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    raise SystemExit(run(org_id=args.org_id, since_days=args.since_days, apply=args.apply))
@@ -5,11 +5,25 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.api.routes.optimized_schedule import apply_org_leave_status, RobustScheduler
+from app.models.organization import Organization
+from app.services.roster_snapshot import clear_roster_snapshots
 
 
 class FakeNurseRow:
+    """One row of the roster snapshot query (see roster_snapshot._ROSTER_COLUMNS)."""
+
     def __init__(self, name, maternity=False, sick=False, sabbatical=False):
         self.name = name
+        self.user_id = None
+        self.staffing_role = None
+        self.team = None
+        self.employment_type = None
+        self.max_weekly_hours = None
+        self.bi_weekly_target_hours = None
+        self.is_chemo_certified = False
+        self.is_transplant_certified = False
+        self.is_renal_certified = False
+        self.is_charge_certified = False
         self.is_on_maternity_leave = maternity
         self.is_on_sick_leave = sick
         self.is_on_sabbatical = sabbatical
@@ -25,12 +39,24 @@ class FakeQuery:
     def all(self):
         return self._rows
 
+    def first(self):
+        return self._rows[0] if self._rows else None
+
 
 class FakeDB:
+    """Serves the snapshot's organization lookup and roster column query.
+
+    Snapshots are cached per org id, and every test uses "org-1", so the
+    cache is cleared for each new fake session.
+    """
+
     def __init__(self, rows):
         self._rows = rows
+        clear_roster_snapshots()
 
     def query(self, *args, **kwargs):
+        if args and args[0] is Organization:
+            return FakeQuery([])
         return FakeQuery(self._rows)
 
 
@@ -0,0 +1,96 @@
+import pytest
+
+from app.utils.audit_wal import AuditWAL, read_segment
+
+
+def _entry(i):
+    return {"entry_id": f"id-{i}", "action": "view", "resource_type": "handover"}
+
+
+def test_entries_are_shipped_in_batches_and_kept_for_verification(tmp_path):
+    batches = []
+    wal = AuditWAL(tmp_path, batch_size=2, fsync=False)
+    for i in range(5):
+        wal.append(_entry(i))
+
+    wal.seal()
+    assert wal.ship(batches.append) == 5
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert list(wal.segments()) == []
+    shipped = list((tmp_path / "shipped").iterdir())
+    assert [e["entry_id"] for e in read_segment(shipped[0])[0]] == [f"id-{i}" for i in range(5)]
+
+
+def test_failed_write_keeps_segment_for_retry(tmp_path):
+    wal = AuditWAL(tmp_path, fsync=False)
+    wal.append(_entry(1))
+    wal.seal()
+
+    def down(batch):
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        wal.ship(down)
+    retried = []
+    assert wal.ship(retried.extend) == 1
+    assert retried[0]["entry_id"] == "id-1"
+
+
+def test_live_segment_is_skipped_and_crashed_one_recovered(tmp_path):
+    live = AuditWAL(tmp_path, fsync=False)
+    live.append(_entry(1))
+    other = AuditWAL(tmp_path, fsync=False)
+    # Still open and locked by a running worker.
+    assert other.ship(lambda batch: None) == 0
+
+    # Simulate a crash mid-write: the lock is released, the last line is torn.
+    live._file.write('{"entry_id": "id-2", "act')
+    live._file.close()
+    live._file = None
+
+    recovered = []
+    assert other.ship(recovered.extend) == 1
+    assert [e["entry_id"] for e in recovered] == ["id-1"]
+
+
+def test_poison_entry_is_quarantined_without_blocking_other_segments(tmp_path):
+    wal = AuditWAL(tmp_path, batch_size=10, fsync=False)
+    for i in range(3):
+        wal.append(_entry(i))
+    wal.seal()
+    wal.append(_entry(3))
+    wal.seal()
+
+    written = []
+
+    def writer(batch):
+        if any(e["entry_id"] == "id-1" for e in batch):
+            raise ValueError("value too long for type character varying(45)")
+        written.extend(e["entry_id"] for e in batch)
+
+    assert wal.ship(writer) == 3
+    assert sorted(written) == ["id-0", "id-2", "id-3"]
+    assert list(wal.segments()) == []
+    failed = list((tmp_path / "failed").iterdir())
+    assert [e["entry_id"] for e in read_segment(failed[0])[0]] == ["id-1"]
+
+
+def test_outage_in_one_segment_still_ships_the_others(tmp_path):
+    wal = AuditWAL(tmp_path, fsync=False)
+    wal.append(_entry(1))
+    wal.seal()
+    wal.append(_entry(2))
+    wal.seal()
+
+    written = []
+
+    def flaky(batch):
+        if batch[0]["entry_id"] == "id-1":
+            raise ConnectionError("db down")
+        written.extend(batch)
+
+    with pytest.raises(ConnectionError):
+        wal.ship(flaky)
+    assert [e["entry_id"] for e in written] == ["id-2"]
+    assert len(list(wal.segments())) == 1
+    assert not (tmp_path / "failed").exists()
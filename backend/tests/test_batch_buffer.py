@@ -0,0 +1,57 @@
+import threading
+
+from app.core.batch_buffer import BatchBuffer
+
+
+def test_batches_by_size_and_flushes_on_stop():
+    batches = []
+    buffer = BatchBuffer("test", batches.append, max_items=100, batch_size=10, flush_interval=30)
+
+    for i in range(25):
+        assert buffer.put(i)
+    buffer.stop()
+
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert [i for b in batches for i in b] == list(range(25))
+    stats = buffer.stats()
+    assert stats["written"] == 25 and stats["batches"] == 3 and stats["queued"] == 0
+    # Closed buffers refuse new items.
+    assert not buffer.put(99)
+
+
+def test_full_buffer_drops_and_counts():
+    release = threading.Event()
+    buffer = BatchBuffer("test", lambda batch: release.wait(5), max_items=2, batch_size=1, flush_interval=0.01)
+    buffer.start()
+
+    accepted = [buffer.put(i) for i in range(20)]
+    release.set()
+    buffer.stop()
+
+    stats = buffer.stats()
+    assert accepted.count(False) == stats["dropped"] > 0
+    assert stats["enqueued"] == accepted.count(True) == stats["written"]
+
+
+def test_writer_errors_are_counted_not_raised():
+    def fail(batch):
+        raise RuntimeError("db down")
+
+    buffer = BatchBuffer("test", fail, batch_size=5, flush_interval=30)
+    for i in range(7):
+        buffer.put(i)
+    buffer.stop()
+
+    assert buffer.stats()["failed"] == 7
+
+
+def test_stop_wakes_an_idle_flusher():
+    written = threading.Event()
+    buffer = BatchBuffer("test", lambda batch: written.set(), batch_size=1, flush_interval=30)
+    buffer.put("only")
+    assert written.wait(5)
+
+    stopped = threading.Thread(target=buffer.stop, kwargs={"timeout": 30})
+    stopped.start()
+    stopped.join(2)
+    assert not stopped.is_alive()
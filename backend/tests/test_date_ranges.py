@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from app.utils.date_ranges import covering_range, restore_plan, subtract
+
+OLDER, NEWER = datetime(2026, 3, 1), datetime(2026, 3, 10)
+
+
+def test_covering_range_includes_dates_outside_the_period():
+    assert covering_range("2026-03-02", "2026-03-15", ["2026-03-16", "2026-03-05"]) == ("2026-03-02", "2026-03-16")
+    assert covering_range(None, None, []) is None
+
+
+def test_subtract_splits_across_months():
+    assert subtract(("2026-02-20", "2026-03-20"), ("2026-03-01", "2026-03-10")) == [
+        ("2026-02-20", "2026-02-28"),
+        ("2026-03-11", "2026-03-20"),
+    ]
+    assert subtract(("2026-03-01", "2026-03-14"), ("2026-03-01", "2026-03-28")) == []
+    assert subtract(("2026-03-01", "2026-03-14"), None) == [("2026-03-01", "2026-03-14")]
+
+
+def test_retracted_period_goes_to_newest_covering_roster():
+    # A roster for 03-01..03-28 was retracted; two older rosters overlap it.
+    plan = restore_plan(
+        [("2026-03-01", "2026-03-28")],
+        [
+            ("newer", NEWER, ("2026-03-15", "2026-04-11")),
+            ("older", OLDER, ("2026-02-15", "2026-03-21")),
+            ("legacy", OLDER, None),
+        ],
+    )
+    # Written in order, "newer" overwrites "older" on 03-15..03-21.
+    assert plan == [
+        ("older", ("2026-03-01", "2026-03-21")),
+        ("newer", ("2026-03-15", "2026-03-28")),
+    ]
+
+
+def test_narrower_republish_only_restores_released_dates():
+    gaps = subtract(("2026-03-01", "2026-03-28"), ("2026-03-08", "2026-03-21"))
+    plan = restore_plan(gaps, [("other", OLDER, ("2026-02-22", "2026-04-04"))])
+    assert plan == [
+        ("other", ("2026-03-01", "2026-03-07")),
+        ("other", ("2026-03-22", "2026-03-28")),
+    ]
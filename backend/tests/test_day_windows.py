@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+from app.utils.day_windows import tail_conditions, whole_days
+
+
+def _in_tail(lo, hi, start, end=None):
+    return any(tail_conditions(start, lo, hi, end))
+
+
+def test_window_splits_into_whole_days_and_tails():
+    lo, hi = whole_days(datetime(2026, 3, 1, 9, 30), datetime(2026, 3, 8, 17, 0))
+    assert (lo, hi) == (datetime(2026, 3, 2), datetime(2026, 3, 8))
+
+    assert _in_tail(lo, hi, datetime(2026, 3, 1, 12, 0))      # partial first day
+    assert not _in_tail(lo, hi, datetime(2026, 3, 2, 0, 0))   # rollup
+    assert not _in_tail(lo, hi, datetime(2026, 3, 7, 23, 59))
+    assert _in_tail(lo, hi, datetime(2026, 3, 8, 8, 0))       # partial last day
+
+
+def test_midnight_bounds_have_no_leading_tail():
+    start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    lo, hi = whole_days(start, None)
+    assert lo == start and hi is None
+    assert tail_conditions(datetime(2026, 3, 5, tzinfo=timezone.utc), lo, hi) == [False]
+    assert whole_days(None, None) == (None, None)
+    assert tail_conditions(object(), None, None) == []
+
+
+def test_periods_use_their_end_for_the_trailing_tail():
+    lo, hi = whole_days(datetime(2026, 3, 1), datetime(2026, 3, 8, 12, 0))
+    # Starts on a whole day but ends inside the partial last day.
+    assert _in_tail(lo, hi, datetime(2026, 3, 7, 19, 0), datetime(2026, 3, 8, 7, 0))
+    assert not _in_tail(lo, hi, datetime(2026, 3, 6, 19, 0), datetime(2026, 3, 7, 7, 0))
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+from app.core.event_hub import EventHub, format_sse, sse_stream
+
+
+def _notification(event_id, refs):
+    return {"id": event_id, "type": "notification", "users": refs, "data": {"title": "t"}}
+
+
+def test_events_are_routed_per_user_and_team():
+    async def scenario():
+        hub = EventHub()
+        alice = hub.subscribe("alice", "org1", "Renal")
+        bob = hub.subscribe("bob", "org1", "ENT")
+
+        # Published from another thread, as the LISTEN thread does.
+        thread = threading.Thread(target=lambda: (
+            hub.publish(_notification("e1", {"alice": "n-1", "carol": "n-2"})),
+            hub.publish({"id": "e2", "type": "announcement", "org": "org1", "team": "ENT", "data": {}}),
+            hub.publish({"id": "e3", "type": "announcement", "org": "org2", "team": None, "data": {}}),
+        ))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+
+        got_alice = await alice.queue.get()
+        got_bob = await bob.queue.get()
+        return got_alice, alice.queue.qsize(), got_bob, bob.queue.qsize()
+
+    got_alice, left_alice, got_bob, left_bob = asyncio.run(scenario())
+    # Alice sees only her own notification id, not the other recipients.
+    assert got_alice == {"id": "e1", "type": "notification", "data": {"title": "t", "id": "n-1"}}
+    assert got_bob["id"] == "e2"
+    assert left_alice == left_bob == 0
+
+
+def test_resume_replays_after_last_id_or_asks_for_resync():
+    async def scenario():
+        hub = EventHub(replay_size=3)
+        for i in range(5):
+            hub.publish(_notification(f"e{i}", {"alice": None}))
+        resumed = hub.subscribe("alice", last_event_id="e2")
+        evicted = hub.subscribe("alice", last_event_id="e0")
+        return (
+            [resumed.queue.get_nowait()["id"] for _ in range(resumed.queue.qsize())],
+            evicted.queue.get_nowait()["type"],
+        )
+
+    resumed, evicted = asyncio.run(scenario())
+    assert resumed == ["e3", "e4"]
+    assert evicted == "resync"
+
+
+def test_stream_sends_heartbeats_and_stops_on_close():
+    async def scenario():
+        hub = EventHub()
+        subscription = hub.subscribe("alice")
+
+        async def connected():
+            return False
+
+        frames = []
+        stream = sse_stream(hub, subscription, connected, heartbeat=0.01)
+        async for frame in stream:
+            frames.append(frame)
+            if frame.startswith(": keepalive"):
+                hub.publish(_notification("e1", {"alice": "n-1"}))
+            elif frame.startswith("id:"):
+                hub.close()
+        return frames, hub.stats()["subscribers"]
+
+    frames, subscribers = asyncio.run(scenario())
+    assert frames[0].startswith("retry:")
+    assert frames[1] == ": keepalive\n\n"
+    assert frames[2] == format_sse({"id": "e1", "type": "notification", "data": {"title": "t", "id": "n-1"}})
+    assert subscribers == 0
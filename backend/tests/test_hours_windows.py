@@ -0,0 +1,35 @@
+import math
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.utils.hours_windows import HoursWindows, reconcile_windows
+
+FIRST = date(2026, 3, 1)
+
+
+def test_sliding_window_matches_direct_sum():
+    rng = np.random.default_rng(7)
+    hours = rng.choice([0.0, 7.5, 11.25], size=(3, 60))
+    vacation = rng.random((3, 60)) < 0.2
+    windows = HoursWindows.from_daily(["a", "b", "c"], FIRST, hours, vacation)
+
+    for offset in range(27, 60):
+        end = FIRST + timedelta(days=offset)
+        window_hours, window_vacation = windows.window(end)
+        start = offset - 27
+        assert np.allclose(window_hours, hours[:, start:offset + 1].sum(axis=1))
+        assert (window_vacation == vacation[:, start:offset + 1].sum(axis=1)).all()
+
+
+def test_reconcile_windows_targets_and_balancing_shifts():
+    results = reconcile_windows(
+        hours_worked=np.array([150.0, 148.0, 143.0, 100.0, 70.0]),
+        vacation_days=np.array([0, 0, 0, 0, 7]),
+        bi_weekly_targets=np.array([75.0, 75.0, 75.0, 75.0, 75.0]),
+    )
+    assert list(results["adjusted_target"]) == [150.0, 150.0, 150.0, 150.0, 75.0]
+    balancing = results["balancing_shift_hours"]
+    assert math.isnan(balancing[0])
+    assert list(balancing[1:4]) == [4.0, 8.0, 12.0]
+    assert results["delta"][4] == -5.0
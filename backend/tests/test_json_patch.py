@@ -0,0 +1,82 @@
+"""Round-trip tests for the schedule JSON-Patch helpers."""
+import pytest
+
+from app.utils.json_patch import JsonPatchError, apply_patch, diff_payloads
+
+
+def _roster(cells):
+    return {
+        "schedule_data": {
+            "dates": ["2026-01-05", "2026-01-06"],
+            "grid": [
+                {"nurse": name, "shifts": [{"date": d, "shift": s} for d, s in row]}
+                for name, row in cells.items()
+            ],
+        },
+        "revision_of": "abc",
+    }
+
+
+def test_single_cell_change_is_single_replace():
+    old = _roster({"Alice": [("2026-01-05", "Z07"), ("2026-01-06", "OFF")]})
+    new = _roster({"Alice": [("2026-01-05", "Z07"), ("2026-01-06", "Z19")]})
+
+    ops = diff_payloads(old, new)
+
+    assert ops == [{
+        "op": "replace",
+        "path": "/schedule_data/grid/0/shifts/1/shift",
+        "value": "Z19",
+    }]
+    assert apply_patch(old, ops) == new
+
+
+def test_round_trip_with_added_and_removed_rows_and_keys():
+    old = _roster({
+        "Alice": [("2026-01-05", "Z07")],
+        "Bob": [("2026-01-05", "Z23")],
+        "Chloé": [("2026-01-05", "OFF")],
+    })
+    new = _roster({"Alice": [("2026-01-05", "07"), ("2026-01-06", "OFF")]})
+    new["schedule_data"]["a/b~c"] = 1
+    del new["revision_of"]
+
+    ops = diff_payloads(old, new)
+
+    assert apply_patch(old, ops) == new
+    # The base document is never mutated.
+    assert old["schedule_data"]["grid"][0]["shifts"][0]["shift"] == "Z07"
+
+
+def test_type_change_and_identical_payloads():
+    assert diff_payloads({"a": 1}, {"a": 1}) == []
+    assert diff_payloads({"a": 1}, {"a": "1"}) == [{"op": "replace", "path": "/a", "value": "1"}]
+
+
+def test_invalid_operations_raise():
+    with pytest.raises(JsonPatchError):
+        apply_patch({"a": []}, [{"op": "replace", "path": "/a/3", "value": 1}])
+    with pytest.raises(JsonPatchError):
+        apply_patch({"a": 1}, [{"op": "remove", "path": "/missing"}])
+    with pytest.raises(JsonPatchError):
+        apply_patch({}, [{"op": "explode", "path": "/a"}])
+
+
+def test_move_copy_and_test_operations():
+    doc = {"grid": [{"nurse": "Alice"}, {"nurse": "Bob"}], "meta": {"v": 1}}
+
+    patched = apply_patch(doc, [
+        {"op": "test", "path": "/meta/v", "value": 1},
+        {"op": "copy", "from": "/grid/0", "path": "/grid/-"},
+        {"op": "move", "from": "/meta/v", "path": "/version"},
+    ])
+
+    assert patched == {
+        "grid": [{"nurse": "Alice"}, {"nurse": "Bob"}, {"nurse": "Alice"}],
+        "meta": {},
+        "version": 1,
+    }
+    with pytest.raises(JsonPatchError):
+        apply_patch(doc, [{"op": "test", "path": "/meta/v", "value": 2}])
+    with pytest.raises(JsonPatchError):
+        apply_patch(doc, [{"op": "move", "from": "/grid", "path": "/grid/0/x"}])
@@ -21,9 +21,9 @@ def _mock_module(name: str, **attrs):
 # -- Third-party stubs -----------------------------------------------------
 
 _EXTERNAL = [
-    "fastapi", "fastapi.responses",
+    "fastapi", "fastapi.encoders", "fastapi.responses",
     "pydantic",
-    "sqlalchemy", "sqlalchemy.orm",
+    "sqlalchemy", "sqlalchemy.orm", "sqlalchemy.exc",
     "tenacity",
     "openai",
     "ortools", "ortools.sat", "ortools.sat.python", "ortools.sat.python.cp_model",
@@ -47,6 +47,7 @@ sys.modules["fastapi"].UploadFile = MagicMock
 sys.modules["fastapi"].File = lambda *a, **k: None
 sys.modules["fastapi"].Form = lambda *a, **k: None
 sys.modules["fastapi"].BackgroundTasks = MagicMock
+sys.modules["fastapi"].Response = MagicMock
 
 
 class _HTTPException(Exception):
@@ -57,6 +58,7 @@ class _HTTPException(Exception):
 
 sys.modules["fastapi"].HTTPException = _HTTPException
 sys.modules["fastapi.responses"].JSONResponse = MagicMock
+sys.modules["fastapi.encoders"].jsonable_encoder = lambda obj: obj
 
 # Pydantic
 _pydantic = sys.modules["pydantic"]
@@ -79,10 +81,13 @@ _pydantic.BaseModel = _FakeBaseModel
 _pydantic.Field = lambda *a, **k: None
 _pydantic.validator = lambda *a, **k: (lambda f: f)
 _pydantic.model_validator = lambda *a, **k: (lambda f: f)
+_pydantic.ValidationError = type("ValidationError", (ValueError,), {})
 
 # SQLAlchemy
 _sa = sys.modules["sqlalchemy"]
 _sa.or_ = lambda *a, **k: None
+_sa.tuple_ = lambda *a, **k: None
+_sa.text = lambda *a, **k: None
 _sa.Column = MagicMock
 _sa.String = MagicMock
 _sa.Integer = MagicMock
@@ -95,10 +100,12 @@ _sa.Enum = MagicMock
 _sa.JSON = MagicMock
 _sa.func = MagicMock()
 _sa.create_engine = MagicMock
+sys.modules["sqlalchemy.exc"].SQLAlchemyError = type("SQLAlchemyError", (Exception,), {})
 _sa_orm = sys.modules["sqlalchemy.orm"]
 _sa_orm.Session = MagicMock
 _sa_orm.relationship = lambda *a, **k: None
 _sa_orm.joinedload = lambda *a, **k: None
+_sa_orm.defer = lambda *a, **k: None
 _sa_orm.sessionmaker = MagicMock
 _sa_orm.declarative_base = lambda: type("Base", (), {"metadata": MagicMock()})
 
@@ -160,6 +167,11 @@ _mock_module("app.core.config", settings=MagicMock())
 _mock_module("app.core.auth",
              get_optional_auth=MagicMock(), AuthContext=MagicMock,
              get_current_user=MagicMock(), verify_token=MagicMock())
+_mock_module("app.core.http_cache",
+             CACHE_FINALIZED_SCHEDULE="", CACHE_REVALIDATE="",
+             ImmutableBodyCache=MagicMock, json_body_response=MagicMock(),
+             not_modified=MagicMock(), render_json=MagicMock(),
+             request_is_fresh=MagicMock())
 
 # Models
 _mock_module("app.models.optimized_schedule", OptimizedSchedule=MagicMock())
@@ -177,17 +189,21 @@ _mock_module("app.models.user", User=MagicMock())
 # Schemas
 _mock_module("app.schemas.optimized_schedule",
              OptimizeRequest=MagicMock(), OptimizeResponse=MagicMock(),
-             RefineRequest=MagicMock(), InsightsRequest=MagicMock())
+             RefineRequest=MagicMock(), InsightsRequest=MagicMock(),
+             DraftPatchRequest=MagicMock())
 _mock_module("app.schemas.system_prompt",
              SystemPrompt=MagicMock(), SystemPromptUpdate=MagicMock())
 
 # Routes (imported by optimized_schedule)
 _mock_module("app.api.routes.system_prompts",
-             get_system_prompt=MagicMock(), DEFAULT_PROMPT_CONTENT="",
+             get_system_prompt=MagicMock(), get_rendered_system_prompt=MagicMock(),
+             DEFAULT_PROMPT_CONTENT="",
              build_default_prompt_content=MagicMock(), router=MagicMock())
 
 # Services
 _mock_module("app.services.deletion_activity", record_deletion_activity=MagicMock())
+_mock_module("app.services.shift_assignments",
+             publish_shift_assignments=MagicMock(), retract_shift_assignments=MagicMock())
 _mock_module("app.services.self_scheduling",
              SelfSchedulingEngine=MagicMock(), NurseSubmission=MagicMock(),
              ShiftPreference=MagicMock(), RotationPreference=MagicMock(),
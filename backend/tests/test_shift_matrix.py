@@ -0,0 +1,43 @@
+import math
+from datetime import date, timedelta
+
+from app.utils.shift_matrix import build_shift_matrix, workload_metrics
+
+END = date(2026, 3, 14)  # a Saturday
+
+
+def _day(offset):
+    return (END - timedelta(days=offset)).isoformat()
+
+
+DAY = {"hours": 11.25, "shiftType": "day", "startTime": "07:00", "endTime": "19:25"}
+NIGHT = {"hours": 11.25, "shiftType": "night", "startTime": "19:00", "endTime": "07:25"}
+
+
+def test_workload_metrics_per_nurse():
+    shifts = {
+        # Five days in a row ending today, last one a night after a day shift.
+        "busy": {
+            _day(4): DAY,
+            _day(3): DAY,
+            _day(2): DAY,
+            _day(1): DAY,
+            _day(0): NIGHT,
+        },
+        "idle": {_day(20): DAY, _day(3): {"hours": 0, "shiftType": "off"}},
+    }
+    matrix = build_shift_matrix(shifts, end=END, days=30)
+    metrics = workload_metrics(matrix)
+
+    busy, idle = 0, 1
+    assert metrics["hours_last_7d"][busy] == 5 * 11.25
+    assert metrics["hours_last_30d"][idle] == 11.25
+    assert metrics["hours_last_14d"][idle] == 0
+    assert metrics["consecutive_days_worked"][busy] == 5
+    assert metrics["days_since_last_day_off"][busy] == 5
+    assert metrics["night_shifts_last_14d"][busy] == 1
+    assert metrics["weekend_shifts_last_14d"][busy] == 1
+    # Back-to-back 07:00-19:25 day shifts leave 11h35 of rest.
+    assert round(metrics["min_rest_hours_last_7d"][busy], 2) == round(11 + 35 / 60, 2)
+    assert metrics["schedule_variance_coefficient"][busy] > 0
+    assert math.isnan(metrics["min_rest_hours_last_7d"][idle])
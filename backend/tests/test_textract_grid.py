@@ -0,0 +1,67 @@
+from datetime import date
+
+from app.utils.textract_grid import merge_page_grids, parse_table_blocks
+
+
+def _stub_response(rows):
+    """Minimal analyze_document(FeatureTypes=["TABLES"]) response for a grid of strings."""
+    blocks = []
+    for r, row in enumerate(rows, start=1):
+        for c, text in enumerate(row, start=1):
+            cell = {"Id": f"c{r}-{c}", "BlockType": "CELL", "RowIndex": r, "ColumnIndex": c}
+            words = text.split()
+            if words:
+                ids = [f"w{r}-{c}-{i}" for i in range(len(words))]
+                cell["Relationships"] = [{"Type": "CHILD", "Ids": ids}]
+                blocks.extend(
+                    {"Id": i, "BlockType": "WORD", "Text": w} for i, w in zip(ids, words)
+                )
+            blocks.append(cell)
+    # Textract lists words and cells interleaved with lines; order must not matter.
+    return {"Blocks": blocks[::-1]}
+
+
+START, END = date(2026, 3, 2), date(2026, 3, 15)
+
+
+def test_parses_headers_and_cleans_names():
+    response = _stub_response([
+        ["", "Mon", "Tue"],
+        ["", "02", "03"],
+        ["Alexandra Zatylny 42564 7Y-339.27D", "Z07", ""],
+        ["Khady Gueye", "", "Z19"],
+    ])
+    page = parse_table_blocks(response["Blocks"], START, END)
+    assert page["dates"] == ["2026-03-02", "2026-03-03"]
+    assert page["grid"] == [
+        {"nurse": "Alexandra Zatylny", "shifts": ["Z07", ""]},
+        {"nurse": "Khady Gueye", "shifts": ["", "Z19"]},
+    ]
+
+
+def test_no_table_is_reported():
+    assert "error" in parse_table_blocks([{"Id": "l1", "BlockType": "LINE"}], START, END)
+
+
+def test_pages_merge_by_date_and_nurse():
+    week1 = parse_table_blocks(_stub_response([
+        ["", "Mon", "Tue"],
+        ["", "02", "03"],
+        ["Ann Lee", "Z07", "Z07"],
+    ])["Blocks"], START, END)
+    week2 = parse_table_blocks(_stub_response([
+        ["", "Mon"],
+        ["", "09"],
+        ["Bo Chen", "Z19"],
+        ["Ann Lee", "Z23"],
+    ])["Blocks"], START, END)
+    failed = {"dates": [], "grid": [], "error": "throttled"}
+
+    merged = merge_page_grids([week1, week2, failed])
+    assert merged["dates"] == ["2026-03-02", "2026-03-03", "2026-03-09"]
+    assert merged["grid"] == [
+        {"nurse": "Ann Lee", "shifts": ["Z07", "Z07", "Z23"]},
+        {"nurse": "Bo Chen", "shifts": ["", "", "Z19"]},
+    ]
+    assert merged["errors"] == [{"page": 2, "error": "throttled"}]
+    assert "error" not in merged
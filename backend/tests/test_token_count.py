@@ -0,0 +1,17 @@
+from app.utils import token_count
+from app.utils.token_count import count_tokens
+
+
+def test_empty_text_has_no_tokens():
+    assert count_tokens("") == 0
+
+
+def test_estimate_without_tiktoken_overcounts(monkeypatch):
+    monkeypatch.setattr(token_count, "tiktoken", None)
+    token_count._encoding.cache_clear()
+    try:
+        text = "Alice works Z07 on 2026-03-01"
+        # Ceil of len / 3: deliberately pessimistic for budget checks.
+        assert count_tokens(text) == -(-len(text) // 3)
+    finally:
+        token_count._encoding.cache_clear()
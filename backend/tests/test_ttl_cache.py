@@ -0,0 +1,35 @@
+import time
+
+from app.core.ttl_cache import TTLCache
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(maxsize=4, ttl=0.05)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_and_non_positive_ttl_is_not_stored():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.put("short", 1, ttl=0.01)
+    cache.put("expired", 2, ttl=-5)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert cache.get("expired") is None
+
+
+def test_lru_eviction_and_predicate_invalidation():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.put(("u1", "org1"), "a")
+    cache.put(("u2", "org1"), "b")
+    cache.get(("u1", "org1"))
+    cache.put(("u3", "org2"), "c")
+    assert cache.get(("u2", "org1")) is None
+    assert cache.get(("u1", "org1")) == "a"
+
+    assert cache.evict_where(lambda key: key[1] == "org1") == 1
+    assert cache.get(("u1", "org1")) is None
+    assert cache.get(("u3", "org2")) == "c"
@@ -0,0 +1,131 @@
+"""Verify that audit WAL entries reached the audit_log table.
+
+Usage:
+  cd backend
+  ../.venv/bin/python verify_audit_wal.py
+  ../.venv/bin/python verify_audit_wal.py --repair
+  ../.venv/bin/python verify_audit_wal.py --dir /var/lib/chronofy/audit-wal
+
+Behavior:
+- Reads every shipped segment still retained (AUDIT_WAL_RETAIN_DAYS) and
+  checks each entry_id exists in audit_log.
+- Reports entries still pending in unshipped segments (normal right after
+  a crash; the next worker start ships them), unreadable lines (torn writes
+  at a crash) and entry_ids seen in more than one segment (re-shipped).
+- Lists entries audit_log rejected for good (quarantined in failed/); they
+  need a manual fix and are not counted as missing.
+- --repair re-inserts missing entries (idempotent on entry_id).
+- Exits 1 if entries are quarantined, or missing and not repaired.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+from app.db.database import SessionLocal
+from app.models.audit_log import AuditLog
+from app.utils.audit import AUDIT_WAL_DIR, insert_audit_rows
+from app.utils.audit_wal import FAILED_DIR, SEALED_SUFFIX, SHIPPED_DIR, AuditWAL, read_segment
+
+CHUNK = 1000
+
+
+def _load(paths: List[Path]) -> tuple[Dict[str, dict], Counter, int]:
+    entries: Dict[str, dict] = {}
+    seen: Counter = Counter()
+    bad_lines = 0
+    for path in paths:
+        segment, bad = read_segment(path)
+        bad_lines += bad
+        for entry in segment:
+            seen[entry["entry_id"]] += 1
+            entries[entry["entry_id"]] = entry
+    return entries, seen, bad_lines
+
+
+def run(directory: str, repair: bool) -> int:
+    root = Path(directory)
+    shipped_paths = sorted((root / SHIPPED_DIR).glob(f"audit-*{SEALED_SUFFIX}"))
+    pending_paths = list(AuditWAL(root).segments())
+    failed_paths = sorted((root / FAILED_DIR).glob(f"audit-*{SEALED_SUFFIX}"))
+
+    shipped, seen, bad_shipped = _load(shipped_paths)
+    pending, _, bad_pending = _load(pending_paths)
+    failed, _, _ = _load(failed_paths)
+    duplicates = sum(1 for count in seen.values() if count > 1)
+
+    print(f"WAL directory: {root}")
+    print(f"Shipped segments: {len(shipped_paths)} ({len(shipped)} entries)")
+    print(f"Pending segments: {len(pending_paths)} ({len(pending)} entries)")
+    if bad_shipped or bad_pending:
+        print(f"Unreadable lines: {bad_shipped + bad_pending} (torn writes are expected after a crash)")
+    if duplicates:
+        print(f"Entries shipped more than once: {duplicates} (deduplicated by entry_id)")
+    if failed:
+        print(f"QUARANTINED: {len(failed)} entries were rejected by audit_log (see {root / FAILED_DIR}).")
+        for entry in list(failed.values())[:20]:
+            print(f"- {entry['entry_id']} {entry.get('created_at')} {entry.get('action')} "
+                  f"{entry.get('resource_type')}/{entry.get('resource_id')}")
+
+    db = SessionLocal()
+    try:
+        ids = [entry_id for entry_id in shipped if entry_id not in failed]
+        found = set()
+        for start in range(0, len(ids), CHUNK):
+            chunk = ids[start:start + CHUNK]
+            found.update(
+                entry_id for (entry_id,) in
+                db.query(AuditLog.entry_id).filter(AuditLog.entry_id.in_(chunk))
+            )
+        missing = [shipped[entry_id] for entry_id in ids if entry_id not in found]
+    except Exception as exc:
+        print(f"Failed: {exc}")
+        return 1
+    finally:
+        db.close()
+
+    if not missing:
+        print(f"OK: all {len(ids)} shipped entries are in audit_log.")
+        return 1 if failed else 0
+
+    print(f"MISSING: {len(missing)} shipped entries are not in audit_log.")
+    for entry in missing[:20]:
+        print(f"- {entry['entry_id']} {entry.get('created_at')} {entry.get('action')} "
+              f"{entry.get('resource_type')}/{entry.get('resource_id')}")
+    if not repair:
+        print("Re-run with --repair to re-insert them.")
+        return 1
+
+    try:
+        for start in range(0, len(missing), CHUNK):
+            insert_audit_rows(missing[start:start + CHUNK])
+    except Exception as exc:
+        print(f"Failed: {exc}")
+        return 1
+    print(f"Repaired {len(missing)} entries.")
+    return 1 if failed else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check that audit WAL entries were written to audit_log",
+    )
+    parser.add_argument(
+        "--dir",
+        default=AUDIT_WAL_DIR,
+        help="Audit WAL directory (default: AUDIT_WAL_DIR)",
+    )
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="Re-insert shipped entries missing from audit_log",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    raise SystemExit(run(directory=args.dir, repair=args.repair))
@@ -13,6 +13,7 @@ import {
   fetchDeletionActivitiesAPI,
   fetchNotificationsAPI,
   markNotificationReadAPI,
+  subscribeToEventsAPI,
   listNursesAPI,
   type Handover,
   type OptimizedSchedule,
@@ -504,17 +505,6 @@ export default function Dashboard() {
           setPendingJoinApprovals(0);
         }
 
-        try {
-          setNotifications(
-            await fetchNotificationsAPI(authHeaders, true, {
-              timeoutMs: 8000,
-              retryCount: 0,
-            }),
-          );
-        } catch (notificationErr) {
-          console.warn("Failed to load notifications:", notificationErr);
-        }
-
         // Include ALL handovers: both linked (patient_id) and embedded (p_first_name)
         const allHandoversDay = handoversByShift.day || [];
         const allHandoversNight = handoversByShift.night || [];
@@ -934,6 +924,41 @@ export default function Dashboard() {
     canManage,
   ]);
 
+  // Notifications are loaded once, then kept current by the event stream;
+  // the 30-second dashboard refresh does not refetch them. A "resync" event
+  // (events were missed) reloads the list.
+  useEffect(() => {
+    if (!user?.id || orgLoading) return;
+    const controller = new AbortController();
+    const loadNotifications = async () => {
+      try {
+        const loaded = await fetchNotificationsAPI(await getAuthHeaders(), true, {
+          timeoutMs: 8000,
+          retryCount: 0,
+        });
+        if (!controller.signal.aborted) setNotifications(loaded);
+      } catch (err) {
+        console.warn("Failed to load notifications:", err);
+      }
+    };
+    loadNotifications();
+    subscribeToEventsAPI(
+      getAuthHeaders,
+      async (event) => {
+        if (event.type === "notification" && event.data.id) {
+          const incoming = event.data as unknown as AppNotification;
+          setNotifications((prev) =>
+            prev.some((n) => n.id === incoming.id) ? prev : [incoming, ...prev],
+          );
+        } else if (event.type === "resync") {
+          await loadNotifications();
+        }
+      },
+      controller.signal,
+    );
+    return () => controller.abort();
+  }, [user?.id, orgLoading, currentOrganization?.id, getAuthHeaders]);
+
   const currentTime = new Date();
   const isDayShiftActive =
     currentTime.getHours() >= 7 && currentTime.getHours() < 19;
@@ -50,6 +50,14 @@ async function apiRequest<T>(
   path: string,
   options: ApiRequestOptions = {},
 ): Promise<T> {
+  return (await apiRequestWithHeaders<T>(path, options)).body;
+}
+
+// Like apiRequest, but also returns the response headers (e.g. X-Next-Cursor).
+async function apiRequestWithHeaders<T>(
+  path: string,
+  options: ApiRequestOptions = {},
+): Promise<{ body: T; headers: Headers }> {
   const {
     timeoutMs = DEFAULT_API_TIMEOUT_MS,
     retryCount,
@@ -88,7 +96,7 @@ async function apiRequest<T>(
         throw new Error(getErrorMessage(body, statusMessage));
       }
 
-      return body as T;
+      return { body: body as T, headers: response.headers };
     } catch (error) {
       clearTimeout(timeoutId);
       lastError = error;
@@ -2752,8 +2760,22 @@ export async function fetchAnnouncementsAPI(
   headers?: Record<string, string>,
   includeExpired = false,
 ): Promise<Announcement[]> {
-  const query = includeExpired ? "?include_expired=true" : "";
-  return apiRequest(`/announcements/${query}`, { headers });
+  // The endpoint is paged; follow X-Next-Cursor until the last page.
+  const announcements: Announcement[] = [];
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({ limit: "200" });
+    if (includeExpired) params.set("include_expired", "true");
+    if (cursor) params.set("cursor", cursor);
+    const page: { body: Announcement[]; headers: Headers } =
+      await apiRequestWithHeaders<Announcement[]>(
+        `/announcements/?${params.toString()}`,
+        { headers },
+      );
+    announcements.push(...page.body);
+    cursor = page.headers.get("X-Next-Cursor");
+  } while (cursor);
+  return announcements;
 }
 
 export async function createAnnouncementAPI(
@@ -2838,6 +2860,75 @@ export async function markNotificationReadAPI(
   });
 }
 
+export interface StreamEvent {
+  id?: string;
+  type: "notification" | "announcement" | "resync" | string;
+  data: Record<string, unknown>;
+}
+
+/**
+ * Subscribe to pushed notification/announcement events (Server-Sent Events).
+ *
+ * Uses fetch instead of EventSource so the Clerk bearer token can be sent;
+ * headers are re-read on every reconnect because tokens are short-lived.
+ * Reconnects with Last-Event-ID until `signal` is aborted. A "resync" event
+ * means events were missed and the caller should refetch.
+ */
+export async function subscribeToEventsAPI(
+  getHeaders: () => Promise<Record<string, string>>,
+  onEvent: (event: StreamEvent) => void,
+  signal: AbortSignal,
+): Promise<void> {
+  let lastEventId: string | undefined;
+  let retryMs = 5000;
+
+  while (!signal.aborted) {
+    try {
+      const headers: Record<string, string> = { ...(await getHeaders()) };
+      if (lastEventId) headers["Last-Event-ID"] = lastEventId;
+      const response = await fetch(`${API_BASE}/notifications/stream`, {
+        headers,
+        signal,
+      });
+      if (!response.ok || !response.body) {
+        throw new Error(`Event stream failed: ${response.status}`);
+      }
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let boundary = buffer.indexOf("\n\n");
+        while (boundary !== -1) {
+          const frame = buffer.slice(0, boundary);
+          buffer = buffer.slice(boundary + 2);
+          boundary = buffer.indexOf("\n\n");
+
+          let id: string | undefined;
+          let type = "message";
+          let data = "";
+          for (const line of frame.split("\n")) {
+            if (line.startsWith("id: ")) id = line.slice(4);
+            else if (line.startsWith("event: ")) type = line.slice(7);
+            else if (line.startsWith("data: ")) data += line.slice(6);
+            else if (line.startsWith("retry: ")) retryMs = Number(line.slice(7)) || retryMs;
+          }
+          if (!data) continue; // keepalive comment or retry hint
+          if (id) lastEventId = id;
+          onEvent({ id, type, data: JSON.parse(data) });
+        }
+      }
+    } catch (error) {
+      if (signal.aborted) return;
+      console.warn("Event stream disconnected:", error);
+    }
+    await sleep(retryMs);
+  }
+}
+
 // ============================================
 // SCHEDULE VERSIONS
 // ============================================